@@ -0,0 +1,13 @@
+"""Import first in every benchmark: puts the host stubs, ``lib`` and the
+repository root on ``sys.path``, as ``tests/conftest.py`` does for pytest."""
+
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+TESTS = os.path.join(ROOT, "tests")
+
+for path in (ROOT, os.path.join(ROOT, "lib"), TESTS, os.path.join(TESTS, "stubs")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
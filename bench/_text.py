@@ -0,0 +1,24 @@
+"""Sample text shared by the typing benchmarks."""
+
+import random
+
+PRINTABLE = "".join(chr(c) for c in range(32, 127)) + "\n"
+
+
+def sample_text(length=2050, seed=8):
+    """Mostly lower-case words with some capitals, digits and punctuation."""
+    rng = random.Random(seed)
+    words = []
+    size = 0
+    while size < length:
+        word = "".join(rng.choice("etaoinshrdlu") for _ in range(rng.randrange(1, 9)))
+        roll = rng.random()
+        if roll < 0.1:
+            word = word.capitalize()
+        elif roll < 0.2:
+            word += rng.choice(",.;:!?")
+        elif roll < 0.25:
+            word = str(rng.randrange(1000))
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)[:length]
@@ -0,0 +1,62 @@
+"""Glyphs per second decoded by the `BDF` loader against the bit-by-bit
+decoder it replaced.
+
+Each round opens the font, lets the current loader build its index, and
+then loads every glyph in one batch. gc.collect is stubbed out so only
+parsing and decoding are timed. The current loader is timed with its row
+loop and with a host stand-in for ``bitmaptools.readinto``, which is
+Python here and so slower than the board's. All glyphs are checked against the baseline first.
+
+    python3 bench/bdf_decode.py
+"""
+
+import _host  # noqa: F401
+
+import gc
+import os
+import time
+
+from adafruit_bitmap_font import bdf
+from baseline.bdf import BDF as BaselineBDF
+from displayio import Bitmap
+from fakes import bitmap_readinto, glyphs_of
+
+FONT = os.path.join(_host.ROOT, "fonts", "terminal.bdf")
+ROUNDS = 5
+
+
+def glyphs_per_s(font_class, code_points):
+    best = None
+    for _ in range(ROUNDS):
+        with open(FONT, "rb") as f:
+            font = font_class(f, Bitmap)
+            # A code point the font lacks, so the index is built untimed.
+            font.load_glyphs(0x10FFFF)
+            start = time.perf_counter_ns()
+            font.load_glyphs(code_points)
+            elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(code_points) / (best / 1e9)
+
+
+def main():
+    with open(FONT, "rb") as f:
+        code_points = [int(line.split()[1]) for line in f if line.startswith(b"ENCODING")]
+    with open(FONT, "rb") as f:
+        expected = glyphs_of(BaselineBDF(f, Bitmap), code_points)
+    for readinto in (None, bitmap_readinto):
+        bdf._bitmap_readinto = readinto
+        with open(FONT, "rb") as f:
+            assert glyphs_of(bdf.BDF(f, Bitmap), code_points) == expected
+    print("%d glyphs identical" % len(code_points))
+
+    gc.collect = lambda: None
+    bdf._bitmap_readinto = None
+    print("%-14s %8.0f glyphs/s" % ("bit by bit", glyphs_per_s(BaselineBDF, code_points)))
+    for name, readinto in (("bulk row loop", None), ("bulk readinto", bitmap_readinto)):
+        bdf._bitmap_readinto = readinto
+        print("%-14s %8.0f glyphs/s" % (name, glyphs_per_s(bdf.BDF, code_points)))
+
+
+if __name__ == "__main__":
+    main()
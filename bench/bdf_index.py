@@ -0,0 +1,77 @@
+"""Time to the first labels and per-miss load cost of the indexed `BDF`
+loader against the full-scan loader it replaced.
+
+The first labels are opened fresh each round: the full-scan loader, the
+indexed loader building its index, and the indexed loader reading a saved
+index from a temporary directory. The per-miss cost loads one uncached
+glyph at a time from an opened font. All glyphs are checked against the
+full-scan loader first.
+
+    python3 bench/bdf_index.py
+"""
+
+import _host  # noqa: F401
+
+import os
+import tempfile
+import time
+
+from adafruit_bitmap_font.bdf import BDF
+from baseline.bdf import BDF as BaselineBDF
+from displayio import Bitmap
+from fakes import glyphs_of
+
+FONT = os.path.join(_host.ROOT, "fonts", "terminal.bdf")
+LABELS = ("MACRO KEYBOARD", "READY")
+MISSES = "0123456789abcdefghijklmnopqrstuvwxyz"
+ROUNDS = 5
+
+
+def first_labels_ms(open_font):
+    best = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter_ns()
+        with open(FONT, "rb") as f:
+            font = open_font(f)
+            for label in LABELS:
+                font.load_glyphs(label)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / 1e6
+
+
+def per_miss_ms(open_font):
+    with open(FONT, "rb") as f:
+        font = open_font(f)
+        font.load_glyphs(" ")
+        start = time.perf_counter_ns()
+        for char in MISSES:
+            font.load_glyphs(char)
+        return (time.perf_counter_ns() - start) / len(MISSES) / 1e6
+
+
+def main():
+    with open(FONT, "rb") as f:
+        code_points = [int(line.split()[1]) for line in f if line.startswith(b"ENCODING")]
+    with open(FONT, "rb") as old, open(FONT, "rb") as new:
+        assert glyphs_of(BDF(new, Bitmap), code_points) == glyphs_of(BaselineBDF(old, Bitmap), code_points)
+    print("%d glyphs identical" % len(code_points))
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = os.path.join(directory, "terminal.idx")
+        with open(FONT, "rb") as f:
+            BDF(f, Bitmap, index_path=index).load_glyphs(" ")
+        loaders = (
+            ("full scan", lambda f: BaselineBDF(f, Bitmap)),
+            ("index built", lambda f: BDF(f, Bitmap)),
+            ("index saved", lambda f: BDF(f, Bitmap, index_path=index)),
+        )
+        for name, open_font in loaders:
+            print(
+                "%-12s first labels %8.2f ms  per miss %6.3f ms"
+                % (name, first_labels_ms(open_font), per_miss_ms(open_font))
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Press and release time of `MultiConsumerControl` as the slot count grows.
+
+Slots are found through a dict and a free-slot stack, so the time should not
+depend on how many slots the report has or how many are in use. The
+single-code `ConsumerControl` is timed for reference.
+
+    python3 bench/consumer_slots.py
+"""
+
+import _host  # noqa: F401
+
+import time
+
+from adafruit_hid.consumer_control import ConsumerControl
+from adafruit_hid.consumer_control_multi import MultiConsumerControl
+from fakes import consumer_device
+
+ROUNDS = 20000
+
+
+def per_edge_us(cc, device):
+    press = cc.press
+    release = cc.release
+    start = time.perf_counter_ns()
+    for _ in range(ROUNDS):
+        press(0xCD)
+        release(0xCD)
+        device.reports.clear()
+    return (time.perf_counter_ns() - start) / (2 * ROUNDS) / 1e3
+
+
+def main():
+    device = consumer_device()
+    print("%-26s %6.2f us" % ("ConsumerControl", per_edge_us(ConsumerControl(device), device)))
+    for slots in (2, 4, 16, 64):
+        device = consumer_device()
+        cc = MultiConsumerControl(device, slots=slots)
+        # All but one slot held, so the tapped code takes the last free one.
+        for code in range(1, slots):
+            cc.press(code)
+        label = "MultiConsumerControl(%d)" % slots
+        print("%-26s %6.2f us" % (label, per_edge_us(cc, device)))
+
+
+if __name__ == "__main__":
+    main()
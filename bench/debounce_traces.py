@@ -0,0 +1,72 @@
+"""Replay synthetic bounce traces through each `debounce` strategy.
+
+Each trace is a seeded run of presses and releases sampled every 1 ms, the
+scan rate. Every transition bounces for up to ``BOUNCE_MS``; the second set
+of traces also has one-sample glitches on held levels. `debounce.score`
+compares the replayed edges with the real transitions and reports worst-case
+latency, false triggers and missed edges. An eager debouncer that latches a
+glitch can swallow the real edge that follows, which shows up as a missed
+edge or, once a later edge is matched in its place, as a long latency.
+
+    python3 bench/debounce_traces.py
+"""
+
+import _host  # noqa: F401
+
+import random
+
+from debounce import Deferred, Eager, Integrator, replay, score
+
+PERIOD_NS = 1_000_000
+BOUNCE_MS = 5
+GLITCH_RATE = 0.002
+
+
+def make_trace(seed, glitch_rate, transitions=200):
+    """Return ``(levels, expected)`` for a trace with ``transitions`` real edges."""
+    rng = random.Random(seed)
+    levels = []
+    expected = []
+    level = 0
+    for _ in range(transitions):
+        # Held for 60-300 ms, with the odd glitch.
+        for _ in range(rng.randrange(60, 300)):
+            glitch = rng.random() < glitch_rate
+            levels.append(level ^ glitch)
+        level ^= 1
+        expected.append((len(levels) * PERIOD_NS, level))
+        for _ in range(rng.randrange(BOUNCE_MS + 1)):
+            levels.append(rng.randrange(2))
+        levels.append(level)
+    levels.extend([level] * 100)
+    return levels, expected
+
+
+STRATEGIES = (
+    ("Eager 50 ms", lambda: Eager()),
+    ("Eager 5 ms", lambda: Eager(5_000_000)),
+    ("Deferred 5 ms", lambda: Deferred()),
+    ("Integrator 5", lambda: Integrator()),
+)
+
+
+def report(title, traces):
+    print(title)
+    print("  %-14s %12s %15s %7s" % ("strategy", "worst (ms)", "false triggers", "missed"))
+    for name, factory in STRATEGIES:
+        worst = false_triggers = missed = 0
+        for levels, expected in traces:
+            w, f, m = score(replay(factory(), levels, PERIOD_NS), expected)
+            worst = max(worst, w)
+            false_triggers += f
+            missed += m
+        print("  %-14s %12.1f %15d %7d" % (name, worst / 1e6, false_triggers, missed))
+
+
+def main():
+    report("bounce only", [make_trace(seed, 0) for seed in range(10)])
+    report("bounce and glitches", [make_trace(seed, GLITCH_RATE) for seed in range(10)])
+
+
+if __name__ == "__main__":
+    main()
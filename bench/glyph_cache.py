@@ -0,0 +1,76 @@
+"""Hit cost and miss rate of the glyph cache.
+
+Times `get_glyph` on cached glyphs for the plain dict cache the budget
+replaced, and for the CLOCK cache without and with a budget. Then counts
+the misses of laying out sample text a line at a time under shrinking
+budgets. Glyphs are 8x8 and made on demand, so only the cache is timed.
+
+    python3 bench/glyph_cache.py
+"""
+
+import _host  # noqa: F401
+
+import time
+
+from _text import sample_text
+from adafruit_bitmap_font.glyph_cache import GlyphCache
+from baseline.glyph_cache import GlyphCache as BaselineGlyphCache
+from displayio import Bitmap
+from fontio import Glyph
+
+ROUNDS = 20
+# 64 bytes of overhead plus eight 32-bit rows.
+GLYPH = 96
+
+
+def fake_font(base, budget=None):
+    class FakeFont(base):
+        def load_glyphs(self, code_points):
+            if isinstance(self, GlyphCache):
+                code_points = self._to_load(code_points)
+            for code_point in code_points:
+                if self._glyphs.get(code_point) is None:
+                    self._glyphs[code_point] = Glyph(Bitmap(8, 8, 2), 0, 8, 8, 0, 0, 8, 0)
+
+    font = FakeFont()
+    if budget is not None:
+        font.cache_budget = budget
+    return font
+
+
+def hit_ns(font, text):
+    code_points = [ord(c) for c in text]
+    get_glyph = font.get_glyph
+    for code_point in set(code_points):
+        get_glyph(code_point)
+    start = time.perf_counter_ns()
+    for _ in range(ROUNDS):
+        for code_point in code_points:
+            get_glyph(code_point)
+    return (time.perf_counter_ns() - start) / (ROUNDS * len(code_points))
+
+
+def main():
+    text = sample_text()
+    glyphs = len(set(text))
+    for name, font in (
+        ("dict", fake_font(BaselineGlyphCache)),
+        ("CLOCK", fake_font(GlyphCache)),
+        ("CLOCK budget", fake_font(GlyphCache, budget=glyphs * GLYPH)),
+    ):
+        print("%-14s hit %6.1f ns" % (name, hit_ns(font, text)))
+
+    lines = [text[i : i + 40] for i in range(0, len(text), 40)]
+    for size in (glyphs, 24, 16, 12):
+        font = fake_font(GlyphCache, budget=size * GLYPH)
+        for line in lines:
+            for char in line:
+                font.get_glyph(ord(char))
+        print(
+            "budget %2d glyphs  misses %4d of %d  evictions %4d"
+            % (size, font.cache_misses, len(text), font.cache_evictions)
+        )
+
+
+if __name__ == "__main__":
+    main()
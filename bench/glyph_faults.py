@@ -0,0 +1,75 @@
+"""Garbage collections and time to lay out a label of unseen glyphs, before
+and after glyphs were faulted in batches.
+
+The baseline loader is asked for one glyph at a time, as labels used to,
+and collects after every miss. The current one gets the whole text through
+`load_glyphs` first, as `Label` now does, and then each glyph. Both fonts
+are opened, and have loaded a space, before the clock starts.
+
+    python3 bench/glyph_faults.py
+"""
+
+import _host  # noqa: F401
+
+import gc
+import os
+import time
+
+from adafruit_bitmap_font.bdf import BDF
+from baseline.bdf import BDF as BaselineBDF
+from displayio import Bitmap
+
+FONT = os.path.join(_host.ROOT, "fonts", "terminal.bdf")
+TEXT = "Layer 2: media, macros & fn"
+ROUNDS = 5
+
+collections = 0
+_collect = gc.collect
+
+
+def counting_collect():
+    global collections
+    collections += 1
+    return _collect()
+
+
+def one_at_a_time(font, text):
+    for char in text:
+        font.get_glyph(ord(char))
+
+
+def batched(font, text):
+    font.load_glyphs(text)
+    for char in text:
+        font.get_glyph(ord(char))
+
+
+def run(font_class, lay_out):
+    global collections
+    best = None
+    for _ in range(ROUNDS):
+        with open(FONT, "rb") as f:
+            font = font_class(f, Bitmap)
+            font.get_glyph(ord(" "))
+            collections = 0
+            start = time.perf_counter_ns()
+            lay_out(font, TEXT)
+            elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return collections, best / 1e6
+
+
+def main():
+    gc.collect = counting_collect
+    unseen = len(set(TEXT) - {" "})
+    print("%d characters, %d unseen glyphs" % (len(TEXT), unseen))
+    for name, font_class, lay_out in (
+        ("per miss", BaselineBDF, one_at_a_time),
+        ("batched", BDF, batched),
+    ):
+        count, ms = run(font_class, lay_out)
+        print("%-9s %3d collections  %7.2f ms" % (name, count, ms))
+
+
+if __name__ == "__main__":
+    main()
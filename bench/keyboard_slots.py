@@ -0,0 +1,47 @@
+"""Press and release speed of `Keyboard` against the baseline slot scan.
+
+Each round holds a few keys, then presses and releases another one on top,
+which is where the old implementation scanned the six report slots. Both
+keyboards send to a fake device.
+
+    python3 bench/keyboard_slots.py
+"""
+
+import _host  # noqa: F401
+
+import time
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keycode import Keycode
+from baseline.keyboard import Keyboard as BaselineKeyboard
+from fakes import keyboard_device
+
+ROUNDS = 20000
+
+
+def per_edge_us(keyboard_class, held):
+    device = keyboard_device()
+    keyboard = keyboard_class(device)
+    keyboard.press(*range(Keycode.A, Keycode.A + held))
+    key = Keycode.Z
+    press = keyboard.press
+    release = keyboard.release
+    start = time.perf_counter_ns()
+    for _ in range(ROUNDS):
+        press(key)
+        release(key)
+        # Keep the device from growing without bound.
+        device.reports.clear()
+    return (time.perf_counter_ns() - start) / (2 * ROUNDS) / 1e3
+
+
+def main():
+    print("%-5s %14s %10s %8s" % ("held", "baseline (us)", "new (us)", "speedup"))
+    for held in (0, 2, 5):
+        old = per_edge_us(BaselineKeyboard, held)
+        new = per_edge_us(Keyboard, held)
+        print("%-5d %14.2f %10.2f %7.2fx" % (held, old, new, old / new))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Characters per second typing a string with `KeyboardLayoutBase.write`
+against a compiled `adafruit_hid.keyboard_macro.Macro`.
+
+Both type the same 2050 characters into a fake keyboard device on a US
+layout. Compiling the macro is timed on its own, since it happens once at
+load time. A host-side decoder checks both report streams type the string.
+
+    python3 bench/macro_throughput.py
+"""
+
+import _host  # noqa: F401
+
+import time
+
+from _text import PRINTABLE, sample_text
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+from adafruit_hid.keyboard_macro import MacroPlayer, compile_string
+from fakes import keyboard_device, typed_text
+
+ROUNDS = 5
+
+
+def timed(function):
+    best = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter_ns()
+        result = function()
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    text = sample_text()
+    device = keyboard_device()
+    layout = KeyboardLayoutUS(Keyboard(device))
+    player = MacroPlayer(layout.keyboard)
+
+    def write():
+        device.reports.clear()
+        layout.write(text)
+        return list(device.reports)
+
+    write_ns, write_reports = timed(write)
+    compile_ns, macro = timed(lambda: compile_string(layout, text))
+
+    def play():
+        device.reports.clear()
+        player.play(macro)
+        return list(device.reports)
+
+    play_ns, play_reports = timed(play)
+
+    assert typed_text(write_reports, layout, PRINTABLE) == text
+    assert typed_text(play_reports, layout, PRINTABLE) == text
+    for name, elapsed, reports in (
+        ("write()", write_ns, write_reports),
+        ("macro play()", play_ns, play_reports),
+    ):
+        print(
+            "%-13s %9.0f chars/s  %5d reports"
+            % (name, len(text) / (elapsed / 1e9), len(reports))
+        )
+    print("%-13s %9.2f ms, once" % ("compile", compile_ns / 1e6))
+
+
+if __name__ == "__main__":
+    main()
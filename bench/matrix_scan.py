@@ -0,0 +1,55 @@
+"""Time to sample a 6x6 `matrix.KeyMatrix` and the worst-case press latency.
+
+``KeyMatrix.sample`` is timed on idle pins, which is KeyMatrix alone, and on
+`matrix.SimulatedMatrix` with keys down, which adds the host's wiring model.
+A key that goes down just after its drive line was strobed is only seen on
+the next sample, so the worst case is one poll interval plus one sample and
+the debounce of the edge.
+
+    python3 bench/matrix_scan.py
+"""
+
+import _host  # noqa: F401
+
+import time
+
+from matrix import KeyMatrix, SimulatedMatrix
+from scanner import FakePin, Scanner
+
+SIZE = 6
+SAMPLES = 20000
+POLL_NS = 1_000_000
+
+
+def per_call_ns(function, count=SAMPLES):
+    start = time.perf_counter_ns()
+    for _ in range(count):
+        function()
+    return (time.perf_counter_ns() - start) / count
+
+
+def main():
+    idle = KeyMatrix([FakePin(True) for _ in range(SIZE)], [FakePin(True) for _ in range(SIZE)])
+    sample_ns = per_call_ns(idle.sample)
+    print("%dx%d sample, idle pins:      %6.1f us" % (SIZE, SIZE, sample_ns / 1e3))
+
+    wiring = SimulatedMatrix(SIZE, SIZE)
+    wiring.pressed.update({(0, 0), (2, 3), (5, 5)})
+    held = KeyMatrix(wiring.rows, wiring.columns)
+    print("%dx%d sample, simulated, 3 down: %4.1f us" % (SIZE, SIZE, per_call_ns(held.sample) / 1e3))
+
+    scanner = Scanner(KeyMatrix(wiring.rows, wiring.columns))
+    now = 0
+    scanner.scan(now)
+    wiring.pressed.add((4, 1))
+    now += POLL_NS
+    start = time.perf_counter_ns()
+    pressed, _ = scanner.scan(now)
+    edge_ns = time.perf_counter_ns() - start
+    assert pressed == 1 << (4 * SIZE + 1)
+    print("scan that reports an edge:     %6.1f us" % (edge_ns / 1e3))
+    print("worst-case press latency:      %6.3f ms" % ((POLL_NS + sample_ns + edge_ns) / 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Open plus first labels of `MKF` against `BDF` on the same font.
+
+Each round opens the font fresh and loads the boot labels. BDF is timed
+building its index and with a saved index; MKF with the row-loop fallback
+and with a host stand-in for ``bitmaptools.readinto``, which is Python here
+and so slower than the board's. All glyphs are checked against BDF first.
+
+    python3 bench/mkf_open.py
+"""
+
+import _host  # noqa: F401
+
+import os
+import tempfile
+import time
+
+from adafruit_bitmap_font import mkf
+from adafruit_bitmap_font.bdf import BDF
+from displayio import Bitmap
+from fakes import bitmap_readinto, glyphs_of
+
+BDF_FONT = os.path.join(_host.ROOT, "fonts", "terminal.bdf")
+MKF_FONT = os.path.join(_host.ROOT, "fonts", "terminal.mkf")
+LABELS = ("MACRO KEYBOARD", "READY")
+ROUNDS = 5
+
+
+def first_labels_ms(path, open_font):
+    best = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter_ns()
+        with open(path, "rb") as f:
+            font = open_font(f)
+            for label in LABELS:
+                font.load_glyphs(label)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / 1e6
+
+
+def main():
+    with open(BDF_FONT, "rb") as f:
+        code_points = [int(line.split()[1]) for line in f if line.startswith(b"ENCODING")]
+    with open(BDF_FONT, "rb") as f:
+        expected = glyphs_of(BDF(f, Bitmap), code_points)
+    for readinto in (None, bitmap_readinto):
+        mkf._bitmap_readinto = readinto
+        with open(MKF_FONT, "rb") as f:
+            assert glyphs_of(mkf.MKF(f, Bitmap), code_points) == expected
+    print("%d glyphs identical" % len(code_points))
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = os.path.join(directory, "terminal.idx")
+        with open(BDF_FONT, "rb") as f:
+            BDF(f, Bitmap, index_path=index).load_glyphs(" ")
+        print("%-16s %8.2f ms" % ("BDF index built", first_labels_ms(BDF_FONT, lambda f: BDF(f, Bitmap))))
+        print(
+            "%-16s %8.2f ms"
+            % ("BDF index saved", first_labels_ms(BDF_FONT, lambda f: BDF(f, Bitmap, index_path=index)))
+        )
+    for name, readinto in (("MKF row loop", None), ("MKF readinto", bitmap_readinto)):
+        mkf._bitmap_readinto = readinto
+        print("%-16s %8.2f ms" % (name, first_labels_ms(MKF_FONT, lambda f: mkf.MKF(f, Bitmap))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Press-to-send_report latency of the scan loop.
+
+Buttons toggle at random times on a simulated clock. The loop samples every
+``poll`` and the edge is sent on the first sample that sees it, so latency is
+the wait for that sample plus the measured host time of the scan, keymap and
+``send_report`` call. The old loop slept 50 ms per pass; the scanner polls
+every 1 ms while idle.
+
+    python3 bench/press_latency.py
+"""
+
+import _host  # noqa: F401
+
+import random
+import time
+
+from adafruit_hid.consumer_control import ConsumerControl
+from fakes import consumer_device
+from keymap import Keymap, Media
+from scanner import ButtonBank, FakePin, Scanner
+
+EDGES = 2000
+KEYS = 5
+
+
+def run(poll_ns, seed=1):
+    rng = random.Random(seed)
+    pins = [FakePin() for _ in range(KEYS)]
+    device = consumer_device()
+    keymap = Keymap(
+        [[Media(0xB5 + i) for i in range(KEYS)]], consumer_control=ConsumerControl(device)
+    )
+    scanner = Scanner(ButtonBank(pins))
+    latencies = []
+    now = 0
+    for n in range(EDGES):
+        key = (n // 2) % KEYS
+        # Well clear of the 50 ms lockout, so every edge is real.
+        edge = now + rng.randrange(60_000_000, 200_000_000)
+        pins[key].value = not pins[key].value
+        now = -(-edge // poll_ns) * poll_ns
+        start = time.perf_counter_ns()
+        pressed, released = scanner.scan(now)
+        if pressed:
+            keymap.press(key, now)
+        if released:
+            keymap.release(key, now)
+        latencies.append(now - edge + time.perf_counter_ns() - start)
+    assert len(device.reports) == EDGES, "every edge must send exactly one report"
+    return max(latencies), sum(latencies) / len(latencies)
+
+
+def main():
+    for name, poll_ns in (("50 ms sleep", 50_000_000), ("1 ms poll", 1_000_000)):
+        worst, mean = run(poll_ns)
+        print("%-12s max %6.2f ms  mean %6.2f ms" % (name, worst / 1e6, mean / 1e6))
+
+
+if __name__ == "__main__":
+    main()
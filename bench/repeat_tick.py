@@ -0,0 +1,42 @@
+"""Cost of `repeat.Repeater.tick` on a 1 ms simulated clock as more keys are held.
+
+The wheel only visits the buckets time has moved through, so a tick with
+nothing due should cost the same however many keys are repeating. Firing
+times are checked against the expected delay and interval.
+
+    python3 bench/repeat_tick.py
+"""
+
+import _host  # noqa: F401
+
+import time
+
+from repeat import REPEAT_DELAY_NS, REPEAT_INTERVAL_NS, Repeater
+
+MS = 1_000_000
+TICKS = 2000
+
+
+def main():
+    print("%-5s %14s %8s" % ("held", "per tick (us)", "repeats"))
+    for held in (1, 8, 64):
+        repeater = Repeater()
+        for key in range(held):
+            repeater.start(key, 0)
+        fired = []
+
+        def fire(key, now):
+            fired.append(now)
+
+        tick = repeater.tick
+        start = time.perf_counter_ns()
+        for now in range(MS, (TICKS + 1) * MS, MS):
+            tick(now, fire)
+        elapsed = time.perf_counter_ns() - start
+        due = [REPEAT_DELAY_NS + i * REPEAT_INTERVAL_NS for i in range(21)]
+        assert sorted(set(fired)) == [t for t in due if t <= TICKS * MS]
+        print("%-5d %14.2f %8d" % (held, elapsed / TICKS / 1e3, len(fired)))
+
+
+if __name__ == "__main__":
+    main()
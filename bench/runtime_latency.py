@@ -0,0 +1,262 @@
+"""Key latency of `runtime.Runtime` while the display is kept busy, on a
+simulated clock.
+
+Five buttons change at random 20-80 ms intervals, so nearly every release
+changes the status text and the display task re-renders and refreshes
+non-stop. The asyncio loop runs on a simulated clock: sleeps take no wall
+time, and only the display costs time, ``RENDER_MS`` to re-render the label
+and ``REFRESH_MS`` for the blocking I2C refresh. Host jitter therefore
+cannot hide or fake a delay.
+
+Targets, checked for every key edge:
+
+* detect to send, from the scan that sees the edge to the device
+  receiving the report, is at most ``DETECT_TARGET_MS``. A refresh started
+  in between would take far longer, so this shows the display task never
+  starts work while HID has any.
+* flip to send is at most one scan interval plus ``DETECT_TARGET_MS``,
+  plus the rest of a render or refresh that was already running when the
+  pin changed. Those block and cannot be interrupted, so no scheduler can
+  do better; the runtime checks for HID work between the two.
+
+The run exits with status 1 if any edge misses a target. With ``--queue``
+reports go through a `ReportQueue` and the runtime's report task, as in
+main.py.
+
+    python3 bench/runtime_latency.py [--queue]
+"""
+
+import _host  # noqa: F401
+
+import argparse
+import asyncio
+import bisect
+import math
+import random
+import selectors
+import sys
+
+import runtime as runtime_module
+import scanner as scanner_module
+from adafruit_hid.consumer_control import ConsumerControl
+from adafruit_hid.report_cache import ReportCache
+from adafruit_hid.report_queue import ReportQueue
+from keymap import Keymap, Media
+from runtime import SCAN_INTERVAL, Runtime
+from scanner import ButtonBank, Scanner
+
+MS = 1_000_000
+EDGES = 400
+KEYS = 5
+RENDER_MS = 3
+REFRESH_MS = 25
+DETECT_TARGET_MS = 1
+SCAN_INTERVAL_NS = int(SCAN_INTERVAL * 1e9)
+
+
+class Clock:
+    """Simulated time in ns, standing in for the ``time`` module."""
+
+    def __init__(self):
+        self.now = 0
+
+    def monotonic_ns(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now / 1e9
+
+    def sleep(self, seconds):
+        self.now += int(seconds * 1e9)
+
+
+class ClockSelector(selectors.SelectSelector):
+    """Advances the clock by the loop's timeout instead of waiting for it."""
+
+    def __init__(self, clock):
+        super().__init__()
+        self.clock = clock
+
+    def select(self, timeout=None):
+        if timeout:
+            # Round up, or float error can leave the next timer never due.
+            self.clock.now += math.ceil(timeout * 1e9)
+        return super().select(0)
+
+
+class ClockLoop(asyncio.SelectorEventLoop):
+    def __init__(self, clock):
+        super().__init__(ClockSelector(clock))
+        self.clock = clock
+
+    def time(self):
+        return self.clock.now / 1e9
+
+
+class ScheduledPin:
+    """Pin that changes at set simulated times, whatever the loop is doing."""
+
+    def __init__(self, clock, flips):
+        self.clock = clock
+        self.flips = flips
+
+    @property
+    def value(self):
+        return bisect.bisect_right(self.flips, self.clock.now) % 2 == 1
+
+
+class TimedScanner(Scanner):
+    """Notes when each edge is seen."""
+
+    def __init__(self, source, clock):
+        super().__init__(source)
+        self.clock = clock
+        self.detected = []
+
+    def scan(self, now=None):
+        pressed, released = super().scan(now)
+        for _ in range(bin(pressed | released).count("1")):
+            self.detected.append(self.clock.now)
+        return pressed, released
+
+
+class TimedDevice:
+    """Consumer control device that notes when each report arrives."""
+
+    usage_page = 0x0C
+    usage = 0x01
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.received = []
+
+    def send_report(self, report, report_id=None):
+        self.received.append(self.clock.now)
+
+
+class Display:
+    """Costs simulated time like a label re-render and an SSD1306 refresh."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        # (start, end) of every render and refresh.
+        self.busy = []
+        self.refreshes = 0
+
+    def _block(self, ms):
+        start = self.clock.now
+        self.clock.now += ms * MS
+        self.busy.append((start, self.clock.now))
+
+    def show(self, text):
+        self._block(RENDER_MS)
+
+    def refresh(self):
+        self._block(REFRESH_MS)
+        self.refreshes += 1
+
+
+def schedule():
+    """Return the time of every pin change, and the changes of each pin."""
+    rng = random.Random(6)
+    flipped = []
+    now = 0
+    for _ in range(EDGES):
+        now += int(rng.uniform(20, 80) * MS)
+        flipped.append(now)
+    per_pin = [[] for _ in range(KEYS)]
+    for n, at in enumerate(flipped):
+        per_pin[(n // 2) % KEYS].append(at)
+    return flipped, per_pin
+
+
+def build(clock, queued, display, per_pin):
+    pins = [ScheduledPin(clock, flips) for flips in per_pin]
+    device = TimedDevice(clock)
+    queues = (ReportQueue(device),) if queued else ()
+    cache = ReportCache(queues[0] if queued else device)
+    keymap = Keymap(
+        [[Media(0xB5 + i, "K%d" % i) for i in range(KEYS)]],
+        consumer_control=ConsumerControl(cache),
+    )
+    scanner = TimedScanner(ButtonBank(pins), clock)
+    for debouncer in scanner.debouncers:
+        debouncer.lockout_ns = 0
+    runtime = Runtime(
+        scanner,
+        keymap,
+        display.show if display else lambda text: None,
+        display.refresh if display else None,
+        report_caches=(cache,),
+        report_queues=queues,
+    )
+    return scanner, device, runtime
+
+
+async def drive(runtime, until_ns):
+    task = asyncio.create_task(runtime.run())
+    await asyncio.sleep(until_ns / 1e9)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+def busy_left(busy, at):
+    """Time left at ``at`` of a render or refresh that was running then."""
+    for start, end in busy:
+        if start <= at < end:
+            return end - at
+    return 0
+
+
+def run(queued, display_on):
+    clock = Clock()
+    runtime_module.time = clock
+    scanner_module.time = clock
+    display = Display(clock) if display_on else None
+    flipped, per_pin = schedule()
+    scanner, device, runtime = build(clock, queued, display, per_pin)
+    loop = ClockLoop(clock)
+    try:
+        loop.run_until_complete(drive(runtime, flipped[-1] + 100 * MS))
+    finally:
+        loop.close()
+    assert len(device.received) == len(flipped) == len(scanner.detected)
+    busy = display.busy if display else []
+    misses = 0
+    worst_detect = worst_flip = 0
+    for flip, seen, sent in zip(flipped, scanner.detected, device.received):
+        detect = sent - seen
+        flip_target = SCAN_INTERVAL_NS + DETECT_TARGET_MS * MS + busy_left(busy, flip)
+        if detect > DETECT_TARGET_MS * MS or sent - flip > flip_target:
+            misses += 1
+        worst_detect = max(worst_detect, detect)
+        worst_flip = max(worst_flip, sent - flip)
+    print(
+        "display %-3s %d edges, %d refreshes: detect to send max %.2f ms, "
+        "flip to send max %.2f ms, %d over target"
+        % (
+            "on" if display_on else "off",
+            len(flipped),
+            display.refreshes if display else 0,
+            worst_detect / MS,
+            worst_flip / MS,
+            misses,
+        )
+    )
+    return misses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queue", action="store_true", help="send through a ReportQueue")
+    queued = parser.parse_args().queue
+    misses = run(queued, False) + run(queued, True)
+    if misses:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Host time of one pass of the scan loop, idle and with a key edge.
+
+"old loop" is the body of the original ``while True`` loop in main.py: a
+``Button`` per pin read three times, a dict lookup per action and an
+f-string log line per edge. The log lines go to a string buffer, so
+formatting is timed but not the console.
+
+"firmware" is what main.py runs now, minus the asyncio hand-offs: one
+`scanner.Scanner.scan` and, for each edge, the `keymap.Keymap` action
+sending between ``hold`` and ``flush`` on a `ReportCache` in front of a
+`ReportQueue`, which is then drained as the report task would. Its `Media`
+actions send their packed reports. "firmware, unbound" is the same with the
+actions going through `ConsumerControl.press` and ``release`` instead. The
+rest of an edge pass outweighs that difference on the host, so the action
+alone is also timed, sending to a device that does nothing.
+
+    python3 bench/scan_cost.py
+"""
+
+import _host  # noqa: F401
+
+import io
+import time
+
+from adafruit_hid.consumer_control import ConsumerControl
+from adafruit_hid.report_cache import ReportCache
+from adafruit_hid.report_queue import ReportQueue
+from fakes import consumer_device
+from keymap import Keymap, Media
+from scanner import ButtonBank, FakePin, Scanner, bits
+
+PASSES = 20000
+ROUNDS = 9
+CODES = (0xB6, 0xCD, 0xB5, 0xEA, 0xE9)
+LABELS = ("PREV", "PLAY", "NEXT", "VOL-", "VOL+")
+
+
+class Button:
+    """The original main.py button, on a `scanner.FakePin`."""
+
+    def __init__(self, pin):
+        self.pin = pin
+        self.previous_state = False
+
+    @property
+    def pressed(self):
+        current = self.pin.value
+        if current and not self.previous_state:
+            return True
+        return False
+
+    @property
+    def released(self):
+        current = self.pin.value
+        if not current and self.previous_state:
+            return True
+        return False
+
+    def update(self):
+        self.previous_state = self.pin.value
+
+
+def old_loop(pins, log):
+    actions = [{"code": code, "label": label} for code, label in zip(CODES, LABELS)]
+    consumer_control = ConsumerControl(consumer_device())
+    buttons = [Button(pin) for pin in pins]
+
+    def one_pass():
+        for i, button in enumerate(buttons):
+            action = actions[i]
+            if button.pressed:
+                consumer_control.press(action["code"])
+                print(f"Button {i} pressed: {action['label']}", file=log)
+            elif button.released:
+                consumer_control.release()
+                print(f"Button {i} released: {action['label']}", file=log)
+            button.update()
+
+    return one_pass
+
+
+def firmware_loop(pins, log, bound=True):
+    queue = ReportQueue(consumer_device())
+    cache = ReportCache(queue)
+    cc = ConsumerControl(cache)
+    keymap = Keymap(
+        [[Media(code, label) for code, label in zip(CODES, LABELS)]],
+        consumer_control=cc if bound else None,
+    )
+    keymap.consumer_control = cc
+    # No lockout, so an edge on every pass gets through.
+    scanner = Scanner(ButtonBank(pins))
+    for debouncer in scanner.debouncers:
+        debouncer.lockout_ns = 0
+    clock = [0]
+
+    def one_pass():
+        clock[0] += 1_000_000
+        now = clock[0]
+        pressed, released = scanner.scan(now)
+        if pressed or released:
+            cache.hold()
+            for i in bits(released):
+                keymap.release(i, now)
+            for i in bits(pressed):
+                keymap.press(i, now)
+            cache.flush()
+            while queue.send_next():
+                pass
+
+    return one_pass
+
+
+def unbound_loop(pins, log):
+    return firmware_loop(pins, log, bound=False)
+
+
+def per_pass_us(make_loop, toggle):
+    best = None
+    for _ in range(ROUNDS):
+        pins = [FakePin() for _ in CODES]
+        one_pass = make_loop(pins, io.StringIO())
+        start = time.perf_counter_ns()
+        for n in range(PASSES):
+            if toggle:
+                pins[1].value = not pins[1].value
+            one_pass()
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / PASSES / 1e3
+
+
+class NullDevice:
+    usage_page = 0x0C
+    usage = 0x01
+
+    def send_report(self, report, report_id=None):
+        pass
+
+
+def action_us(bound):
+    cc = ConsumerControl(NullDevice())
+    keymap = Keymap([[Media(CODES[0])]], consumer_control=cc if bound else None)
+    keymap.consumer_control = cc
+    press = keymap.press
+    release = keymap.release
+    best = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter_ns()
+        for _ in range(PASSES):
+            press(0, 0)
+            release(0, 0)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / (2 * PASSES) / 1e3
+
+
+def main():
+    print("%-18s %10s %12s" % ("", "idle (us)", "edge (us)"))
+    for name, make_loop in (
+        ("old loop", old_loop),
+        ("firmware", firmware_loop),
+        ("firmware, unbound", unbound_loop),
+    ):
+        print(
+            "%-18s %10.2f %12.2f"
+            % (name, per_pass_us(make_loop, False), per_pass_us(make_loop, True))
+        )
+    print()
+    for name, bound in (("Media, bound", True), ("Media, unbound", False)):
+        print("%-18s %10.2f us per edge" % (name, action_us(bound)))
+
+
+if __name__ == "__main__":
+    main()
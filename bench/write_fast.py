@@ -0,0 +1,50 @@
+"""Reports per character and characters per second of
+`KeyboardLayoutBase.write_fast` against `KeyboardLayoutBase.write`.
+
+Both type the same printable ASCII text into a fake keyboard device on a US
+layout, on the 6-key `Keyboard` and on `KeyboardNKRO`. A host-side decoder
+checks that every report stream types the text.
+
+    python3 bench/write_fast.py
+"""
+
+import _host  # noqa: F401
+
+import time
+
+from _text import PRINTABLE, sample_text
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+from adafruit_hid.keyboard_nkro import KeyboardNKRO
+from fakes import keyboard_device, typed_text
+
+ROUNDS = 5
+
+
+def run(layout, write, text):
+    device = layout.keyboard._keyboard_device
+    best = None
+    for _ in range(ROUNDS):
+        device.reports.clear()
+        start = time.perf_counter_ns()
+        write(text)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    assert typed_text(device.reports, layout, PRINTABLE) == text
+    return len(text) / (best / 1e9), len(device.reports) / len(text)
+
+
+def main():
+    text = sample_text()
+    for keyboard_class in (Keyboard, KeyboardNKRO):
+        layout = KeyboardLayoutUS(keyboard_class(keyboard_device()))
+        for name, write in (("write", layout.write), ("write_fast", layout.write_fast)):
+            chars_per_s, reports_per_char = run(layout, write, text)
+            print(
+                "%-12s %-10s %9.0f chars/s  %4.2f reports/char"
+                % (keyboard_class.__name__, name, chars_per_s, reports_per_char)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Per-key debounce strategies for `scanner.Scanner`.
+
+Every strategy has ``update(level, now)``, which takes the raw level of one key
+and the scan time in nanoseconds and returns the debounced level, a ``busy``
+flag that is set while it still needs samples to reach a decision, and
+``reset(level)`` to force its state.
+"""
+
+DEBOUNCE_NS = 50_000_000
+
+
+class Eager:
+    """Report the first edge at once, then ignore the key for ``lockout_ns``.
+
+    Lowest latency; a good fit for media keys.
+    """
+
+    busy = False
+
+    def __init__(self, lockout_ns=DEBOUNCE_NS):
+        self.lockout_ns = lockout_ns
+        self.state = 0
+        self.edge_time = -lockout_ns
+
+    def reset(self, level):
+        self.state = level
+
+    def update(self, level, now):
+        if level != self.state and now - self.edge_time >= self.lockout_ns:
+            self.state = level
+            self.edge_time = now
+        return self.state
+
+
+class Deferred:
+    """Report an edge only once the new level has held for ``delay_ns``.
+
+    Adds ``delay_ns`` of latency but never reports a glitch, so it suits
+    noisy switches.
+    """
+
+    def __init__(self, delay_ns=5_000_000):
+        self.delay_ns = delay_ns
+        self.state = 0
+        self.since = None
+        self.busy = False
+
+    def reset(self, level):
+        self.state = level
+        self.since = None
+        self.busy = False
+
+    def update(self, level, now):
+        if level == self.state:
+            self.since = None
+        elif self.since is None:
+            self.since = now
+        elif now - self.since >= self.delay_ns:
+            self.state = level
+            self.since = None
+        self.busy = self.since is not None
+        return self.state
+
+
+class Integrator:
+    """Counter integrator: each sample moves a counter towards the raw level,
+    and the output flips only when the counter reaches 0 or ``samples``."""
+
+    def __init__(self, samples=5):
+        self.samples = samples
+        self.count = 0
+        self.state = 0
+        self.busy = False
+
+    def reset(self, level):
+        self.state = level
+        self.count = self.samples if level else 0
+        self.busy = False
+
+    def update(self, level, now):
+        count = self.count
+        if level:
+            if count < self.samples:
+                count += 1
+                if count == self.samples:
+                    self.state = 1
+        elif count > 0:
+            count -= 1
+            if count == 0:
+                self.state = 0
+        self.count = count
+        self.busy = 0 < count < self.samples
+        return self.state
+
+
+def replay(debouncer, trace, period_ns):
+    """Feed a recorded bounce trace through ``debouncer``.
+
+    :param trace: raw levels (0 or 1) sampled every ``period_ns``.
+    :returns: list of ``(time_ns, level)`` debounced edges.
+    """
+    edges = []
+    state = debouncer.state
+    now = 0
+    for level in trace:
+        new = debouncer.update(level, now)
+        if new != state:
+            state = new
+            edges.append((now, new))
+        now += period_ns
+    return edges
+
+
+def score(edges, expected):
+    """Compare replayed ``edges`` against the ``expected`` ``(time_ns, level)`` edges.
+
+    :returns: ``(worst_latency_ns, false_triggers, missed)``.
+    """
+    worst = 0
+    false_triggers = 0
+    pending = list(expected)
+    for time_ns, level in edges:
+        if pending and pending[0][1] == level and pending[0][0] <= time_ns:
+            worst = max(worst, time_ns - pending.pop(0)[0])
+        else:
+            false_triggers += 1
+    return worst, false_triggers, len(pending)
@@ -0,0 +1,363 @@
+"""Layered keymap with momentary/toggle layers and tap-vs-hold keys.
+
+A keymap is a list of layers, each a list with one action per key. ``None``
+is transparent and falls through to the next lower active layer. Layer 0 is
+always active.
+
+When the keymap is built, each action is bound to it. Actions whose report
+does not depend on other keys, such as `Media`, pack that report once and
+keep the device's bound ``send_report``, so a key edge is two byte stores
+and one send.
+"""
+
+import struct
+
+from adafruit_hid.consumer_control import ConsumerControl
+
+TAPPING_TERM_NS = 200_000_000
+
+
+class Action:
+    """Base class for everything a key can do."""
+
+    label = None
+
+    def bind(self, keymap):
+        """Prepare to send through ``keymap``'s devices. Called once per keymap."""
+
+    def press(self, keymap, key, now):
+        pass
+
+    def release(self, keymap, key, now):
+        pass
+
+    def repeat(self, keymap, key, now):
+        pass
+
+
+class Key(Action):
+    """Hold keyboard keycodes (modifiers included) while the key is down."""
+
+    def __init__(self, *keycodes, label=None):
+        self.keycodes = keycodes
+        self.label = label
+
+    def press(self, keymap, key, now):
+        keymap.keyboard.press(*self.keycodes)
+
+    def release(self, keymap, key, now):
+        keymap.keyboard.release(*self.keycodes)
+
+
+class Media(Action):
+    """Hold a consumer control code while the key is down.
+
+    Bound to a single-code `ConsumerControl`, the bytes of the packed report
+    are written into that control's own report, so its `release` still sees
+    what is held.
+    """
+
+    def __init__(self, code, label=None):
+        self.code = code
+        self.label = label
+        self.packed = struct.pack("<H", code)
+        self._low, self._high = self.packed
+        self._report = None
+        self._send = None
+
+    def bind(self, keymap):
+        cc = keymap.consumer_control
+        if type(cc) is ConsumerControl:
+            self._report = cc._report
+            self._send = cc._consumer_device.send_report
+        else:
+            # MultiConsumerControl reports depend on the other codes held.
+            self._report = self._send = None
+
+    def press(self, keymap, key, now):
+        send = self._send
+        if send is None:
+            keymap.consumer_control.press(self.code)
+            return
+        report = self._report
+        report[0] = self._low
+        report[1] = self._high
+        send(report)
+
+    def release(self, keymap, key, now):
+        send = self._send
+        if send is None:
+            keymap.consumer_control.release(self.code)
+            return
+        report = self._report
+        # Another code pressed since stays pressed.
+        if report[0] == self._low and report[1] == self._high:
+            report[0] = report[1] = 0
+            send(report)
+
+
+class MouseButton(Action):
+    """Hold mouse buttons while the key is down."""
+
+    def __init__(self, buttons, label=None):
+        self.buttons = buttons
+        self.label = label
+
+    def press(self, keymap, key, now):
+        keymap.mouse.press(self.buttons)
+
+    def release(self, keymap, key, now):
+        keymap.mouse.release(self.buttons)
+
+
+class MouseMove(Action):
+    """Move the mouse or scroll once per press."""
+
+    def __init__(self, x=0, y=0, wheel=0, label=None):
+        self.x = x
+        self.y = y
+        self.wheel = wheel
+        self.label = label
+
+    def press(self, keymap, key, now):
+        keymap.mouse.move(self.x, self.y, self.wheel)
+
+
+class MouseKey(Action):
+    """Move the mouse or scroll while the key is down, accelerating the longer it is held."""
+
+    def __init__(self, x=0, y=0, wheel=0, label=None):
+        self.x = x
+        self.y = y
+        self.wheel = wheel
+        self.label = label
+
+    def press(self, keymap, key, now):
+        keymap.mouse_motion.press(self.x, self.y, self.wheel, now)
+
+    def release(self, keymap, key, now):
+        keymap.mouse_motion.release(self.x, self.y, self.wheel, now)
+
+
+class Type(Action):
+    """Type a compiled `adafruit_hid.keyboard_macro.Macro`.
+
+    The keymap's macro player sends one report per tick, so scanning and the
+    display carry on while it types. Pressing any key cancels it.
+    """
+
+    def __init__(self, macro, label=None):
+        self.macro = macro
+        self.label = label
+
+    def press(self, keymap, key, now):
+        keymap.macro_player.start(self.macro)
+
+
+class Repeat(Action):
+    """Hold ``action``, then repeat it as release/press pulses while the key is down.
+
+    Timing comes from the keymap's `repeat.Repeater` unless ``delay_ns`` or
+    ``interval_ns`` are given.
+    """
+
+    def __init__(self, action, delay_ns=None, interval_ns=None):
+        self.action = action
+        self.label = action.label
+        self.delay_ns = delay_ns
+        self.interval_ns = interval_ns
+
+    def bind(self, keymap):
+        self.action.bind(keymap)
+
+    def press(self, keymap, key, now):
+        self.action.press(keymap, key, now)
+        keymap.repeater.start(key, now, self.delay_ns, self.interval_ns)
+
+    def release(self, keymap, key, now):
+        keymap.repeater.stop(key)
+        self.action.release(keymap, key, now)
+
+    def repeat(self, keymap, key, now):
+        self.action.release(keymap, key, now)
+        self.action.press(keymap, key, now)
+
+
+class Momentary(Action):
+    """Activate ``layer`` while the key is down."""
+
+    def __init__(self, layer, label=None):
+        self.layer = layer
+        self.label = label
+
+    def press(self, keymap, key, now):
+        keymap.set_layers(keymap.active | (1 << self.layer))
+
+    def release(self, keymap, key, now):
+        keymap.set_layers(keymap.active & ~(1 << self.layer))
+
+
+class Toggle(Action):
+    """Flip ``layer`` on or off each time the key is pressed."""
+
+    def __init__(self, layer, label=None):
+        self.layer = layer
+        self.label = label
+
+    def press(self, keymap, key, now):
+        keymap.set_layers(keymap.active ^ (1 << self.layer))
+
+
+class TapHold(Action):
+    """Run ``tap`` if the key is released within ``term_ns``, else ``hold``.
+
+    Pressing another key while this one is undecided also selects ``hold``,
+    so ``hold`` can be a modifier or layer for the key that follows.
+    """
+
+    def __init__(self, tap, hold, term_ns=TAPPING_TERM_NS):
+        self.tap = tap
+        self.hold = hold
+        self.term_ns = term_ns
+
+    def bind(self, keymap):
+        self.tap.bind(keymap)
+        self.hold.bind(keymap)
+
+    def press(self, keymap, key, now):
+        keymap.pending = (key, self, now)
+
+    def release(self, keymap, key, now):
+        self.hold.release(keymap, key, now)
+
+    def repeat(self, keymap, key, now):
+        self.hold.repeat(keymap, key, now)
+
+
+def LayerTap(layer, tap, term_ns=TAPPING_TERM_NS):
+    """Tap for ``tap``, hold for momentary ``layer``."""
+    return TapHold(tap, Momentary(layer), term_ns)
+
+
+class Keymap:
+    """Resolves key edges to actions and sends them through ``adafruit_hid``.
+
+    The resolved action of every key for a given set of active layers is a
+    flat tuple, built the first time that layer mask is seen and cached, so a
+    key press is one index no matter how many layers exist.
+    """
+
+    def __init__(
+        self,
+        layers,
+        keyboard=None,
+        consumer_control=None,
+        mouse=None,
+        macro_player=None,
+        mouse_motion=None,
+        repeater=None,
+    ):
+        self.layers = layers
+        self.key_count = len(layers[0])
+        self.keyboard = keyboard
+        self.consumer_control = consumer_control
+        self.mouse = mouse
+        self.macro_player = macro_player
+        self.mouse_motion = mouse_motion
+        self.repeater = repeater
+        for layer in layers:
+            for action in layer:
+                if action is not None:
+                    action.bind(self)
+        self.tables = {}
+        self.active = 1
+        self.table = self._table(1)
+        # Action each key was pressed with, so its release goes to the same
+        # action even if the active layers changed in between.
+        self.held = [None] * self.key_count
+        # (key, TapHold, press time) while a tap-hold key is undecided.
+        self.pending = None
+
+    def _table(self, mask):
+        table = self.tables.get(mask)
+        if table is None:
+            resolved = [None] * self.key_count
+            for index in range(len(self.layers) - 1, -1, -1):
+                if not (mask >> index) & 1:
+                    continue
+                for key, action in enumerate(self.layers[index]):
+                    if resolved[key] is None:
+                        resolved[key] = action
+            table = self.tables[mask] = tuple(resolved)
+        return table
+
+    def set_layers(self, mask):
+        """Set the active layer mask. Layer 0 stays on."""
+        self.active = mask | 1
+        self.table = self._table(self.active)
+
+    def _resolve_hold(self, now):
+        key, action, _ = self.pending
+        self.pending = None
+        action.hold.press(self, key, now)
+
+    @property
+    def busy(self):
+        """True while `tick` has work: an undecided tap-hold key, a macro playing,
+        the mouse moving or a key repeating."""
+        player = self.macro_player
+        motion = self.mouse_motion
+        repeater = self.repeater
+        return (
+            self.pending is not None
+            or (player is not None and player.playing)
+            or (motion is not None and motion.moving)
+            or (repeater is not None and repeater.active)
+        )
+
+    def tick(self, now):
+        """Resolve an undecided tap-hold key once its tapping term has passed,
+        send the next report of a playing macro, move the mouse and repeat
+        held keys that are due."""
+        pending = self.pending
+        if pending is not None and now - pending[2] >= pending[1].term_ns:
+            self._resolve_hold(now)
+        player = self.macro_player
+        if player is not None and player.playing:
+            player.tick(now)
+        motion = self.mouse_motion
+        if motion is not None and motion.moving:
+            motion.tick(now)
+        repeater = self.repeater
+        if repeater is not None and repeater.active:
+            repeater.tick(now, self._repeat)
+
+    def _repeat(self, key, now):
+        action = self.held[key]
+        if action is not None:
+            action.repeat(self, key, now)
+
+    def press(self, key, now):
+        player = self.macro_player
+        if player is not None and player.playing:
+            player.cancel()
+        if self.pending is not None:
+            self._resolve_hold(now)
+        action = self.table[key]
+        if action is not None:
+            self.held[key] = action
+            action.press(self, key, now)
+
+    def release(self, key, now):
+        """Release ``key`` and return the label of what it did, if any."""
+        action = self.held[key]
+        if action is None:
+            return None
+        self.held[key] = None
+        pending = self.pending
+        if pending is not None and pending[0] == key:
+            self.pending = None
+            action = action.tap
+            action.press(self, key, now)
+        action.release(self, key, now)
+        return action.label
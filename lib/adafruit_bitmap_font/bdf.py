@@ -24,26 +24,50 @@ Implementation Notes
 
 try:
     from io import FileIO
-    from typing import Iterable, Optional, Tuple, Union
+    from typing import Iterable, List, Optional, Tuple, Union
 
     from displayio import Bitmap
 except ImportError:
     pass
 
 import gc
+from array import array
+from io import BytesIO
 
 from fontio import Glyph
+from lower_bound import lower_bound
 
 from .glyph_cache import GlyphCache
 
+try:
+    from bitmaptools import readinto as _bitmap_readinto
+except ImportError:
+    _bitmap_readinto = None
+
 __version__ = "2.3.1"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
 
+_INDEX_MAGIC = b"BDFX"
+# Magic, glyph count, size of the BDF file the index was built from.
+_INDEX_HEADER_SIZE = 12
+
+# Set bit positions of each byte value, built when first needed without bitmaptools.
+_BIT_POSITIONS = None
+
 
 class BDF(GlyphCache):
-    """Loads glyphs from a BDF file in the given bitmap_class."""
+    """Loads glyphs from a BDF file in the given bitmap_class.
+
+    The first load scans the file once and indexes the byte offset of every
+    glyph, so later loads seek straight to the glyphs they need. With
+    ``index_path``, the index is saved to that file and read back on the
+    next start instead of scanning again. Every glyph is read from the
+    offset the index gives only if its STARTCHAR line is there and its
+    ENCODING matches. Otherwise the font has changed since the index was
+    made, even if its size has not, and the index is rebuilt.
+    """
 
-    def __init__(self, f: FileIO, bitmap_class: Bitmap) -> None:
+    def __init__(self, f: FileIO, bitmap_class: Bitmap, index_path: Optional[str] = None) -> None:
         super().__init__()
         self.file = f
         self.name = f
@@ -58,6 +82,10 @@ class BDF(GlyphCache):
         self.y_resolution = None
         self._ascent = None
         self._descent = None
+        self.index_path = index_path
+        # Sorted code points, and the offset of each one's STARTCHAR line.
+        self._code_points = None
+        self._offsets = None
 
     @property
     def descent(self) -> Optional[int]:
@@ -123,113 +151,221 @@ class BDF(GlyphCache):
         """Return the maximum glyph size as a 4-tuple of: width, height, x_offset, y_offset"""
         return self._boundingbox
 
-    def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
-        metadata = True
-        character = False
-        code_point = None
-        bytes_per_row = 1
-        desired_character = False
-        current_info = {}
-        current_y = 0
-        rounded_x = 1
-        if isinstance(code_points, int):
-            remaining = set()
-            remaining.add(code_points)
-        elif isinstance(code_points, str):
-            remaining = set(ord(c) for c in code_points)
-        elif isinstance(code_points, set):
-            remaining = code_points
-        else:
-            remaining = set(code_points)
-        for code_point in remaining.copy():
-            if code_point in self._glyphs and self._glyphs[code_point]:
-                remaining.remove(code_point)
-        if not remaining:
+    def _load_index(self) -> None:
+        """Read the glyph index from ``index_path``, or build it and try to save it there."""
+        if self.index_path is not None and self._read_index():
             return
+        self._build_index()
+        if self.index_path is not None:
+            self._write_index()
 
-        x, _, _, _ = self._boundingbox
-
+    def _build_index(self) -> None:
+        """Scan the file once, noting the offset of each glyph's STARTCHAR line."""
+        code_points = array("I")
+        offsets = array("I")
+        ordered = True
+        offset = 0
+        start = 0
         self.file.seek(0)
         while True:
             line = self.file.readline()
             if not line:
                 break
-            if line.startswith(b"CHARS "):
-                metadata = False
+            if line.startswith(b"STARTCHAR"):
+                start = offset
+            elif line.startswith(b"ENCODING"):
+                code_point = int(line.split()[1])
+                # Glyphs without an encoding are -1 and can't be asked for.
+                if code_point >= 0:
+                    if code_points and code_point <= code_points[-1]:
+                        ordered = False
+                    code_points.append(code_point)
+                    offsets.append(start)
             elif line.startswith(b"SIZE"):
                 _, self.point_size, self.x_resolution, self.y_resolution = line.split()
-            elif line.startswith(b"COMMENT"):
-                pass
-            elif line.startswith(b"STARTCHAR"):
-                character = True
-            elif line.startswith(b"ENDCHAR"):
-                character = False
-                if desired_character:
-                    bounds = current_info["bounds"]
-                    shift = current_info["shift"]
-                    gc.collect()
-                    self._glyphs[code_point] = Glyph(
-                        current_info["bitmap"],
-                        0,
-                        bounds[0],
-                        bounds[1],
-                        bounds[2],
-                        bounds[3],
-                        shift[0],
-                        shift[1],
-                    )
-                    remaining.remove(code_point)
-                    if not remaining:
-                        return
-                desired_character = False
-            elif line.startswith(b"BBX"):
-                if desired_character:
-                    _, x, y, x_offset, y_offset = line.split()
-                    x = int(x)
-                    y = int(y)
-                    x_offset = int(x_offset)
-                    y_offset = int(y_offset)
-                    current_info["bounds"] = (x, y, x_offset, y_offset)
-                    current_info["bitmap"] = self.bitmap_class(x, y, 2)
-            elif line.startswith(b"BITMAP"):
-                if desired_character:
-                    rounded_x = x // 8
-                    if x % 8 > 0:
-                        rounded_x += 1
-                    bytes_per_row = rounded_x
-                    if bytes_per_row % 4 > 0:
-                        bytes_per_row += 4 - bytes_per_row % 4
-                    current_y = 0
+            offset += len(line)
+        if not ordered:
+            pairs = sorted(zip(code_points, offsets))
+            code_points = array("I", [pair[0] for pair in pairs])
+            offsets = array("I", [pair[1] for pair in pairs])
+        self._code_points = code_points
+        self._offsets = offsets
+
+    def _file_size(self) -> int:
+        return self.file.seek(0, 2)
+
+    def _read_index(self) -> bool:
+        """Load a saved index. Return False if it is missing or was built from another file."""
+        try:
+            with open(self.index_path, "rb") as index:
+                header = index.read(_INDEX_HEADER_SIZE)
+                if len(header) != _INDEX_HEADER_SIZE or header[:4] != _INDEX_MAGIC:
+                    return False
+                count = int.from_bytes(header[4:8], "little")
+                if int.from_bytes(header[8:12], "little") != self._file_size():
+                    return False
+                code_points = array("I", bytes(4 * count))
+                offsets = array("I", bytes(4 * count))
+                if index.readinto(code_points) != 4 * count or index.readinto(offsets) != 4 * count:
+                    return False
+        except OSError:
+            return False
+        for i in (0, count - 1) if count else ():
+            self.file.seek(offsets[i])
+            if not self.file.readline().startswith(b"STARTCHAR"):
+                return False
+        self._code_points = code_points
+        self._offsets = offsets
+        # The full scan would have found SIZE; it is in the header.
+        self.file.seek(0)
+        while True:
+            line = self.file.readline()
+            if not line or line.startswith(b"CHARS "):
+                break
+            if line.startswith(b"SIZE"):
+                _, self.point_size, self.x_resolution, self.y_resolution = line.split()
+        return True
+
+    def _write_index(self) -> None:
+        count = len(self._code_points)
+        try:
+            with open(self.index_path, "wb") as index:
+                index.write(_INDEX_MAGIC)
+                index.write(count.to_bytes(4, "little"))
+                index.write(self._file_size().to_bytes(4, "little"))
+                index.write(self._code_points)
+                index.write(self._offsets)
+        except OSError:
+            # CIRCUITPY is read-only to code unless boot.py remounts it.
+            pass
+
+    def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        remaining = self._to_load(code_points)
+        if not remaining:
+            return
+
+        if self._code_points is None:
+            self._load_index()
+        if self._load_indexed(remaining):
+            return
+        # A glyph was not where the index said; the font has changed.
+        self._build_index()
+        if self.index_path is not None:
+            self._write_index()
+        self._load_indexed([c for c in remaining if self._glyphs.get(c) is None])
+
+    def _load_indexed(self, code_points: List[int]) -> bool:
+        """Load ``code_points`` from the offsets in the index. Return False if
+        any glyph was not found at its offset."""
+        indexed = self._code_points
+        found = []
+        for code_point in code_points:
+            i = lower_bound(indexed, code_point)
+            if i < len(indexed) and indexed[i] == code_point:
+                found.append((self._offsets[i], code_point))
+        if not found:
+            return True
+        # Read forward through the file.
+        found.sort()
+        # Batch creation of glyphs and bitmaps so that we need only gc.collect
+        # once
+        gc.collect()
+        ok = True
+        for offset, code_point in found:
+            if not self._load_glyph(offset, code_point):
+                ok = False
+        return ok
+
+    def _load_glyph(self, offset: int, code_point: int) -> bool:
+        """Parse the glyph for ``code_point`` whose STARTCHAR line is at ``offset``
+        into the cache. Return False, loading nothing, if it is not there."""
+        bitmap = None
+        bounds = None
+        shift = None
+        in_bitmap = False
+        current_y = 0
+        rounded_x = 1
+        row_mask = 0xFF
+        packed = None
+
+        self.file.seek(offset)
+        if not self.file.readline().startswith(b"STARTCHAR"):
+            return False
+        while True:
+            line = self.file.readline()
+            if not line or line.startswith(b"ENDCHAR"):
+                break
+            if in_bitmap:
+                # Rows are hex, most significant bit first; keep them packed.
+                bits = int(line.strip(), 16) & row_mask
+                row = current_y * rounded_x
+                packed[row : row + rounded_x] = bits.to_bytes(rounded_x, "big")
+                current_y += 1
             elif line.startswith(b"ENCODING"):
-                _, code_point = line.split()
-                code_point = int(code_point)
-                if code_point in remaining:
-                    desired_character = True
-                    current_info = {"bitmap": None, "bounds": None, "shift": None}
+                if int(line.split()[1]) != code_point:
+                    return False
+            elif line.startswith(b"BBX"):
+                _, x, y, x_offset, y_offset = line.split()
+                bounds = (int(x), int(y), int(x_offset), int(y_offset))
+                bitmap = self.bitmap_class(bounds[0], bounds[1], 2)
             elif line.startswith(b"DWIDTH"):
-                if desired_character:
-                    _, shift_x, shift_y = line.split()
-                    shift_x = int(shift_x)
-                    shift_y = int(shift_y)
-                    current_info["shift"] = (shift_x, shift_y)
-            elif line.startswith(b"SWIDTH"):
-                pass
-            elif character:
-                if desired_character:
-                    bits = int(line.strip(), 16)
-                    width = current_info["bounds"][0]
-                    start = current_y * width
-                    x = 0
-                    for i in range(rounded_x):
-                        val = (bits >> ((rounded_x - i - 1) * 8)) & 0xFF
-                        for j in range(7, -1, -1):
-                            if x >= width:
-                                break
-                            bit = 0
-                            if val & (1 << j) != 0:
-                                bit = 1
-                            current_info["bitmap"][start + x] = bit
-                            x += 1
-                    current_y += 1
-            elif metadata:
-                pass
+                _, shift_x, shift_y = line.split()
+                shift = (int(shift_x), int(shift_y))
+            elif line.startswith(b"BITMAP"):
+                rounded_x = bounds[0] // 8
+                if bounds[0] % 8 > 0:
+                    rounded_x += 1
+                row_mask = (1 << (8 * rounded_x)) - 1
+                packed = bytearray(rounded_x * bounds[1])
+                in_bitmap = True
+
+        if packed is not None:
+            _fill(bitmap, packed, bounds[0], bounds[1], rounded_x)
+        self._glyphs[code_point] = Glyph(
+            bitmap,
+            0,
+            bounds[0],
+            bounds[1],
+            bounds[2],
+            bounds[3],
+            shift[0],
+            shift[1],
+        )
+        return True
+
+
+def _bit_positions() -> list:
+    """Return, for each byte value, the positions of its set bits, MSB first as 0."""
+    global _BIT_POSITIONS  # pylint: disable=global-statement
+    if _BIT_POSITIONS is None:
+        _BIT_POSITIONS = [
+            bytes(k for k in range(8) if value & (128 >> k)) for value in range(256)
+        ]
+    return _BIT_POSITIONS
+
+
+def _fill(bitmap: Bitmap, packed: bytearray, width: int, height: int, row_bytes: int) -> None:
+    """Set the pixels of a new, blank ``bitmap`` from rows of packed bits."""
+    if _bitmap_readinto:
+        _bitmap_readinto(
+            bitmap,
+            BytesIO(packed),
+            bits_per_pixel=1,
+            element_size=1,
+            reverse_pixels_in_element=True,
+        )
+        return
+    # The bitmap starts blank, so only the set bits need writing.
+    positions = _bit_positions()
+    start = 0
+    i = 0
+    for _ in range(height):
+        for x in range(0, 8 * row_bytes, 8):
+            value = packed[i]
+            i += 1
+            if value:
+                for k in positions[value]:
+                    if x + k < width:
+                        bitmap[start + x + k] = 1
+        start += width
+
@@ -27,7 +27,7 @@ try:
 
     from displayio import Bitmap
 
-    from . import bdf, lvfontbin, pcf, ttf
+    from . import bdf, lvfontbin, mkf, pcf, ttf
 except ImportError:
     pass
 
@@ -42,7 +42,7 @@ LVGL_HEADER_SIZE = b"\x30\x00\x00\x00"
 
 def load_font(
     filename: str, bitmap: Optional[Bitmap] = None
-) -> Union[bdf.BDF, lvfontbin.LVGLFont, pcf.PCF, ttf.TTF]:
+) -> Union[bdf.BDF, lvfontbin.LVGLFont, mkf.MKF, pcf.PCF, ttf.TTF]:
     """Loads a font file. Returns None if unsupported."""
     if not bitmap:
         import displayio
@@ -58,6 +58,10 @@ def load_font(
         from . import pcf
 
         return pcf.PCF(font_file, bitmap)
+    if filename.endswith("mkf") and first_four == b"MKF1":
+        from . import mkf
+
+        return mkf.MKF(font_file, bitmap)
     if filename.endswith("ttf") and first_four == b"\x00\x01\x00\x00":
         from . import ttf
 
@@ -23,35 +23,188 @@ Implementation Notes
 """
 
 try:
-    from typing import Iterable, Union
+    from typing import Iterable, List, Optional, Union
 
     from fontio import Glyph
 except ImportError:
     pass
 
-import gc
+from micropython import const
 
 __version__ = "2.3.1"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
 
+# Rough RAM cost of a Glyph and its Bitmap objects, apart from the pixels.
+_GLYPH_OVERHEAD = const(64)
+# Rough RAM cost of remembering that the font has no glyph for a code point.
+_MISSING_GLYPH = const(16)
+
+
+def _cost(glyph: Optional[Glyph]) -> int:
+    if glyph is None:
+        return _MISSING_GLYPH
+    # displayio.Bitmap rows are whole 32-bit words; glyphs are 1 bit per pixel.
+    return _GLYPH_OVERHEAD + 4 * ((glyph.width + 31) // 32) * glyph.height
+
+
+class _GlyphStore:
+    """Glyphs by code point within a byte budget, evicted in CLOCK order.
+
+    Entries join a ring just behind a hand. Eviction sweeps the ring from
+    the hand: an entry used since the hand last passed gets a second
+    chance, anything else is dropped. Lookups stay plain dict lookups.
+    """
+
+    def __init__(self) -> None:
+        self._entries = {}
+        self._ring = []
+        self._hand = 0
+        self._referenced = set()
+        self._pins = {}
+        self.budget = None
+        self.size = 0
+        self.evictions = 0
+
+    def __contains__(self, code_point: int) -> bool:
+        return code_point in self._entries
+
+    def __getitem__(self, code_point: int) -> Optional[Glyph]:
+        return self._entries[code_point]
+
+    def get(self, code_point: int, default: Optional[Glyph] = None) -> Optional[Glyph]:
+        return self._entries.get(code_point, default)
+
+    def __setitem__(self, code_point: int, glyph: Optional[Glyph]) -> None:
+        entries = self._entries
+        if code_point in entries:
+            self.size -= _cost(entries[code_point])
+        else:
+            # Just behind the hand, so a sweep reaches it last.
+            self._ring.insert(self._hand, code_point)
+            self._hand += 1
+        entries[code_point] = glyph
+        self.size += _cost(glyph)
+        if self.budget is not None and self.size > self.budget:
+            self.evict(code_point)
+
+    def touch(self, code_point: int) -> Optional[Glyph]:
+        """Return the entry for ``code_point`` and mark it used."""
+        if self.budget is not None:
+            self._referenced.add(code_point)
+        return self._entries[code_point]
+
+    def pin(self, code_point: int) -> None:
+        self._pins[code_point] = self._pins.get(code_point, 0) + 1
+
+    def unpin(self, code_point: int) -> None:
+        count = self._pins.get(code_point, 0) - 1
+        if count > 0:
+            self._pins[code_point] = count
+        else:
+            self._pins.pop(code_point, None)
+
+    def evict(self, keep: Optional[int] = None) -> None:
+        """Drop unpinned entries other than ``keep`` from the hand on, giving
+        used ones a second chance, until within budget."""
+        entries = self._entries
+        ring = self._ring
+        referenced = self._referenced
+        pins = self._pins
+        hand = self._hand
+        # Two turns clear every reference; pinned entries may still be over.
+        steps = 2 * len(ring)
+        while self.size > self.budget and steps:
+            steps -= 1
+            if hand >= len(ring):
+                hand = 0
+            code_point = ring[hand]
+            if code_point in referenced:
+                referenced.remove(code_point)
+                hand += 1
+            elif code_point in pins or code_point == keep:
+                hand += 1
+            else:
+                ring.pop(hand)
+                self.size -= _cost(entries.pop(code_point))
+                self.evictions += 1
+        self._hand = hand
+
 
 class GlyphCache:
-    """Caches glyphs loaded by a subclass."""
+    """Caches glyphs loaded by a subclass.
+
+    By default every glyph loaded stays cached. Set `cache_budget` to keep
+    the cache to about that many bytes, evicting glyphs not used since the
+    last sweep first. Glyphs of text on screen can be kept with `pin`.
+    """
 
     def __init__(self) -> None:
-        self._glyphs = {}
+        self._glyphs = _GlyphStore()
+        self.cache_hits = 0
+        """Number of `get_glyph` calls answered from the cache."""
+        self.cache_misses = 0
+        """Number of glyphs that had to be loaded from the font."""
+
+    @property
+    def cache_budget(self) -> Optional[int]:
+        """Approximate bytes of glyphs to keep cached, or None for no limit."""
+        return self._glyphs.budget
+
+    @cache_budget.setter
+    def cache_budget(self, budget: Optional[int]) -> None:
+        self._glyphs.budget = budget
+        if budget is not None and self._glyphs.size > budget:
+            self._glyphs.evict()
+
+    @property
+    def cache_size(self) -> int:
+        """Approximate bytes of glyphs cached."""
+        return self._glyphs.size
+
+    @property
+    def cache_evictions(self) -> int:
+        """Number of glyphs dropped to stay within `cache_budget`."""
+        return self._glyphs.evictions
+
+    def pin(self, code_points: Union[str, Iterable[int]]) -> None:
+        """Keep the glyphs for ``code_points`` cached until `unpin` is called as many times."""
+        glyphs = self._glyphs
+        for code_point in code_points:
+            glyphs.pin(ord(code_point) if isinstance(code_point, str) else code_point)
+
+    def unpin(self, code_points: Union[str, Iterable[int]]) -> None:
+        """Undo a `pin` of the same ``code_points``."""
+        glyphs = self._glyphs
+        for code_point in code_points:
+            glyphs.unpin(ord(code_point) if isinstance(code_point, str) else code_point)
+        budget = glyphs.budget
+        if budget is not None and glyphs.size > budget:
+            glyphs.evict()
 
     def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
         """Loads displayio.Glyph objects into the GlyphCache from the font."""
 
+    def _to_load(self, code_points: Union[int, str, Iterable[int]]) -> List[int]:
+        """Return the distinct ``code_points`` not cached yet, counting each as a miss."""
+        if isinstance(code_points, int):
+            code_points = (code_points,)
+        elif isinstance(code_points, str):
+            code_points = [ord(c) for c in code_points]
+        glyphs = self._glyphs
+        to_load = [c for c in set(code_points) if glyphs.get(c) is None]
+        self.cache_misses += len(to_load)
+        return to_load
+
     def get_glyph(self, code_point: int) -> Glyph:
         """Returns a displayio.Glyph for the given code point or None is unsupported."""
         if code_point in self._glyphs:
-            return self._glyphs[code_point]
+            self.cache_hits += 1
+            return self._glyphs.touch(code_point)
 
         code_points = set()
         code_points.add(code_point)
         self._glyphs[code_point] = None
+        # Loaders collect garbage once per batch; callers with several glyphs
+        # to show should pass them all to load_glyphs first.
         self.load_glyphs(code_points)
-        gc.collect()
-        return self._glyphs[code_point]
+        return self._glyphs.get(code_point)
@@ -189,13 +189,8 @@ class LVGLFont(GlyphCache):
 
     def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
         # pylint: disable=too-many-statements,too-many-branches,too-many-nested-blocks,too-many-locals
-        if isinstance(code_points, int):
-            code_points = (code_points,)
-        elif isinstance(code_points, str):
-            code_points = [ord(c) for c in code_points]
-
         # Only load glyphs that aren't already cached
-        code_points = sorted(c for c in code_points if self._glyphs.get(c, None) is None)
+        code_points = sorted(self._to_load(code_points))
         if not code_points:
             return
 
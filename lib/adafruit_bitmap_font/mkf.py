@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2025 temidaradev
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.mkf`
+====================================================
+
+Loads MKF format fonts: a compact binary font made from a BDF or PCF font by
+``tools/mkfont.py``.
+
+* Author(s): temidaradev
+
+Implementation Notes
+--------------------
+
+All numbers are little-endian. The file is:
+
+* a header: magic ``MKF1``, glyph count (uint32), font bounding box width,
+  height, x offset and y offset, ascent and descent (int16 each);
+* the code points of all glyphs (uint32 each), sorted;
+* one metrics record per glyph, in the same order: width, height (uint8),
+  x offset, y offset (int8), x shift, y shift (int16) and the offset of its
+  rows in the bitmap data (uint32);
+* the bitmap data: each glyph's rows, 1 bit per pixel, most significant bit
+  first, each row padded to a whole byte.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from io import FileIO
+    from typing import Iterable, Tuple, Union
+
+    from displayio import Bitmap
+except ImportError:
+    pass
+
+import gc
+import struct
+from array import array
+
+from fontio import Glyph
+from lower_bound import lower_bound
+
+from .glyph_cache import GlyphCache
+
+try:
+    from bitmaptools import readinto as _bitmap_readinto
+except ImportError:
+    _bitmap_readinto = None
+
+MAGIC = b"MKF1"
+HEADER_FORMAT = "<4sIhhhhhh"
+METRICS_FORMAT = "<BBbbhhI"
+_HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+_METRICS_SIZE = struct.calcsize(METRICS_FORMAT)
+
+
+class MKF(GlyphCache):
+    """Loads glyphs from an MKF file in the given bitmap_class.
+
+    Only the code point table is kept in RAM. Loading a glyph is a binary
+    search of that table, one metrics record read and one bulk read of its
+    rows straight into the bitmap.
+    """
+
+    def __init__(self, f: FileIO, bitmap_class: Bitmap) -> None:
+        super().__init__()
+        self.file = f
+        self.name = f
+        self.bitmap_class = bitmap_class
+        f.seek(0)
+        header = f.read(_HEADER_SIZE)
+        if len(header) != _HEADER_SIZE or header[:4] != MAGIC:
+            raise ValueError("Unsupported file version")
+        _, count, width, height, x_offset, y_offset, ascent, descent = struct.unpack(
+            HEADER_FORMAT, header
+        )
+        self._bounding_box = (width, height, x_offset, y_offset)
+        self._ascent = ascent
+        self._descent = descent
+        self._code_points = array("I", bytes(4 * count))
+        f.readinto(self._code_points)
+        self._metrics_offset = _HEADER_SIZE + 4 * count
+        self._bitmaps_offset = self._metrics_offset + _METRICS_SIZE * count
+        self._record = bytearray(_METRICS_SIZE)
+
+    @property
+    def ascent(self) -> int:
+        """The number of pixels above the baseline of a typical ascender"""
+        return self._ascent
+
+    @property
+    def descent(self) -> int:
+        """The number of pixels below the baseline of a typical descender"""
+        return self._descent
+
+    def get_bounding_box(self) -> Tuple[int, int, int, int]:
+        """Return the maximum glyph size as a 4-tuple of: width, height, x_offset, y_offset"""
+        return self._bounding_box
+
+    def _index(self, code_point: int) -> int:
+        """Return the glyph index of ``code_point``, or -1 if the font doesn't have it."""
+        code_points = self._code_points
+        low = lower_bound(code_points, code_point)
+        if low < len(code_points) and code_points[low] == code_point:
+            return low
+        return -1
+
+    def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        code_points = sorted(self._to_load(code_points))
+        if not code_points:
+            return
+
+        # Sorted code points mean forward reads through the metrics table.
+        all_metrics = []
+        for code_point in code_points:
+            index = self._index(code_point)
+            if index < 0:
+                continue
+            self.file.seek(self._metrics_offset + _METRICS_SIZE * index)
+            self.file.readinto(self._record)
+            all_metrics.append((code_point, struct.unpack(METRICS_FORMAT, self._record)))
+        if not all_metrics:
+            return
+
+        # Batch creation of glyphs and bitmaps so that we need only gc.collect
+        # once
+        gc.collect()
+        for code_point, metrics in all_metrics:
+            width, height, x_offset, y_offset, shift_x, shift_y, offset = metrics
+            bitmap = self.bitmap_class(width, height, 2)
+            self._glyphs[code_point] = Glyph(
+                bitmap, 0, width, height, x_offset, y_offset, shift_x, shift_y
+            )
+            self.file.seek(self._bitmaps_offset + offset)
+            if _bitmap_readinto:
+                _bitmap_readinto(
+                    bitmap,
+                    self.file,
+                    bits_per_pixel=1,
+                    element_size=1,
+                    reverse_pixels_in_element=True,
+                )
+            else:
+                buf = bytearray((width + 7) // 8)
+                start = 0
+                for _ in range(height):
+                    self.file.readinto(buf)
+                    for k in range(width):
+                        if buf[k // 8] & (128 >> (k % 8)):
+                            bitmap[start + k] = 1
+                    start += width
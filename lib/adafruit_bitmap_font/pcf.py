@@ -300,12 +300,7 @@ class PCF(GlyphCache):
                 yield (string_map[name_offset], value)
 
     def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
-        if isinstance(code_points, int):
-            code_points = (code_points,)
-        elif isinstance(code_points, str):
-            code_points = [ord(c) for c in code_points]
-
-        code_points = sorted(c for c in code_points if self._glyphs.get(c, None) is None)
+        code_points = sorted(self._to_load(code_points))
         if not code_points:
             return
 
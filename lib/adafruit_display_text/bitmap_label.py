@@ -163,6 +163,10 @@ class Label(LabelBase):
         else:  # The text string is not empty, so create the Bitmap and TileGrid and
             # append to the self Group
 
+            # Load the missing glyphs as one batch before measuring and drawing.
+            if hasattr(self._font, "load_glyphs"):
+                self._font.load_glyphs(text)
+
             # Calculate the text bounding box
 
             # Calculate both "tight" and "loose" bounding box dimensions to match label for
@@ -84,6 +84,8 @@ class Label(LabelBase):
     def __init__(self, font: FontProtocol, **kwargs) -> None:
         self._background_palette = Palette(1)
         self._added_background_tilegrid = False
+        # Text whose glyphs are pinned in the font's cache.
+        self._pinned_text = ""
 
         super().__init__(font, **kwargs)
 
@@ -226,6 +228,14 @@ class Label(LabelBase):
             self._added_background_tilegrid = False
 
     def _update_text(self, new_text: str) -> None:
+        # Keep the glyphs on screen in the font's cache while they are shown.
+        if hasattr(self._font, "pin"):
+            self._font.pin(new_text)
+            self._font.unpin(self._pinned_text)
+            self._pinned_text = new_text
+        # Fault in every missing glyph as one batch, not one per character.
+        if hasattr(self._font, "load_glyphs"):
+            self._font.load_glyphs(new_text)
         x = 0
         y = 0
         if self._added_background_tilegrid:
@@ -397,6 +407,9 @@ class Label(LabelBase):
     def _set_font(self, new_font: FontProtocol) -> None:
         old_text = self._text
         current_anchored_position = self.anchored_position
+        if hasattr(self._font, "unpin"):
+            self._font.unpin(self._pinned_text)
+            self._pinned_text = ""
         self._text = ""
         self._font = new_font
         self._height = self._font.get_bounding_box()[1]
@@ -22,7 +22,7 @@ except ImportError:
     supervisor = None
 
 try:
-    from typing import Sequence
+    from typing import Callable, Optional, Sequence
 except ImportError:
     pass
 
@@ -42,6 +42,7 @@ def find_device(
     usage_page: int,
     usage: int,
     timeout: int = None,
+    wait: bool = True,
 ) -> object:
     """
     Search through the provided sequence of devices to find the one with the matching
@@ -50,6 +51,9 @@ def find_device(
     :param timeout: Time in seconds to wait for USB to become ready before timing out.
       Defaults to None to wait indefinitely.
       Ignored if device is not a `usb_hid.Device`; it might be BLE, for instance.
+    :param wait: If False, return at once. A `usb_hid.Device` is then wrapped in a
+      `DeferredDevice`, which queues reports until USB is ready, and ``timeout``
+      is ignored.
     """
 
     if hasattr(devices, "send_report"):
@@ -64,6 +68,8 @@ def find_device(
 
     # Wait for USB to be connected only if this is a usb_hid.Device.
     if Device and isinstance(device, Device):
+        if not wait:
+            return DeferredDevice(device)
         if supervisor is None:
             # Blinka doesn't have supervisor (see issue Adafruit_Blinka#711), so wait
             # one second for USB to become ready
@@ -81,3 +87,81 @@ def find_device(
             raise OSError("Failed to initialize HID device. Is USB connected?")
 
     return device
+
+
+class DeferredDevice:
+    """Wraps a `usb_hid.Device` that can be used before USB is ready.
+
+    Reports sent before the host has enumerated the device are queued and are
+    sent in order once USB is ready. Each report is the whole state of its
+    report ID, so once ``queue_size`` are queued a new report replaces the
+    queued ones with the same ID rather than pushing out the oldest. The host
+    then starts from the latest state, and a release is never lost behind
+    the press it ends. Call `poll` from a loop or task so the queue is sent
+    even when no new report is; ``on_ready`` is called once, right after the
+    queue is flushed.
+
+    Use ``find_device(..., wait=False)`` to get one::
+
+        device = find_device(usb_hid.devices, usage_page=0x0C, usage=0x01, wait=False)
+        cc = ConsumerControl(device)
+    """
+
+    def __init__(
+        self, device: object, on_ready: Callable[[], None] = None, queue_size: int = 8
+    ) -> None:
+        self._device = device
+        self.usage_page = device.usage_page
+        self.usage = device.usage
+        self.on_ready = on_ready
+        """Called with no arguments when USB first becomes ready."""
+        self.ready = False
+        """True once USB is ready and queued reports have been sent."""
+        self._queue = []
+        self._queue_size = queue_size
+        self.replaced = 0
+        """Number of queued reports replaced by a later report with the same ID."""
+        self._created = time.monotonic()
+
+    def _connected(self) -> bool:
+        if supervisor is None:
+            # Blinka doesn't have supervisor; assume USB is ready after one second,
+            # as find_device does.
+            return time.monotonic() - self._created >= 1.0
+        return supervisor.runtime.usb_connected
+
+    def poll(self) -> bool:
+        """Send queued reports if USB has become ready. Return `ready`."""
+        if not self.ready and self._connected():
+            queue = self._queue
+            self._queue = []
+            for report, report_id in queue:
+                self._send(report, report_id)
+            self.ready = True
+            if self.on_ready is not None:
+                self.on_ready()
+        return self.ready
+
+    def send_report(self, report: bytearray, report_id: Optional[int] = None) -> None:
+        """Send ``report``, or queue a copy of it if USB is not ready yet."""
+        if self.ready or self.poll():
+            self._send(report, report_id)
+            return
+        queue = self._queue
+        if len(queue) >= self._queue_size:
+            kept = [entry for entry in queue if entry[1] != report_id]
+            self.replaced += len(queue) - len(kept)
+            self._queue = queue = kept
+        queue.append((bytes(report), report_id))
+
+    def _send(self, report: bytearray, report_id: Optional[int]) -> None:
+        if report_id is None:
+            self._device.send_report(report)
+        else:
+            self._device.send_report(report, report_id)
+
+    def get_last_received_report(self, report_id: Optional[int] = None) -> Optional[bytes]:
+        """Pass through to the wrapped device."""
+        if report_id is None:
+            return self._device.get_last_received_report()
+        return self._device.get_last_received_report(report_id)
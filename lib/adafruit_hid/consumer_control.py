@@ -61,7 +61,7 @@ class ConsumerControl:
             consumer_control.send(ConsumerControlCode.SCAN_NEXT_TRACK)
         """
         self.press(consumer_code)
-        self.release()
+        self.release(consumer_code)
 
     def press(self, consumer_code: int) -> None:
         """Send a report to indicate that the given key has been pressed.
@@ -82,10 +82,13 @@ class ConsumerControl:
         struct.pack_into("<H", self._report, 0, consumer_code)
         self._consumer_device.send_report(self._report)
 
-    def release(self) -> None:
+    def release(self, consumer_code: int = None) -> None:
         """Send a report indicating that the consumer control key has been
         released. Only one consumer control key can be pressed at a time.
 
+        :param consumer_code: the code to release. If another code has been
+          pressed since, it stays pressed. Defaults to None to release whatever is pressed.
+
         Examples::
 
             from adafruit_hid.consumer_control_code import ConsumerControlCode
@@ -95,5 +98,7 @@ class ConsumerControl:
             time.sleep(0.5)
             consumer_control.release()
         """
+        if consumer_code is not None and struct.unpack_from("<H", self._report)[0] != consumer_code:
+            return
         self._report[0] = self._report[1] = 0x0
         self._consumer_device.send_report(self._report)
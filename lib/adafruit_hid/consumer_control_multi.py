@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: 2025 temidaradev
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.consumer_control_multi.MultiConsumerControl`
+====================================================
+
+Consumer control reports that hold several codes at once.
+
+* Author(s): temidaradev
+"""
+
+import struct
+
+from . import find_device
+from .consumer_control import ConsumerControl
+
+try:
+    from typing import Sequence
+
+    import usb_hid
+except ImportError:
+    pass
+
+
+def consumer_report_descriptor(slots: int = 4, report_id: int = 3) -> bytes:
+    """Return the HID report descriptor for a `MultiConsumerControl` with ``slots`` codes."""
+    return bytes(
+        (
+            0x05, 0x0C,  # Usage Page (Consumer)
+            0x09, 0x01,  # Usage (Consumer Control)
+            0xA1, 0x01,  # Collection (Application)
+            0x85, report_id,  # Report ID
+            0x75, 0x10,  # Report Size (16)
+            0x95, slots,  # Report Count (slots)
+            0x15, 0x01,  # Logical Minimum (1)
+            0x26, 0x8C, 0x02,  # Logical Maximum (652)
+            0x19, 0x01,  # Usage Minimum (1)
+            0x2A, 0x8C, 0x02,  # Usage Maximum (652)
+            0x81, 0x00,  # Input (Data, Array, Absolute)
+            0xC0,  # End Collection
+        )
+    )  # fmt: skip
+
+
+def consumer_device(slots: int = 4, report_id: int = 3) -> usb_hid.Device:
+    """Create the `usb_hid.Device` for a `MultiConsumerControl`, for use in ``boot.py``
+    in place of ``usb_hid.Device.CONSUMER_CONTROL``::
+
+        import usb_hid
+        from adafruit_hid.consumer_control_multi import consumer_device
+
+        usb_hid.enable((usb_hid.Device.KEYBOARD, consumer_device(slots=4)))
+    """
+    import usb_hid  # pylint: disable=import-outside-toplevel
+
+    return usb_hid.Device(
+        report_descriptor=consumer_report_descriptor(slots, report_id),
+        usage_page=0x0C,
+        usage=0x01,
+        report_ids=(report_id,),
+        in_report_lengths=(2 * slots,),
+        out_report_lengths=(0,),
+    )
+
+
+class MultiConsumerControl(ConsumerControl):
+    """Send consumer control reports with room for several codes, so one can be
+    tapped while another is held, such as next track while holding volume up.
+
+    Each code's slot is kept in a dict and free slots on a stack, so pressing
+    and releasing are constant time however many slots there are.
+    """
+
+    def __init__(
+        self, devices: Sequence[usb_hid.Device], slots: int = 4, timeout: int = None
+    ) -> None:
+        """Create a MultiConsumerControl object that will send multi-code consumer reports.
+
+        :param devices: a device created with `consumer_device`, or a sequence holding one.
+        :param slots: number of codes in a report. Must match the device.
+        :param timeout: Time in seconds to wait for USB to become ready before timing out.
+          Defaults to None to wait indefinitely.
+        """
+        self._consumer_device = find_device(devices, usage_page=0x0C, usage=0x01, timeout=timeout)
+
+        # Two bytes for each slot; zero is an empty slot.
+        self._report = bytearray(2 * slots)
+        self._slot_of = {}
+        # Free slot indexes; the top of the stack is _free[_free_count - 1].
+        self._free = bytearray(range(slots - 1, -1, -1))
+        self._free_count = slots
+
+    def press(self, consumer_code: int) -> None:
+        """Send a report to indicate that the given code has been pressed.
+        Codes already pressed stay pressed.
+
+        :param consumer_code: a 16-bit consumer control code.
+        :raises ValueError: if every slot is already in use.
+        """
+        if consumer_code not in self._slot_of:
+            if not self._free_count:
+                raise ValueError("Trying to press more consumer codes than there are slots.")
+            self._free_count -= 1
+            slot = self._free[self._free_count]
+            self._slot_of[consumer_code] = slot
+            struct.pack_into("<H", self._report, 2 * slot, consumer_code)
+        self._consumer_device.send_report(self._report)
+
+    def release(self, consumer_code: int = None) -> None:
+        """Send a report indicating that the consumer control code has been released.
+
+        :param consumer_code: the code to release. Defaults to None to release all codes.
+        """
+        if consumer_code is None:
+            self._release_all()
+        else:
+            slot = self._slot_of.pop(consumer_code, None)
+            if slot is not None:
+                self._report[2 * slot] = self._report[2 * slot + 1] = 0
+                self._free[self._free_count] = slot
+                self._free_count += 1
+        self._consumer_device.send_report(self._report)
+
+    def _release_all(self) -> None:
+        report = self._report
+        for i in range(len(report)):
+            report[i] = 0
+        self._slot_of.clear()
+        slots = len(report) // 2
+        for i in range(slots):
+            self._free[i] = slots - 1 - i
+        self._free_count = slots
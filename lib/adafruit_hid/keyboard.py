@@ -64,6 +64,11 @@ class Keyboard:
         # View onto bytes 2-7 in report.
         self.report_keys = memoryview(self.report)[2:]
 
+        # Reverse index: 1 + the slot holding each pressed keycode, or 0.
+        self._key_slots = bytearray(256)
+        # Number of used slots. Used slots are always report_keys[0:_key_count].
+        self._key_count = 0
+
         # No keyboard LEDs on.
         self._led_status = b"\x00"
 
@@ -111,8 +116,11 @@ class Keyboard:
 
     def release_all(self) -> None:
         """Release all pressed keys."""
+        key_slots = self._key_slots
         for i in range(8):
+            key_slots[self.report[i]] = 0
             self.report[i] = 0
+        self._key_count = 0
         self._keyboard_device.send_report(self.report)
 
     def send(self, *keycodes: int) -> None:
@@ -129,23 +137,31 @@ class Keyboard:
         if modifier:
             # Set bit for this modifier.
             self.report_modifier[0] |= modifier
+            return
+        key_slots = self._key_slots
+        if key_slots[keycode]:
+            # Already pressed.
+            return
+        report_keys = self.report_keys
+        count = self._key_count
+        if count < _MAX_KEYPRESSES:
+            # Put keycode in first empty slot.
+            if keycode:
+                report_keys[count] = keycode
+                key_slots[keycode] = count + 1
+                self._key_count = count + 1
+            return
+        # All slots are filled. Shuffle down and reuse last slot
+        key_slots[report_keys[0]] = 0
+        for i in range(_MAX_KEYPRESSES - 1):
+            pressed = report_keys[i + 1]
+            report_keys[i] = pressed
+            key_slots[pressed] = i + 1
+        report_keys[-1] = keycode
+        if keycode:
+            key_slots[keycode] = _MAX_KEYPRESSES
         else:
-            report_keys = self.report_keys
-            # Don't press twice.
-            for i in range(_MAX_KEYPRESSES):
-                report_key = report_keys[i]
-                if report_key == 0:
-                    # Put keycode in first empty slot. Since the report_keys
-                    # are compact and unique, this is not a repeated key
-                    report_keys[i] = keycode
-                    return
-                if report_key == keycode:
-                    # Already pressed.
-                    return
-            # All slots are filled. Shuffle down and reuse last slot
-            for i in range(_MAX_KEYPRESSES - 1):
-                report_keys[i] = report_keys[i + 1]
-            report_keys[-1] = keycode
+            self._key_count = _MAX_KEYPRESSES - 1
 
     def _remove_keycode_from_report(self, keycode: int) -> None:
         """Remove a single keycode from the report."""
@@ -153,23 +169,21 @@ class Keyboard:
         if modifier:
             # Turn off the bit for this modifier.
             self.report_modifier[0] &= ~modifier
-        else:
-            report_keys = self.report_keys
-            # Clear the at most one matching slot and move remaining keys down
-            j = 0
-            for i in range(_MAX_KEYPRESSES):
-                pressed = report_keys[i]
-                if not pressed:
-                    break  # Handled all used report slots
-                if pressed == keycode:
-                    continue  # Remove this entry
-                if i != j:
-                    report_keys[j] = report_keys[i]
-                j += 1
-            # Clear any remaining slots
-            while j < _MAX_KEYPRESSES and report_keys[j]:
-                report_keys[j] = 0
-                j += 1
+            return
+        key_slots = self._key_slots
+        slot = key_slots[keycode]
+        if not slot:
+            return
+        key_slots[keycode] = 0
+        # Move the keys after it down one slot to keep the report compact and ordered.
+        report_keys = self.report_keys
+        count = self._key_count
+        for i in range(slot, count):
+            pressed = report_keys[i]
+            report_keys[i - 1] = pressed
+            key_slots[pressed] = i
+        report_keys[count - 1] = 0
+        self._key_count = count - 1
 
     @property
     def led_status(self) -> bytes:
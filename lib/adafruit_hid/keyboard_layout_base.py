@@ -16,11 +16,24 @@ try:
 except ImportError:
     pass
 
+from array import array
 from time import sleep
 
+from lower_bound import lower_bound
+
 __version__ = "6.1.7"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_HID.git"
 
+# Compiled character tables, one per layout class.
+_CHAR_TABLES = {}
+
+# Each compiled entry is 2 bytes: the modifiers and keycode of the character's
+# first stroke. Dead-key characters have _DEAD_KEY set in the modifiers, and
+# their second stroke is in a separate, much smaller table.
+_ENTRY_SIZE = 2
+# Right GUI; the strokes of a layout only ever hold Shift and AltGr.
+_DEAD_KEY = 0x80
+
 
 class KeyboardLayoutBase:
     """Base class for keyboard layouts. Uses the tables defined in the subclass
@@ -72,6 +85,87 @@ class KeyboardLayoutBase:
             layout = KeyboardLayout(kbd)
         """
         self.keyboard = keyboard
+        table = _CHAR_TABLES.get(type(self))
+        if table is None:
+            table = _CHAR_TABLES[type(self)] = self._compile_table()
+        self._char_table = table
+
+    def _compile_table(self) -> Tuple[bytes, array, bytes, array, bytes]:
+        """Build the compact table mapping each code point to its key strokes.
+
+        Every character the layout can type is resolved once, with the same
+        precedence the per-character lookups used: `ASCII_TO_KEYCODE`, then
+        `HIGHER_ASCII` by ord() value, then by character, then `COMBINED_KEYS`.
+
+        :returns: ``(ascii, code_points, higher, dead_code_points, dead)``.
+            ``ascii`` holds one entry per code point below 128. ``code_points`` is
+            the sorted array of the other code points and ``higher`` holds their
+            entries in the same order. ``dead_code_points`` and ``dead`` are the
+            same for the second strokes of dead-key characters.
+        """
+        entries = {}
+        seconds = {}
+        for char_val, keycode in enumerate(self.ASCII_TO_KEYCODE):
+            if keycode:
+                entries[char_val] = self._stroke(keycode, chr(char_val) in self.NEED_ALTGR)
+        for key, keycode in self.HIGHER_ASCII.items():
+            if isinstance(key, str):
+                char_val = ord(key)
+                if char_val >= len(self.ASCII_TO_KEYCODE) and keycode:
+                    entries[char_val] = self._stroke(keycode, key in self.NEED_ALTGR)
+        for key, keycode in self.HIGHER_ASCII.items():
+            if isinstance(key, int) and key >= len(self.ASCII_TO_KEYCODE) and keycode:
+                entries[key] = self._stroke(keycode, chr(key) in self.NEED_ALTGR)
+        for char_val, cchar in self.COMBINED_KEYS.items():
+            if char_val in entries:
+                continue
+            second = self._char_to_keycode(chr(cchar & 0xFF & (~self.ALTGR_FLAG)))
+            modifiers, keycode = self._stroke(cchar >> 8, cchar & self.ALTGR_FLAG)
+            entries[char_val] = (modifiers | _DEAD_KEY, keycode)
+            seconds[char_val] = self._stroke(second, False)
+
+        ascii_table = bytearray(_ENTRY_SIZE * 128)
+        code_points = array("L", sorted(c for c in entries if c >= 128))
+        higher = bytearray(_ENTRY_SIZE * len(code_points))
+        for char_val, entry in entries.items():
+            if char_val < 128:
+                offset = _ENTRY_SIZE * char_val
+                ascii_table[offset : offset + _ENTRY_SIZE] = bytes(entry)
+            else:
+                offset = _ENTRY_SIZE * lower_bound(code_points, char_val)
+                higher[offset : offset + _ENTRY_SIZE] = bytes(entry)
+        dead_code_points = array("L", sorted(seconds))
+        dead = bytearray(_ENTRY_SIZE * len(dead_code_points))
+        for index, char_val in enumerate(dead_code_points):
+            dead[_ENTRY_SIZE * index : _ENTRY_SIZE * (index + 1)] = bytes(seconds[char_val])
+        return bytes(ascii_table), code_points, bytes(higher), dead_code_points, bytes(dead)
+
+    def _find(self, char: str) -> Tuple[bytes, int]:
+        """Return the buffer and offset of the compiled entry for ``char``.
+
+        :raises ValueError: if there is no keycode for ``char``.
+        """
+        char_val = ord(char)
+        ascii_table, code_points, higher, _, _ = self._char_table
+        if char_val < 128:
+            offset = _ENTRY_SIZE * char_val
+            if ascii_table[offset + 1]:
+                return ascii_table, offset
+        else:
+            index = lower_bound(code_points, char_val)
+            if index < len(code_points) and code_points[index] == char_val:
+                return higher, _ENTRY_SIZE * index
+        raise ValueError(
+            "No keycode available for character {letter} ({num}/0x{num:02x}).".format(
+                letter=repr(char), num=char_val
+            )
+        )
+
+    def _second(self, char: str) -> Tuple[int, int]:
+        """Return the second stroke of dead-key character ``char``."""
+        _, _, _, dead_code_points, dead = self._char_table
+        offset = _ENTRY_SIZE * lower_bound(dead_code_points, ord(char))
+        return dead[offset], dead[offset + 1]
 
     def _write(self, keycode: int, altgr: bool = False) -> None:
         """Type a key combination based on shift bit and altgr bool
@@ -89,6 +183,16 @@ class KeyboardLayoutBase:
         self.keyboard.press(keycode)
         self.keyboard.release_all()
 
+    def _write_stroke(self, modifiers: int, keycode: int) -> None:
+        """Type one compiled ``(modifiers, keycode)`` stroke, sending the same
+        reports as `_write`."""
+        if modifiers & (1 << (self.RIGHT_ALT_CODE & 0x7)):
+            self.keyboard.press(self.RIGHT_ALT_CODE)
+        if modifiers & (1 << (self.SHIFT_CODE & 0x7)):
+            self.keyboard.press(self.SHIFT_CODE)
+        self.keyboard.press(keycode)
+        self.keyboard.release_all()
+
     def write(self, string: str, delay: float = None) -> None:
         """Type the string by pressing and releasing keys on my keyboard.
 
@@ -103,30 +207,65 @@ class KeyboardLayoutBase:
             layout.write('abc\\n')
         """
         for char in string:
-            # find easy ones first
-            keycode = self._char_to_keycode(char)
-            if keycode > 0:
-                self._write(keycode, char in self.NEED_ALTGR)
-            # find combined keys
-            elif ord(char) in self.COMBINED_KEYS:
-                # first key (including shift bit)
-                cchar = self.COMBINED_KEYS[ord(char)]
-                self._write(cchar >> 8, cchar & self.ALTGR_FLAG)
-                # second key (removing the altgr bit)
-                char = chr(cchar & 0xFF & (~self.ALTGR_FLAG))
-                keycode = self._char_to_keycode(char)
-                # assume no altgr needed for second key
-                self._write(keycode, False)
-            else:
-                raise ValueError(
-                    "No keycode available for character {letter} ({num}/0x{num:02x}).".format(
-                        letter=repr(char), num=ord(char)
-                    )
-                )
+            buffer, offset = self._find(char)
+            modifiers = buffer[offset]
+            self._write_stroke(modifiers & ~_DEAD_KEY, buffer[offset + 1])
+            if modifiers & _DEAD_KEY:
+                self._write_stroke(*self._second(char))
 
             if delay is not None:
                 sleep(delay)
 
+    def write_fast(self, string: str, delay: float = None) -> None:
+        """Type the string like `write`, but with about half as many reports.
+
+        Each character's modifiers and key go out in a single press report. When
+        the next character needs the same modifiers and a different key, its
+        press report replaces the previous key directly, without a release in
+        between. Keys are released only when the modifiers change, a key repeats,
+        and at the end.
+
+        :param string: A string of UTF-8 characters to convert to key presses and send.
+        :param float delay: Optional delay in seconds between key presses.
+        :raises ValueError: if any of the characters has no keycode
+            (such as some control characters).
+        """
+        keyboard = self.keyboard
+        send_report = keyboard._keyboard_device.send_report
+        report = keyboard.report
+        held_modifiers = 0
+        held_keycode = 0
+        try:
+            for char in string:
+                buffer, offset = self._find(char)
+                modifiers = buffer[offset]
+                keycode = buffer[offset + 1]
+                second = None
+                if modifiers & _DEAD_KEY:
+                    modifiers &= ~_DEAD_KEY
+                    second = self._second(char)
+                while True:
+                    if held_keycode:
+                        if modifiers != held_modifiers or keycode == held_keycode:
+                            keyboard.release_all()
+                        else:
+                            keyboard._remove_keycode_from_report(held_keycode)
+                    keyboard.report_modifier[0] = modifiers
+                    keyboard._add_keycode_to_report(keycode)
+                    send_report(report)
+                    held_modifiers = modifiers
+                    held_keycode = keycode
+                    if second is None:
+                        break
+                    modifiers, keycode = second
+                    second = None
+
+                if delay is not None:
+                    sleep(delay)
+        finally:
+            if held_keycode:
+                keyboard.release_all()
+
     def keycodes(self, char: str) -> Tuple[int, ...]:
         """Return a tuple of keycodes needed to type the given character.
 
@@ -146,24 +285,51 @@ class KeyboardLayoutBase:
             # Raises ValueError with a US layout because it's an unknown character
             keycode('é')
         """
-        keycode = self._char_to_keycode(char)
-        if keycode == 0:
+        buffer, offset = self._find(char)
+        if buffer[offset] & _DEAD_KEY:
+            # Dead-key characters need two strokes, which a keycode tuple cannot express.
             raise ValueError(
                 "No keycode available for character {letter} ({num}/0x{num:02x}).".format(
                     letter=repr(char), num=ord(char)
                 )
             )
 
+        modifiers = buffer[offset]
+        keycode = buffer[offset + 1]
         codes = []
-        if char in self.NEED_ALTGR:
+        if modifiers & (1 << (self.RIGHT_ALT_CODE & 0x7)):
             codes.append(self.RIGHT_ALT_CODE)
-        if keycode & self.SHIFT_FLAG:
-            codes.extend((self.SHIFT_CODE, keycode & ~self.SHIFT_FLAG))
-        else:
-            codes.append(keycode)
+        if modifiers & (1 << (self.SHIFT_CODE & 0x7)):
+            codes.append(self.SHIFT_CODE)
+        codes.append(keycode)
 
         return codes
 
+    def strokes(self, char: str) -> Tuple[Tuple[int, int], ...]:
+        """Return the key strokes needed to type the given character.
+
+        :param char: A single UTF8 character in a string.
+        :returns: tuple of ``(modifier_bits, keycode)`` pairs, one per stroke. Characters
+            typed with a dead key take two strokes. ``modifier_bits`` is the report
+            modifier byte (Shift and/or AltGr) to hold with ``keycode``.
+        :raises ValueError: if there is no keycode for ``char``.
+        """
+        buffer, offset = self._find(char)
+        modifiers = buffer[offset]
+        if modifiers & _DEAD_KEY:
+            return ((modifiers & ~_DEAD_KEY, buffer[offset + 1]), self._second(char))
+        return ((modifiers, buffer[offset + 1]),)
+
+    def _stroke(self, keycode: int, altgr: bool) -> Tuple[int, int]:
+        """Split a keycode with the shift bit into a modifier byte and a plain keycode."""
+        modifiers = 0
+        if altgr:
+            modifiers |= 1 << (self.RIGHT_ALT_CODE & 0x7)
+        if keycode & self.SHIFT_FLAG:
+            keycode &= ~self.SHIFT_FLAG
+            modifiers |= 1 << (self.SHIFT_CODE & 0x7)
+        return modifiers, keycode
+
     def _above128char_to_keycode(self, char: str) -> int:
         """Return keycode for above 128 utf8 codes.
 
@@ -185,7 +351,8 @@ class KeyboardLayoutBase:
         You must clear this bit before passing the keycode in a USB report.
         """
         char_val = ord(char)
-        if char_val > len(self.ASCII_TO_KEYCODE):
+        if char_val >= len(self.ASCII_TO_KEYCODE):
             return self._above128char_to_keycode(char)
         keycode = self.ASCII_TO_KEYCODE[char_val]
         return keycode
+
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2025 temidaradev
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.keyboard_layouts.LayoutRegistry`
+====================================================
+
+Find keyboard layout modules and load them only when they are first used.
+
+* Author(s): temidaradev
+"""
+
+import os
+
+try:
+    from typing import List
+
+    from .keyboard import Keyboard
+    from .keyboard_layout_base import KeyboardLayoutBase
+except ImportError:
+    pass
+
+_PREFIX = "keyboard_layout_"
+
+
+class LayoutRegistry:
+    """Keyboard layouts by name, imported and compiled on first use.
+
+    Layout modules are ``adafruit_hid/keyboard_layout_<name>.py`` (or ``.mpy``)
+    files that define ``KeyboardLayout``. Other modules can be added with
+    `register`. Nothing is imported until a layout is selected, so shipping
+    several layouts costs no RAM until one is used. Once loaded, a layout
+    and its compiled table stay cached, so switching back and forth allocates
+    nothing.
+
+    Example::
+
+        layouts = LayoutRegistry(kbd)
+        layouts.select("us").write("Hello")
+    """
+
+    def __init__(self, keyboard: Keyboard) -> None:
+        self.keyboard = keyboard
+        self._modules = {}
+        self._layouts = {}
+        self.active = None
+        """The layout most recently chosen with `select`."""
+        try:
+            directory = __file__.rsplit("/", 1)[0]
+            filenames = os.listdir(directory)
+        except (NameError, OSError):
+            # Frozen into the firmware: only registered layouts are available.
+            filenames = ()
+        for filename in filenames:
+            if not filename.startswith(_PREFIX):
+                continue
+            name, _, extension = filename[len(_PREFIX) :].partition(".")
+            if name != "base" and extension in ("py", "mpy"):
+                self._modules[name] = __name__.rsplit(".", 1)[0] + "." + _PREFIX + name
+
+    def register(self, name: str, module_name: str) -> None:
+        """Make the layout in module ``module_name`` available as ``name``."""
+        self._modules[name] = module_name
+
+    def available(self) -> List[str]:
+        """Return the names of all layouts that can be selected."""
+        return sorted(self._modules)
+
+    def get(self, name: str) -> KeyboardLayoutBase:
+        """Return the layout called ``name``, importing it the first time.
+
+        :raises KeyError: if there is no layout with that name.
+        """
+        layout = self._layouts.get(name)
+        if layout is None:
+            module = __import__(self._modules[name], None, None, ("KeyboardLayout",))
+            layout = self._layouts[name] = module.KeyboardLayout(self.keyboard)
+        return layout
+
+    def select(self, name: str) -> KeyboardLayoutBase:
+        """Make ``name`` the `active` layout and return it."""
+        self.active = self.get(name)
+        return self.active
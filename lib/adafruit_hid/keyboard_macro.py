@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: 2025 temidaradev
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.keyboard_macro`
+====================================================
+
+Compile text or key sequences into keyboard reports once, then stream them.
+
+* Author(s): temidaradev
+"""
+
+from time import monotonic_ns, sleep
+
+from .keycode import Keycode
+
+try:
+    from typing import Iterable, Union
+
+    from .keyboard import Keyboard
+    from .keyboard_layout_base import KeyboardLayoutBase
+except ImportError:
+    pass
+
+_REPORT_SIZE = 8
+
+
+class Macro:
+    """A precompiled stream of keyboard reports.
+
+    All reports live in one ``bytearray`` and are sent as ``memoryview`` slices,
+    so playing a macro allocates nothing and does no keycode lookups.
+
+    Reports have the layout of the keyboard the macro is compiled for: 8-byte
+    boot reports with up to six keys for `Keyboard`, or a modifier byte and a
+    key bitmap for `KeyboardNKRO`, which has no limit on keys.
+    """
+
+    def __init__(self, report_size: int = _REPORT_SIZE) -> None:
+        """
+        :param report_size: length of the keyboard's reports, ``len(keyboard.report)``.
+        """
+        self.report_size = report_size
+        self.reports = bytearray()
+
+    def __len__(self) -> int:
+        """Number of reports in the macro."""
+        return len(self.reports) // self.report_size
+
+    def add_report(self, modifiers: int = 0, *keycodes: int) -> None:
+        """Append a report with the given modifier byte and keycodes.
+
+        :raises ValueError: if a boot report would need more than six keycodes, or a
+            keycode is outside an NKRO bitmap.
+        """
+        report = bytearray(self.report_size)
+        report[0] = modifiers
+        if self.report_size == _REPORT_SIZE:
+            if len(keycodes) > 6:
+                raise ValueError("No more than six regular keys may be pressed at once.")
+            for i, keycode in enumerate(keycodes):
+                report[2 + i] = keycode
+        else:
+            for keycode in keycodes:
+                index = 1 + (keycode >> 3)
+                if index >= self.report_size:
+                    raise ValueError("Keycode 0x%02x is outside the NKRO bitmap" % keycode)
+                report[index] |= 1 << (keycode & 0x7)
+        self.reports.extend(report)
+
+    def add_release(self) -> None:
+        """Append an all-keys-up report."""
+        self.reports.extend(bytes(self.report_size))
+
+
+def compile_string(layout: KeyboardLayoutBase, string: str) -> Macro:
+    """Compile ``string`` into a press and a release report per key stroke,
+    for the layout's keyboard.
+
+    Shift and AltGr are folded into the press report, so a character costs two
+    reports instead of the three or four sent by `KeyboardLayoutBase.write`.
+
+    :raises ValueError: if any of the characters has no keycode.
+    """
+    macro = Macro(len(layout.keyboard.report))
+    for char in string:
+        for modifiers, keycode in layout.strokes(char):
+            macro.add_report(modifiers, keycode)
+            macro.add_release()
+    return macro
+
+
+def compile_keys(
+    sequence: Iterable[Union[int, Iterable[int]]], keyboard: Keyboard = None
+) -> Macro:
+    """Compile a sequence of keycodes or keycode chords.
+
+    Each item is tapped: pressed in one report, then released. A chord such
+    as ``(Keycode.CONTROL, Keycode.C)`` is pressed all at once.
+
+    :param keyboard: the keyboard the macro will be played on. Defaults to None
+        for 8-byte boot reports, which limit a chord to six regular keys.
+    :raises ValueError: if a chord does not fit in the keyboard's report.
+    """
+    macro = Macro(_REPORT_SIZE if keyboard is None else len(keyboard.report))
+    for item in sequence:
+        if isinstance(item, int):
+            item = (item,)
+        modifiers = 0
+        keycodes = []
+        for keycode in item:
+            bit = Keycode.modifier_bit(keycode)
+            if bit:
+                modifiers |= bit
+            else:
+                keycodes.append(keycode)
+        macro.add_report(modifiers, *keycodes)
+        macro.add_release()
+    return macro
+
+
+class MacroPlayer:
+    """Streams compiled macros to a keyboard.
+
+    `play` sends a whole macro before returning. For use from a scan loop,
+    `start` a macro instead and call `tick` on every pass: each call sends at
+    most one report, and `cancel` stops playback at any point.
+    """
+
+    def __init__(self, keyboard: Keyboard, delay: float = None) -> None:
+        """
+        :param keyboard: the `Keyboard` whose device receives the reports.
+        :param float delay: Optional delay in seconds between reports.
+        """
+        self.keyboard = keyboard
+        self.delay = delay
+        self._send_report = keyboard._keyboard_device.send_report
+        self._view = None
+        self._size = _REPORT_SIZE
+        self._position = 0
+        self._due = 0
+
+    @property
+    def playing(self) -> bool:
+        """True while a macro started with `start` has reports left to send."""
+        return self._view is not None
+
+    def _check(self, macro: Macro) -> None:
+        if macro.report_size != len(self.keyboard.report):
+            raise ValueError(
+                "Macro has %d-byte reports but the keyboard sends %d-byte reports"
+                % (macro.report_size, len(self.keyboard.report))
+            )
+
+    def play(self, macro: Macro) -> None:
+        """Send every report in ``macro``, then restore the keys the keyboard holds.
+
+        :raises ValueError: if ``macro`` was compiled for a different report layout.
+        """
+        self._check(macro)
+        send_report = self._send_report
+        view = memoryview(macro.reports)
+        delay = self.delay
+        size = macro.report_size
+        for start in range(0, len(view), size):
+            send_report(view[start : start + size])
+            if delay:
+                sleep(delay)
+        send_report(self.keyboard.report)
+
+    def start(self, macro: Macro) -> None:
+        """Begin playing ``macro`` from `tick`, replacing any macro in progress.
+
+        :raises ValueError: if ``macro`` was compiled for a different report layout.
+        """
+        self._check(macro)
+        self._view = memoryview(macro.reports)
+        self._size = macro.report_size
+        self._position = 0
+        self._due = 0
+
+    def tick(self, now: int = None) -> bool:
+        """Send the next report if one is due.
+
+        :param int now: current ``time.monotonic_ns()``, only needed with a ``delay``.
+        :returns: True while the macro is still playing.
+        """
+        view = self._view
+        if view is None:
+            return False
+        if self.delay:
+            if now is None:
+                now = monotonic_ns()
+            if now < self._due:
+                return True
+            self._due = now + int(self.delay * 1_000_000_000)
+        position = self._position
+        self._send_report(view[position : position + self._size])
+        position += self._size
+        self._position = position
+        if position >= len(view):
+            self._finish()
+            return False
+        return True
+
+    def cancel(self) -> None:
+        """Stop the macro in progress and restore the keys the keyboard holds."""
+        if self._view is not None:
+            self._finish()
+
+    def _finish(self) -> None:
+        self._view = None
+        self._send_report(self.keyboard.report)
@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2025 temidaradev
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.keyboard_nkro.KeyboardNKRO`
+====================================================
+
+N-key rollover keyboard reports, with a 6-key boot-protocol fallback.
+
+* Author(s): temidaradev
+"""
+
+from micropython import const
+
+from . import find_device
+from .keyboard import Keyboard
+from .keycode import Keycode
+
+try:
+    from typing import Sequence
+
+    import usb_hid
+except ImportError:
+    pass
+
+try:
+    from usb_hid import get_boot_device
+except ImportError:
+    get_boot_device = None
+
+_BITMAP_BYTES = const(16)
+NKRO_REPORT_LENGTH = const(1 + _BITMAP_BYTES)
+"""Modifier byte followed by one bit for each usage 0x00-0x7F."""
+
+
+def nkro_report_descriptor(report_id: int = 4) -> bytes:
+    """Return the HID report descriptor for a `KeyboardNKRO` device."""
+    return bytes(
+        (
+            0x05, 0x01,  # Usage Page (Generic Desktop)
+            0x09, 0x06,  # Usage (Keyboard)
+            0xA1, 0x01,  # Collection (Application)
+            0x85, report_id,  # Report ID
+            0x05, 0x07,  # Usage Page (Keyboard)
+            0x19, 0xE0,  # Usage Minimum (Left Control)
+            0x29, 0xE7,  # Usage Maximum (Right GUI)
+            0x15, 0x00,  # Logical Minimum (0)
+            0x25, 0x01,  # Logical Maximum (1)
+            0x75, 0x01,  # Report Size (1)
+            0x95, 0x08,  # Report Count (8)
+            0x81, 0x02,  # Input (Data, Variable, Absolute): modifiers
+            0x19, 0x00,  # Usage Minimum (0)
+            0x29, 0x7F,  # Usage Maximum (127)
+            0x95, 0x80,  # Report Count (128)
+            0x81, 0x02,  # Input (Data, Variable, Absolute): key bitmap
+            0x05, 0x08,  # Usage Page (LEDs)
+            0x19, 0x01,  # Usage Minimum (Num Lock)
+            0x29, 0x05,  # Usage Maximum (Kana)
+            0x95, 0x05,  # Report Count (5)
+            0x91, 0x02,  # Output (Data, Variable, Absolute): LEDs
+            0x95, 0x03,  # Report Count (3)
+            0x91, 0x01,  # Output (Constant): padding
+            0xC0,  # End Collection
+        )
+    )  # fmt: skip
+
+
+def nkro_device(report_id: int = 4) -> usb_hid.Device:
+    """Create the `usb_hid.Device` for an NKRO keyboard, for use in ``boot.py``.
+
+    Keep the standard keyboard first in the list so a BIOS or other boot-protocol
+    host still has a keyboard it understands::
+
+        import usb_hid
+        from adafruit_hid.keyboard_nkro import nkro_device
+
+        usb_hid.enable(
+            (usb_hid.Device.KEYBOARD, nkro_device(), usb_hid.Device.CONSUMER_CONTROL),
+            boot_device=1,
+        )
+    """
+    import usb_hid  # pylint: disable=import-outside-toplevel
+
+    return usb_hid.Device(
+        report_descriptor=nkro_report_descriptor(report_id),
+        usage_page=0x01,
+        usage=0x06,
+        report_ids=(report_id,),
+        in_report_lengths=(NKRO_REPORT_LENGTH,),
+        out_report_lengths=(1,),
+    )
+
+
+class KeyboardNKRO(Keyboard):
+    """Send keyboard reports with one bit per key, so any number of keys can be held.
+
+    Setting or clearing a key is a single byte index and bit mask, with no slot
+    search and nothing dropped when more than six keys are down.
+    """
+
+    def __init__(self, devices: Sequence[usb_hid.Device], timeout: int = None) -> None:
+        """Create a KeyboardNKRO object that will send NKRO keyboard HID reports.
+
+        :param devices: a device created with `nkro_device`, or a sequence holding one.
+            Since both keyboards share a usage, pass the NKRO device itself when
+            the standard keyboard is also enabled.
+        :param timeout: Time in seconds to wait for USB to become ready before timing out.
+          Defaults to None to wait indefinitely.
+        """
+        self._keyboard_device = find_device(devices, usage_page=0x1, usage=0x06, timeout=timeout)
+
+        # report[0] modifiers
+        # report[1:17] bitmap of usages 0x00-0x7F
+        self.report = bytearray(NKRO_REPORT_LENGTH)
+        self.report_modifier = memoryview(self.report)[0:1]
+        self.report_bitmap = memoryview(self.report)[1:]
+
+        # No keyboard LEDs on.
+        self._led_status = b"\x00"
+
+    def release_all(self) -> None:
+        """Release all pressed keys."""
+        report = self.report
+        for i in range(NKRO_REPORT_LENGTH):
+            report[i] = 0
+        self._keyboard_device.send_report(report)
+
+    def _add_keycode_to_report(self, keycode: int) -> None:
+        """Set the bit for a single keycode in the report."""
+        modifier = Keycode.modifier_bit(keycode)
+        if modifier:
+            self.report_modifier[0] |= modifier
+        elif keycode >> 3 < _BITMAP_BYTES:
+            self.report_bitmap[keycode >> 3] |= 1 << (keycode & 0x7)
+        else:
+            raise ValueError("Keycode 0x%02x is outside the NKRO bitmap" % keycode)
+
+    def _remove_keycode_from_report(self, keycode: int) -> None:
+        """Clear the bit for a single keycode in the report."""
+        modifier = Keycode.modifier_bit(keycode)
+        if modifier:
+            self.report_modifier[0] &= ~modifier
+        elif keycode >> 3 < _BITMAP_BYTES:
+            self.report_bitmap[keycode >> 3] &= ~(1 << (keycode & 0x7))
+
+
+def boot_protocol_active() -> bool:
+    """True if the host asked for the boot keyboard protocol, which has no NKRO."""
+    return get_boot_device is not None and get_boot_device() == 1
+
+
+def nkro_or_boot_keyboard(
+    nkro_device: usb_hid.Device, boot_device: usb_hid.Device, timeout: int = None
+) -> Keyboard:
+    """Return a `KeyboardNKRO` on ``nkro_device``, or a standard 6-key `Keyboard` on
+    ``boot_device`` if the host selected the boot protocol.
+
+    Both share the `Keyboard` API, so callers do not need to know which they got.
+    """
+    if boot_protocol_active():
+        return Keyboard(boot_device, timeout=timeout)
+    return KeyboardNKRO(nkro_device, timeout=timeout)
@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2025 temidaradev
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.mouse_motion.MouseMotion`
+====================================================
+
+Smooth, accelerating pointer and wheel motion for keys used as a mouse.
+
+* Author(s): temidaradev
+"""
+
+from time import monotonic_ns
+
+try:
+    from .mouse import Mouse
+except ImportError:
+    pass
+
+
+class Acceleration:
+    """Speed curve: ``initial`` units per second when motion starts, rising to
+    ``maximum`` after ``ramp`` seconds along ``t ** exponent``."""
+
+    def __init__(
+        self, initial: float = 200, maximum: float = 1200, ramp: float = 0.5, exponent: float = 2
+    ) -> None:
+        self.initial = initial
+        self.maximum = maximum
+        self.ramp_ns = int(ramp * 1_000_000_000)
+        self.exponent = exponent
+
+    def __call__(self, held_ns: int) -> float:
+        """Return the speed in units per second after motion has lasted ``held_ns``."""
+        if held_ns >= self.ramp_ns:
+            return self.maximum
+        return self.initial + (self.maximum - self.initial) * (held_ns / self.ramp_ns) ** self.exponent
+
+
+def _limit(dist: int) -> int:
+    return min(127, max(-127, dist))
+
+
+class MouseMotion:
+    """Turns held direction keys into mouse movement, one report per `tick`.
+
+    Movement is integrated over the time between ticks, and the fractional part
+    carries to the next tick, so slow speeds stay smooth instead of stalling or
+    jumping. At most one report is sent per tick. Distance beyond the ±127
+    limit of a report is carried over rather than sent as a burst.
+
+    Example::
+
+        motion = MouseMotion(Mouse(usb_hid.devices))
+        motion.press(x=1)       # start moving right
+        while motion.moving:
+            motion.tick()       # call on every scan
+    """
+
+    def __init__(
+        self, mouse: Mouse, curve: Acceleration = None, wheel_curve: Acceleration = None
+    ) -> None:
+        self.mouse = mouse
+        self.curve = curve or Acceleration()
+        self.wheel_curve = wheel_curve or Acceleration(8, 40, 1.0, 1)
+        self._x = 0
+        self._y = 0
+        self._wheel = 0
+        self._start = 0
+        self._last = 0
+        self._carry_x = 0.0
+        self._carry_y = 0.0
+        self._carry_wheel = 0.0
+
+    @property
+    def moving(self) -> bool:
+        """True while any direction is held or carried distance is left to send."""
+        return bool(
+            self._x
+            or self._y
+            or self._wheel
+            or abs(self._carry_x) >= 1
+            or abs(self._carry_y) >= 1
+            or abs(self._carry_wheel) >= 1
+        )
+
+    def press(self, x: int = 0, y: int = 0, wheel: int = 0, now: int = None) -> None:
+        """Start moving in a direction. ``x``, ``y`` and ``wheel`` are usually -1, 0 or 1."""
+        self._change(x, y, wheel, now)
+
+    def release(self, x: int = 0, y: int = 0, wheel: int = 0, now: int = None) -> None:
+        """Stop moving in a direction given to `press`."""
+        self._change(-x, -y, -wheel, now)
+
+    def _change(self, x: int, y: int, wheel: int, now: int) -> None:
+        idle = not (self._x or self._y or self._wheel)
+        self._x += x
+        self._y += y
+        self._wheel += wheel
+        if not (self._x or self._y or self._wheel):
+            # Drop the fraction of a unit left over, so the next press starts clean.
+            self._carry_x = self._carry_y = self._carry_wheel = 0.0
+        elif idle:
+            # Motion starts now, whether a key went down or an opposite key
+            # went up; the time spent cancelled out must not count.
+            if now is None:
+                now = monotonic_ns()
+            self._start = self._last = now
+            self._carry_x = self._carry_y = self._carry_wheel = 0.0
+
+    def tick(self, now: int = None) -> None:
+        """Send one report for the motion since the last tick, if it moves at least one unit."""
+        if now is None:
+            now = monotonic_ns()
+        elapsed = (now - self._last) / 1_000_000_000
+        self._last = now
+        held = now - self._start
+        if self._x or self._y:
+            step = self.curve(held) * elapsed
+            self._carry_x += self._x * step
+            self._carry_y += self._y * step
+        if self._wheel:
+            self._carry_wheel += self._wheel * self.wheel_curve(held) * elapsed
+        x = _limit(int(self._carry_x))
+        y = _limit(int(self._carry_y))
+        wheel = _limit(int(self._carry_wheel))
+        if x or y or wheel:
+            self._carry_x -= x
+            self._carry_y -= y
+            self._carry_wheel -= wheel
+            self.mouse.move(x, y, wheel)
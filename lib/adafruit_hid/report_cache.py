@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2025 temidaradev
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.report_cache.ReportCache`
+====================================================
+
+Skip HID reports that would not change anything on the host.
+
+* Author(s): temidaradev
+"""
+
+try:
+    from typing import Optional
+
+    import usb_hid
+except ImportError:
+    pass
+
+from .report_layout import has_slot, report_layout, slots_start
+
+
+class ReportCache:
+    """Wraps a HID device and only sends reports that differ from the last one sent.
+
+    A `ReportCache` looks like a device, so it can be passed to `Keyboard`,
+    `Mouse` or `ConsumerControl` in place of the device it wraps::
+
+        device = find_device(usb_hid.devices, usage_page=0x1, usage=0x06)
+        kbd = Keyboard(ReportCache(device))
+
+    Between `hold` and `flush`, reports are coalesced so that several changes,
+    such as one key released and another pressed in the same scan, go out as a
+    single report. A report is never coalesced away if that would hide a key
+    that was pressed and released inside the batch.
+
+    Mouse reports that carry movement are always sent.
+    """
+
+    def __init__(self, device: usb_hid.Device) -> None:
+        self._device = device
+        self.usage_page = device.usage_page
+        self.usage = device.usage
+        # Used to check whether coalescing would lose a press.
+        self._bitmap_bytes, self._slot_size, self._relative = report_layout(
+            self.usage_page, self.usage
+        )
+        self._last = None
+        self._pending = None
+        self._pending_id = None
+        self._holding = False
+        self.sent = 0
+        """Number of reports sent to the device."""
+        self.suppressed = 0
+        """Number of reports skipped because they matched the last report sent."""
+
+    def get_last_received_report(self, report_id: Optional[int] = None) -> Optional[bytes]:
+        """Pass through to the wrapped device."""
+        if report_id is None:
+            return self._device.get_last_received_report()
+        return self._device.get_last_received_report(report_id)
+
+    def send_report(self, report: bytearray, report_id: Optional[int] = None) -> None:
+        """Send ``report`` unless it matches the last report sent, or queue it while holding."""
+        if self._relative and any(report[1:]):
+            # Movement is relative, so it is never a duplicate.
+            self._flush()
+            self._send(report, report_id)
+            # Buttons stay down on the host; movement does not.
+            self._last[1:] = bytes(len(report) - 1)
+            return
+        if self._holding:
+            pending = self._pending
+            if pending is not None and self._loses(pending, report):
+                self._flush()
+            self._pending = bytearray(report)
+            self._pending_id = report_id
+            return
+        if self._last is not None and self._last == report:
+            self.suppressed += 1
+            return
+        self._send(report, report_id)
+
+    def hold(self) -> None:
+        """Start coalescing reports until `flush`."""
+        self._holding = True
+
+    def flush(self) -> None:
+        """Stop coalescing and send the final report of the batch, if it changed anything."""
+        self._holding = False
+        self._flush()
+
+    def _flush(self) -> None:
+        pending = self._pending
+        if pending is None:
+            return
+        self._pending = None
+        if self._last is not None and self._last == pending:
+            self.suppressed += 1
+        else:
+            self._send(pending, self._pending_id)
+
+    def _send(self, report: bytearray, report_id: Optional[int]) -> None:
+        if report_id is None:
+            self._device.send_report(report)
+        else:
+            self._device.send_report(report, report_id)
+        self.sent += 1
+        if self._last is None or len(self._last) != len(report):
+            self._last = bytearray(report)
+        else:
+            self._last[:] = report
+
+    def _loses(self, pending: bytearray, new: bytearray) -> bool:
+        """True if replacing ``pending`` by ``new`` would drop a press that only
+        ``pending`` carries."""
+        last = self._last
+        if last is None or len(last) != len(pending) or len(new) != len(pending):
+            return True
+        start = slots_start(self._bitmap_bytes, pending)
+        for i in range(start):
+            if pending[i] & ~last[i] & ~new[i]:
+                return True
+        size = self._slot_size
+        for i in range(start, len(pending), size):
+            slot = pending[i : i + size]
+            if (
+                any(slot)
+                and not has_slot(last, slot, start, size)
+                and not has_slot(new, slot, start, size)
+            ):
+                return True
+        return False
+
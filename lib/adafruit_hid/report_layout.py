@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2025 temidaradev
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.report_layout`
+====================================================
+
+How the keyboard, mouse and consumer control reports are laid out, for code
+that compares reports to see what is pressed.
+
+* Author(s): temidaradev
+"""
+
+try:
+    from typing import Tuple
+except ImportError:
+    pass
+
+
+def report_layout(usage_page: int, usage: int) -> Tuple[int, int, bool]:
+    """Return ``(bitmap_bytes, slot_size, relative)`` for a device's reports.
+
+    Reports are a run of bitmap bytes followed by usage slots of
+    ``slot_size`` bytes. Bits and slots are what "pressed" means. ``relative``
+    is True for a mouse, whose bytes after the buttons are movement.
+    """
+    if usage_page == 0x0C:
+        return 0, 2, False
+    if usage_page == 0x01:
+        return 1, 1, usage == 0x02
+    return 0, 1, False
+
+
+def slots_start(bitmap_bytes: int, report: bytearray) -> int:
+    """Return the index of the first usage slot in ``report``."""
+    if bitmap_bytes and len(report) > 8:
+        # Keyboard reports longer than the boot report are NKRO bitmaps.
+        return len(report)
+    return bitmap_bytes
+
+
+def has_slot(report: bytearray, slot: bytearray, start: int, size: int) -> bool:
+    """True if ``slot`` is one of the usage slots of ``report`` from ``start`` on."""
+    for i in range(start, len(report), size):
+        if report[i : i + size] == slot:
+            return True
+    return False
@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2025 temidaradev
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.report_queue.ReportQueue`
+====================================================
+
+Queue HID reports so a slow host does not stall the code that makes them.
+
+* Author(s): temidaradev
+"""
+
+from time import monotonic_ns
+
+try:
+    from typing import Optional
+
+    import usb_hid
+except ImportError:
+    pass
+
+from .report_layout import has_slot, report_layout
+
+
+def _signed(byte: int) -> int:
+    return byte - 256 if byte > 127 else byte
+
+
+class ReportQueue:
+    """Wraps a HID device and queues reports until `send_next` sends them.
+
+    A `ReportQueue` looks like a device, so it can be passed to `Keyboard`,
+    `Mouse`, `ConsumerControl` or a `ReportCache` in place of the device it
+    wraps. ``send_report`` only queues, and a separate task calls `send_next`
+    at whatever pace the host accepts reports.
+
+    Keyboard reports and consumer control taps are never dropped. Once
+    ``size`` reports are queued the queue is `full` and ``send_report``
+    returns False: callers should wait for `send_next` to make room before
+    sending more. Reports sent anyway are still queued, and `overflowed` is
+    counted. Only two kinds of report are merged away:
+
+    * Mouse movement is added into the last queued report when the buttons
+      match, so a backlog becomes one larger move rather than many small ones.
+    * Once the queue is full, a consumer control press that repeats the press
+      queued two reports back is stale, so it and the release queued between
+      them are dropped. This is what auto-repeat produces while the host is
+      behind. Below ``size`` every press is kept, so a quick double tap still
+      reaches the host as two taps.
+
+    If the device raises, `send_next` counts it in `failed` and leaves the
+    report at the head of the queue to be sent again.
+    """
+
+    def __init__(self, device: usb_hid.Device, size: int = 16) -> None:
+        self._device = device
+        self.usage_page = device.usage_page
+        self.usage = device.usage
+        self.size = size
+        # [report, report_id, time queued]
+        self._reports = []
+        _, slot_size, self._mouse = report_layout(self.usage_page, self.usage)
+        self._consumer = slot_size == 2
+        self.sent = 0
+        """Number of reports sent to the device."""
+        self.coalesced = 0
+        """Number of mouse reports added into a queued report."""
+        self.dropped = 0
+        """Number of stale consumer control repeat reports dropped."""
+        self.overflowed = 0
+        """Number of reports queued past ``size`` by callers that did not wait for room."""
+        self.failed = 0
+        """Number of times the device raised instead of sending; the report stays queued."""
+        self.max_depth = 0
+        """Most reports that have been queued at once."""
+        self.max_latency_ns = 0
+        """Longest time from queueing a report to having sent it."""
+        self.total_latency_ns = 0
+        """Sum of the latencies of all sent reports; divide by `sent` for the mean."""
+
+    def __len__(self) -> int:
+        return len(self._reports)
+
+    @property
+    def full(self) -> bool:
+        """True once ``size`` reports are queued; callers should wait for room."""
+        return len(self._reports) >= self.size
+
+    def get_last_received_report(self, report_id: Optional[int] = None) -> Optional[bytes]:
+        """Pass through to the wrapped device."""
+        if report_id is None:
+            return self._device.get_last_received_report()
+        return self._device.get_last_received_report(report_id)
+
+    def send_report(self, report: bytearray, report_id: Optional[int] = None) -> bool:
+        """Queue a copy of ``report``. Return False if the queue is now `full`."""
+        reports = self._reports
+        if reports and reports[-1][1] == report_id:
+            if self._mouse and self._coalesce(reports[-1][0], report):
+                self.coalesced += 1
+                return len(reports) < self.size
+            if (
+                self._consumer
+                and len(reports) >= self.size
+                and len(reports) >= 2
+                and any(report)
+                and reports[-2][0] == report
+                and reports[-2][1] == report_id
+                and self._within(reports[-1][0], report)
+            ):
+                reports.pop()
+                self.dropped += 2
+                return False
+        if len(reports) >= self.size:
+            self.overflowed += 1
+        reports.append([bytearray(report), report_id, monotonic_ns()])
+        if len(reports) > self.max_depth:
+            self.max_depth = len(reports)
+        return len(reports) < self.size
+
+    def send_next(self) -> bool:
+        """Send the oldest queued report. Return False if there was none.
+
+        If the device raises, such as an `OSError` while USB is busy, the report
+        stays queued, `failed` is counted and the exception propagates.
+        """
+        reports = self._reports
+        if not reports:
+            return False
+        report, report_id, queued = reports[0]
+        try:
+            if report_id is None:
+                self._device.send_report(report)
+            else:
+                self._device.send_report(report, report_id)
+        except Exception:
+            self.failed += 1
+            raise
+        reports.pop(0)
+        latency = monotonic_ns() - queued
+        self.sent += 1
+        self.total_latency_ns += latency
+        if latency > self.max_latency_ns:
+            self.max_latency_ns = latency
+        return True
+
+    def _within(self, report: bytearray, other: bytearray) -> bool:
+        """True if every code held in consumer ``report`` is also held in ``other``."""
+        if len(report) != len(other):
+            return False
+        for i in range(0, len(report), 2):
+            slot = report[i : i + 2]
+            if any(slot) and not has_slot(other, slot, 0, 2):
+                return False
+        return True
+
+    def _coalesce(self, tail: bytearray, report: bytearray) -> bool:
+        """Add the movement in ``report`` into ``tail`` if the buttons match and it fits."""
+        if len(tail) != len(report) or tail[0] != report[0]:
+            return False
+        for i in range(1, len(report)):
+            if not -127 <= _signed(tail[i]) + _signed(report[i]) <= 127:
+                return False
+        for i in range(1, len(report)):
+            tail[i] = (_signed(tail[i]) + _signed(report[i])) & 0xFF
+        return True
+
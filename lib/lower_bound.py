@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: 2025 temidaradev
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`lower_bound`
+====================================================
+
+Binary search of sorted arrays, shared by the font loaders and the keyboard
+layouts. CircuitPython has no ``bisect`` module.
+
+* Author(s): temidaradev
+"""
+
+try:
+    from typing import Sequence
+except ImportError:
+    pass
+
+
+def lower_bound(values: Sequence[int], value: int) -> int:
+    """Index of the first entry in the sorted ``values`` not below ``value``,
+    or ``len(values)`` if there is none."""
+    low = 0
+    high = len(values)
+    while low < high:
+        mid = (low + high) // 2
+        if values[mid] < value:
+            low = mid + 1
+        else:
+            high = mid
+    return low
@@ -1,4 +1,4 @@
-import time
+import asyncio
 import board
 import digitalio
 import usb_hid
@@ -8,41 +8,33 @@ from adafruit_display_text import label
 from i2cdisplaybus import I2CDisplayBus
 from adafruit_displayio_ssd1306 import SSD1306
 from adafruit_bitmap_font import bitmap_font
+from adafruit_hid import find_device
 from adafruit_hid.consumer_control import ConsumerControl
 from adafruit_hid.consumer_control_code import ConsumerControlCode
+from adafruit_hid.report_cache import ReportCache
+from adafruit_hid.report_queue import ReportQueue
+from debounce import Eager
+from keymap import Keymap, Media, Repeat
+from repeat import Repeater
+from runtime import Runtime
+from scanner import ButtonBank, Scanner
 
 DISPLAY_WIDTH = 128
 DISPLAY_HEIGHT = 64
 DISPLAY_ADDRESS = 0x3C
 I2C_SCL_PIN = board.GP5
 I2C_SDA_PIN = board.GP4
-FONT_FILE = "fonts/terminal.bdf"
+# Made from fonts/terminal.bdf by tools/mkfont.py; loads without parsing text.
+FONT_FILE = "fonts/terminal.mkf"
+GLYPH_CACHE_BYTES = 4096
 BUTTON_PINS = [board.GP15, board.GP14, board.GP13, board.GP12, board.GP11]
-DEBOUNCE_DELAY = 0.05
+DEBOUNCE_NS = 50_000_000
 
-class Button:
-    def __init__(self, pin):
-        self.pin = digitalio.DigitalInOut(pin)
-        self.pin.direction = digitalio.Direction.INPUT
-        self.pin.pull = digitalio.Pull.DOWN
-        self.previous_state = False
-    
-    @property
-    def pressed(self):
-        current = self.pin.value
-        if current and not self.previous_state:
-            return True
-        return False
-    
-    @property
-    def released(self):
-        current = self.pin.value
-        if not current and self.previous_state:
-            return True
-        return False
-    
-    def update(self):
-        self.previous_state = self.pin.value
+def make_input(pin):
+    io = digitalio.DigitalInOut(pin)
+    io.direction = digitalio.Direction.INPUT
+    io.pull = digitalio.Pull.DOWN
+    return io
 
 
 def setup_display():
@@ -53,6 +45,7 @@ def setup_display():
     display = SSD1306(display_bus, width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT)
     
     font = bitmap_font.load_font(FONT_FILE)
+    font.cache_budget = GLYPH_CACHE_BYTES
     
     splash = displayio.Group()
     display.root_group = splash
@@ -82,56 +75,46 @@ def setup_display():
     
     return display, status_label
 
-ACTIONS = [
-    {"code": ConsumerControlCode.SCAN_PREVIOUS_TRACK, "label": "PREV"},
-    {"code": ConsumerControlCode.PLAY_PAUSE, "label": "PLAY"},
-    {"code": ConsumerControlCode.SCAN_NEXT_TRACK, "label": "NEXT"},
-    {"code": ConsumerControlCode.VOLUME_DECREMENT, "label": "VOL-"},
-    {"code": ConsumerControlCode.VOLUME_INCREMENT, "label": "VOL+"},
+KEYMAP = [
+    [
+        Media(ConsumerControlCode.SCAN_PREVIOUS_TRACK, "PREV"),
+        Media(ConsumerControlCode.PLAY_PAUSE, "PLAY"),
+        Media(ConsumerControlCode.SCAN_NEXT_TRACK, "NEXT"),
+        Repeat(Media(ConsumerControlCode.VOLUME_DECREMENT, "VOL-")),
+        Repeat(Media(ConsumerControlCode.VOLUME_INCREMENT, "VOL+")),
+    ],
 ]
 
 display, status_label = setup_display()
-consumer_control = ConsumerControl(usb_hid.devices)
-buttons = [Button(pin) for pin in BUTTON_PINS]
-current_status = "READY"
+# Don't wait for USB here; reports queue until the host has enumerated us.
+consumer_device = find_device(usb_hid.devices, usage_page=0x0C, usage=0x01, wait=False)
+# Reports are sent by the runtime's report task, at the host's pace.
+consumer_queue = ReportQueue(consumer_device)
+consumer_cache = ReportCache(consumer_queue)
+keymap = Keymap(
+    KEYMAP, consumer_control=ConsumerControl(consumer_cache), repeater=Repeater()
+)
+scanner = Scanner(
+    ButtonBank([make_input(pin) for pin in BUTTON_PINS]),
+    [Eager(DEBOUNCE_NS) for _ in BUTTON_PINS],
+)
+
+# Refreshes are scheduled by the display task so they never delay HID reports.
+display.auto_refresh = False
+display.refresh()
 
-last_action_time = 0
-DISPLAY_TIMEOUT = 2.0
+def show_status(text):
+    status_label.text = text
 
-def update_status(new_status):
-    global current_status, last_action_time
-    if current_status != new_status:
-        current_status = new_status
-        status_label.text = current_status
-        if new_status != "READY":
-            last_action_time = time.monotonic()
+runtime = Runtime(
+    scanner,
+    keymap,
+    show_status,
+    display.refresh,
+    report_caches=(consumer_cache,),
+    report_queues=(consumer_queue,),
+    deferred_devices=(consumer_device,),
+)
 
 print("Macro keyboard ready!")
-while True:
-    try:
-        current_time = time.monotonic()
-        
-        if (current_status != "READY" and 
-            current_time - last_action_time > DISPLAY_TIMEOUT):
-            update_status("READY")
-        
-        for i, button in enumerate(buttons):
-            action = ACTIONS[i]
-            
-            if button.pressed:
-                consumer_control.press(action["code"])
-                print(f"Button {i} pressed: {action['label']}")
-            
-            elif button.released:
-                consumer_control.release()
-                update_status(action["label"])  # Show action label
-                print(f"Button {i} released: {action['label']}")
-            
-            button.update()
-        
-        time.sleep(DEBOUNCE_DELAY)
-        
-    except Exception as e:
-        print(f"Error in main loop: {e}") 
-        update_status("ERROR")
-        time.sleep(0.5)
\ No newline at end of file
+asyncio.run(runtime.run())
@@ -0,0 +1,161 @@
+import time
+
+from scanner import FakePin, bits
+
+
+class KeyMatrix:
+    """Row/column key matrix that samples into the same bitmask as `ButtonBank`.
+
+    Key ``row * len(columns) + column`` is bit of the same index, so a
+    `scanner.Scanner` can debounce a matrix exactly like direct-wired buttons.
+
+    Sense pins must be inputs with pull-ups and drive pins outputs. With
+    ``columns_to_anodes`` (diode anodes on the columns, the usual wiring) each
+    row is pulled low in turn and the columns are read; otherwise the columns
+    are driven and the rows read.
+
+    Without diodes, three keys on the corners of a rectangle make the fourth
+    corner read as pressed. With ``reject_ghosts`` any key in such a rectangle
+    keeps its previous state until the ambiguity clears. It defaults to
+    ``not diodes``: a matrix with a diode on every key cannot ghost, so the
+    check is skipped and such rectangles read as they are.
+    """
+
+    def __init__(
+        self, rows, columns, columns_to_anodes=True, settle_ns=0, diodes=True, reject_ghosts=None
+    ):
+        self.rows = rows
+        self.columns = columns
+        self.key_count = len(rows) * len(columns)
+        self.columns_to_anodes = columns_to_anodes
+        if columns_to_anodes:
+            self.drive, self.sense = rows, columns
+        else:
+            self.drive, self.sense = columns, rows
+        self.settle_ns = settle_ns
+        self.diodes = diodes
+        self.reject_ghosts = not diodes if reject_ghosts is None else reject_ghosts
+        self.lines = [0] * len(self.drive)
+        self.state = 0
+        self.ghosts = 0
+        for pin in self.drive:
+            pin.value = True
+
+    def _settle(self):
+        if self.settle_ns:
+            end = time.monotonic_ns() + self.settle_ns
+            while time.monotonic_ns() < end:
+                pass
+
+    def _line_keys(self, line, sense_mask):
+        """Key bitmask for the keys on drive ``line`` whose sense bits are set."""
+        width = len(self.columns)
+        if self.columns_to_anodes:
+            return sense_mask << (line * width)
+        mask = 0
+        for row in bits(sense_mask):
+            mask |= 1 << (row * width + line)
+        return mask
+
+    def sample(self):
+        """Strobe every drive line once and return the key bitmask."""
+        lines = self.lines
+        sense = self.sense
+        for d, pin in enumerate(self.drive):
+            pin.value = False
+            self._settle()
+            line = 0
+            bit = 1
+            for s in sense:
+                if not s.value:
+                    line |= bit
+                bit <<= 1
+            pin.value = True
+            lines[d] = line
+
+        mask = 0
+        for d, line in enumerate(lines):
+            if line:
+                mask |= self._line_keys(d, line)
+
+        self.ghosts = 0
+        if self.reject_ghosts:
+            self.ghosts = ghosts = self._find_ghosts(lines)
+            if ghosts:
+                mask = (mask & ~ghosts) | (self.state & ghosts)
+        self.state = mask
+        return mask
+
+    def _find_ghosts(self, lines):
+        ghosts = 0
+        count = len(lines)
+        for a in range(count):
+            la = lines[a]
+            # A ghost needs at least two keys down on each of two drive lines.
+            if not la & (la - 1):
+                continue
+            for b in range(a + 1, count):
+                shared = la & lines[b]
+                if shared & (shared - 1):
+                    ghosts |= self._line_keys(a, shared) | self._line_keys(b, shared)
+        return ghosts
+
+
+class _SensePin:
+    def __init__(self, wiring, index):
+        self._wiring = wiring
+        self._index = index
+
+    @property
+    def value(self):
+        return not self._wiring.reaches_low(self._index)
+
+
+class SimulatedMatrix:
+    """Host stand-in for matrix wiring, for running `KeyMatrix` without hardware.
+
+    Add ``(row, column)`` tuples to ``pressed``. With ``diodes`` False, current
+    can flow backwards through pressed switches, which reproduces ghosting.
+    """
+
+    def __init__(self, row_count, column_count, columns_to_anodes=True, diodes=True):
+        self.pressed = set()
+        self.diodes = diodes
+        self.columns_to_anodes = columns_to_anodes
+        if columns_to_anodes:
+            self.rows = [FakePin(True) for _ in range(row_count)]
+            self.columns = [_SensePin(self, c) for c in range(column_count)]
+        else:
+            self.rows = [_SensePin(self, r) for r in range(row_count)]
+            self.columns = [FakePin(True) for _ in range(column_count)]
+
+    def _switches(self):
+        if self.columns_to_anodes:
+            return self.pressed
+        return [(column, row) for row, column in self.pressed]
+
+    def reaches_low(self, sense_index):
+        drive = self.rows if self.columns_to_anodes else self.columns
+        switches = self._switches()
+        if self.diodes:
+            for d, s in switches:
+                if s == sense_index and not drive[d].value:
+                    return True
+            return False
+        # Walk the switch graph from the sense line to see if any driven-low line is reachable.
+        seen_sense = {sense_index}
+        seen_drive = set()
+        frontier = [sense_index]
+        while frontier:
+            s = frontier.pop()
+            for d, ss in switches:
+                if ss != s or d in seen_drive:
+                    continue
+                if not drive[d].value:
+                    return True
+                seen_drive.add(d)
+                for d2, s2 in switches:
+                    if d2 == d and s2 not in seen_sense:
+                        seen_sense.add(s2)
+                        frontier.append(s2)
+        return False
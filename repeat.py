@@ -0,0 +1,84 @@
+"""Typematic auto-repeat for held keys, on a timer wheel shared by all keys."""
+
+REPEAT_DELAY_NS = 400_000_000
+REPEAT_INTERVAL_NS = 80_000_000
+
+
+class Repeater:
+    """Schedules repeats: each started key is due ``delay_ns`` after it was
+    pressed, then every ``interval_ns`` until it is stopped.
+
+    Deadlines sit in a wheel of ``slots`` buckets, each ``resolution_ns``
+    wide. `tick` only visits the buckets that time has moved through, so its
+    cost depends on how many repeats are due, not on how many keys are held.
+    Each deadline advances from the previous one rather than from when `tick`
+    ran, so a late tick does not make the rate drift. If a tick is so late
+    that several repeats were missed, the key repeats once, not in a burst.
+    """
+
+    def __init__(
+        self,
+        delay_ns=REPEAT_DELAY_NS,
+        interval_ns=REPEAT_INTERVAL_NS,
+        resolution_ns=1_000_000,
+        slots=128,
+    ):
+        self.delay_ns = delay_ns
+        self.interval_ns = interval_ns
+        self.resolution_ns = resolution_ns
+        self.wheel = [[] for _ in range(slots)]
+        # key -> [deadline, interval]
+        self.deadlines = {}
+        # Number of the bucket `tick` visits first; it is revisited until
+        # time moves past it, since it can hold deadlines later than now.
+        self.cursor = 0
+
+    @property
+    def active(self):
+        """True while any key is repeating."""
+        return bool(self.deadlines)
+
+    def _bucket(self, deadline):
+        return self.wheel[(deadline // self.resolution_ns) % len(self.wheel)]
+
+    def start(self, key, now, delay_ns=None, interval_ns=None):
+        """Start repeating ``key``, pressed at ``now``. Defaults come from the repeater."""
+        self.stop(key)
+        if not self.deadlines:
+            self.cursor = now // self.resolution_ns
+        deadline = now + (self.delay_ns if delay_ns is None else delay_ns)
+        interval = self.interval_ns if interval_ns is None else interval_ns
+        self.deadlines[key] = [deadline, interval]
+        self._bucket(deadline).append(key)
+
+    def stop(self, key):
+        """Stop repeating ``key``. Does nothing if it is not repeating."""
+        entry = self.deadlines.pop(key, None)
+        if entry is not None:
+            self._bucket(entry[0]).remove(key)
+
+    def tick(self, now, fire):
+        """Call ``fire(key, now)`` once for each key whose repeat is due."""
+        wheel = self.wheel
+        slots = len(wheel)
+        deadlines = self.deadlines
+        end = now // self.resolution_ns
+        # A full turn of the wheel visits every bucket.
+        first = max(self.cursor, end - slots + 1)
+        for bucket in range(first, end + 1):
+            keys = wheel[bucket % slots]
+            i = 0
+            while i < len(keys):
+                key = keys[i]
+                entry = deadlines[key]
+                deadline = entry[0]
+                if deadline > now:
+                    i += 1
+                    continue
+                keys.pop(i)
+                while deadline <= now:
+                    deadline += entry[1]
+                entry[0] = deadline
+                self._bucket(deadline).append(key)
+                fire(key, now)
+        self.cursor = end
@@ -0,0 +1,271 @@
+import time
+
+import asyncio
+
+from scanner import bits
+
+SCAN_INTERVAL = 0.001
+DISPLAY_INTERVAL = 0.02
+DISPLAY_TIMEOUT = 2.0
+USB_POLL_INTERVAL = 0.1
+REPORT_RETRY_INTERVAL = 0.01
+READY = "READY"
+
+
+class BoundedQueue:
+    """Fixed-size FIFO for passing work between tasks.
+
+    When full, `put` waits for room, while ``drop_oldest`` queues discard the
+    oldest item instead. That suits status text, where only the latest value
+    matters.
+    """
+
+    def __init__(self, size, drop_oldest=False):
+        self.items = []
+        self.size = size
+        self.drop_oldest = drop_oldest
+        self.dropped = 0
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+
+    def __len__(self):
+        return len(self.items)
+
+    def put_nowait(self, item):
+        """Queue ``item`` and return True, or return False if the queue is full."""
+        items = self.items
+        if len(items) >= self.size:
+            if not self.drop_oldest:
+                return False
+            items.pop(0)
+            self.dropped += 1
+        items.append(item)
+        self._readable.set()
+        if len(items) >= self.size:
+            self._writable.clear()
+        return True
+
+    async def put(self, item):
+        while not self.put_nowait(item):
+            await self._writable.wait()
+
+    def get_nowait(self):
+        """Return the oldest item, or None if the queue is empty."""
+        items = self.items
+        if not items:
+            return None
+        item = items.pop(0)
+        if not items:
+            self._readable.clear()
+        self._writable.set()
+        return item
+
+    async def get(self):
+        while not self.items:
+            await self._readable.wait()
+        return self.get_nowait()
+
+
+class Runtime:
+    """Runs key scanning, HID output and the status display as separate tasks.
+
+    The scan task only queues ``(key, pressed, time)`` edges. The HID task
+    feeds them to the `keymap.Keymap`, which sends the reports, and passes
+    the labels of released keys to the display task. The display task
+    coalesces status text and waits until the HID queue is empty before
+    re-rendering and refreshing, so a slow I2C refresh never sits between
+    a key edge and its report.
+
+    Edges from one scan are handled between ``hold`` and ``flush`` on each
+    `adafruit_hid.report_cache.ReportCache` in ``report_caches``, so they
+    reach the host as one report per device.
+
+    Reports for each `adafruit_hid.report_queue.ReportQueue` in
+    ``report_queues`` are sent by a task of their own, so a host that is slow
+    to accept reports does not hold up scanning. The keymap waits while any of
+    them is full, and scanning waits once the HID queue fills behind it, so
+    a stalled host slows input down rather than losing keystrokes. A report
+    the device refuses stays queued and is retried every
+    ``REPORT_RETRY_INTERVAL``.
+
+    Each `adafruit_hid.DeferredDevice` in ``deferred_devices`` is polled until
+    USB is ready, so reports queued while the host enumerates go out without
+    waiting for the next key press.
+    """
+
+    def __init__(
+        self,
+        scanner,
+        keymap,
+        show,
+        refresh=None,
+        hid_depth=16,
+        report_caches=(),
+        report_queues=(),
+        deferred_devices=(),
+    ):
+        self.scanner = scanner
+        self.keymap = keymap
+        self.report_caches = report_caches
+        self.report_queues = report_queues
+        self.deferred_devices = deferred_devices
+        self._reports_queued = asyncio.Event()
+        # True while a report queue is waiting to retry a failed send.
+        self._retrying = False
+        # Count of scans, so the display can wait for the next one.
+        self._scans = 0
+        self.show = show
+        self.refresh = refresh
+        self.hid = BoundedQueue(hid_depth)
+        self.ui = BoundedQueue(1, drop_oldest=True)
+
+    async def scan_task(self):
+        scanner = self.scanner
+        hid = self.hid
+        while True:
+            try:
+                pressed, released = scanner.scan()
+                self._scans += 1
+                if pressed or released:
+                    now = time.monotonic_ns()
+                    for i in bits(released):
+                        await hid.put((i, False, now))
+                    for i in bits(pressed):
+                        await hid.put((i, True, now))
+                    await asyncio.sleep(0)
+                else:
+                    await asyncio.sleep(SCAN_INTERVAL)
+            except Exception as e:
+                print(f"Error in scan task: {e}")
+                self.ui.put_nowait("ERROR")
+                await asyncio.sleep(0.5)
+
+    def _handle(self, key, pressed, now):
+        try:
+            if pressed:
+                self.keymap.press(key, now)
+            else:
+                text = self.keymap.release(key, now)
+                if text:
+                    self.ui.put_nowait(text)
+        except Exception as e:
+            print(f"Error in HID task: {e}")
+            self.ui.put_nowait("ERROR")
+
+    def _tick(self, now):
+        try:
+            self.keymap.tick(now)
+        except Exception as e:
+            print(f"Error in HID task: {e}")
+            self.ui.put_nowait("ERROR")
+
+    async def hid_task(self):
+        hid = self.hid
+        keymap = self.keymap
+        caches = self.report_caches
+        while True:
+            await self._room()
+            if not keymap.busy:
+                item = await hid.get()
+            else:
+                # A tap-hold key is undecided, a macro is playing or the mouse
+                # is moving; keep ticking.
+                item = hid.get_nowait()
+                if item is None:
+                    self._tick(time.monotonic_ns())
+                    self._reports_queued.set()
+                    await asyncio.sleep(SCAN_INTERVAL)
+                    continue
+            # Edges from the same scan share a timestamp; send them as one report.
+            for cache in caches:
+                cache.hold()
+            self._handle(*item)
+            now = item[2]
+            while hid.items and hid.items[0][2] == now:
+                self._handle(*hid.get_nowait())
+            for cache in caches:
+                cache.flush()
+            self._reports_queued.set()
+
+    async def _room(self):
+        """Wait until every report queue has room for more reports."""
+        while any(queue.full for queue in self.report_queues):
+            self._reports_queued.set()
+            await asyncio.sleep(SCAN_INTERVAL)
+
+    async def report_task(self):
+        queues = self.report_queues
+        queued = self._reports_queued
+        while True:
+            await queued.wait()
+            queued.clear()
+            # One report per device per pass, so no device starves the others.
+            # A device leaves the pass once it is empty or fails.
+            draining = list(queues)
+            failed = False
+            while draining:
+                i = 0
+                while i < len(draining):
+                    try:
+                        sent = draining[i].send_next()
+                    except Exception as e:
+                        print(f"Error in report task: {e}")
+                        self.ui.put_nowait("ERROR")
+                        sent = False
+                        failed = True
+                    if sent:
+                        i += 1
+                    else:
+                        draining.pop(i)
+                await asyncio.sleep(0)
+            self._retrying = failed
+            if failed:
+                await asyncio.sleep(REPORT_RETRY_INTERVAL)
+                queued.set()
+
+    async def _hid_idle(self):
+        """Wait until no edge or report is waiting. HID reports always go
+        first, unless a device is refusing them."""
+        hid = self.hid
+        while hid or (any(self.report_queues) and not self._retrying):
+            await asyncio.sleep(0)
+
+    async def display_task(self):
+        ui = self.ui
+        status = READY
+        changed_at = 0
+        while True:
+            text = ui.get_nowait()
+            now = time.monotonic()
+            if text is None and status != READY and now - changed_at > DISPLAY_TIMEOUT:
+                text = READY
+            if text is not None and text != status:
+                await self._hid_idle()
+                status = text
+                changed_at = now
+                self.show(text)
+                if self.refresh:
+                    # Let the keys be scanned once more, so edges that came
+                    # in while rendering go before the refresh.
+                    scans = self._scans
+                    while self._scans == scans:
+                        await asyncio.sleep(0)
+                    await self._hid_idle()
+                    self.refresh()
+            await asyncio.sleep(DISPLAY_INTERVAL)
+
+    async def usb_task(self):
+        waiting = list(self.deferred_devices)
+        while waiting:
+            waiting = [device for device in waiting if not device.poll()]
+            await asyncio.sleep(USB_POLL_INTERVAL)
+
+    async def run(self):
+        await asyncio.gather(
+            asyncio.create_task(self.scan_task()),
+            asyncio.create_task(self.hid_task()),
+            asyncio.create_task(self.display_task()),
+            asyncio.create_task(self.report_task()),
+            asyncio.create_task(self.usb_task()),
+        )
@@ -0,0 +1,95 @@
+import time
+
+from debounce import Eager
+
+
+class FakePin:
+    """Stand-in for digitalio.DigitalInOut when running on a host."""
+
+    def __init__(self, value=False):
+        self.value = value
+
+
+def bits(mask):
+    """Yield the index of every set bit in ``mask``, lowest first."""
+    i = 0
+    while mask:
+        if mask & 1:
+            yield i
+        mask >>= 1
+        i += 1
+
+
+class ButtonBank:
+    """One pin per key, sampled into an integer bitmask (bit i is pin i).
+
+    Each pin is read exactly once per `sample`, so press and release edges
+    are always worked out from the same snapshot.
+    """
+
+    def __init__(self, pins):
+        self.pins = pins
+        self.key_count = len(pins)
+
+    def sample(self):
+        """Read every pin once and return the raw bitmask."""
+        mask = 0
+        bit = 1
+        for pin in self.pins:
+            if pin.value:
+                mask |= bit
+            bit <<= 1
+        return mask
+
+
+class Scanner:
+    """Debounces the bitmask produced by a key source such as `ButtonBank`.
+
+    Each key has its own debouncer from `debounce`. The default is `Eager`
+    with a 50 ms lockout, which reports an edge on the scan that first sees
+    it. That is the same guarantee the old fixed 50 ms sleep gave.
+    """
+
+    def __init__(self, source, debouncers=None):
+        self.source = source
+        if debouncers is None:
+            debouncers = [Eager() for _ in range(source.key_count)]
+        self.debouncers = debouncers
+        self.state = 0
+        # Keys whose debouncer needs samples even though raw matches state.
+        self.pending = 0
+
+    def set_debouncer(self, key, debouncer):
+        """Swap the debounce strategy of one key at runtime."""
+        debouncer.reset((self.state >> key) & 1)
+        self.debouncers[key] = debouncer
+        self.pending &= ~(1 << key)
+
+    def scan(self, now=None):
+        """Sample the source once and return ``(pressed, released)`` edge masks.
+
+        Both masks are 0 when nothing changed and no debouncer is busy, which
+        is the common case and costs one sample plus one XOR.
+        """
+        raw = self.source.sample()
+        active = (raw ^ self.state) | self.pending
+        if not active:
+            return 0, 0
+        if now is None:
+            now = time.monotonic_ns()
+        debouncers = self.debouncers
+        state = self.state
+        pending = self.pending
+        changed = 0
+        for i in bits(active):
+            bit = 1 << i
+            debouncer = debouncers[i]
+            if debouncer.update((raw >> i) & 1, now) != ((state >> i) & 1):
+                changed |= bit
+            if debouncer.busy:
+                pending |= bit
+            else:
+                pending &= ~bit
+        self.pending = pending
+        self.state = state ^ changed
+        return changed & self.state, changed & state
@@ -0,0 +1,3 @@
+"""Unmodified copies of library modules from before this series, with their
+relative imports made absolute, so the tests and benchmarks can check the
+new code against the old and time one against the other."""
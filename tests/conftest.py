@@ -0,0 +1,13 @@
+"""Run the firmware modules on a host: CircuitPython built-ins come from
+``tests/stubs``, the libraries from ``lib`` and the keyboard modules from the
+repository root."""
+
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+for path in (ROOT, os.path.join(ROOT, "lib"), HERE, os.path.join(HERE, "stubs")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,75 @@
+"""Fake devices shared by the tests and the benchmarks in ``bench``."""
+
+
+class FakeDevice:
+    """Records every report sent, like a ``usb_hid.Device`` on a host that
+    accepts them all."""
+
+    def __init__(self, usage_page, usage):
+        self.usage_page = usage_page
+        self.usage = usage
+        self.reports = []
+
+    def send_report(self, report, report_id=None):
+        self.reports.append(bytes(report))
+
+    def get_last_received_report(self, report_id=None):
+        return None
+
+
+def keyboard_device():
+    return FakeDevice(0x01, 0x06)
+
+
+def consumer_device():
+    return FakeDevice(0x0C, 0x01)
+
+
+def mouse_device():
+    return FakeDevice(0x01, 0x02)
+
+
+def _keys_down(report):
+    """Keycodes held in a boot (8-byte) or NKRO bitmap keyboard report."""
+    if len(report) == 8:
+        return {k for k in report[2:] if k}
+    return {
+        8 * i + bit for i, byte in enumerate(report[1:]) for bit in range(8) if byte >> bit & 1
+    }
+
+
+def typed_text(reports, layout, chars):
+    """Decode keyboard ``reports`` the way a host would: each key that goes
+    down types the character of ``layout`` for that key and the modifiers held
+    with it. Only ``chars`` are recognised, and none may need a dead key."""
+    strokes = {layout.strokes(char)[0]: char for char in chars}
+    text = []
+    down = set()
+    for report in reports:
+        now = _keys_down(report)
+        for keycode in sorted(now - down):
+            text.append(strokes[(report[0], keycode)])
+        down = now
+    return "".join(text)
+
+
+def glyphs_of(font, code_points):
+    """Every glyph of ``font`` as comparable values: pixels and metrics, or None."""
+    font.load_glyphs(code_points)
+    glyphs = {}
+    for code_point in code_points:
+        glyph = font.get_glyph(code_point)
+        if glyph is not None:
+            glyph = (bytes(glyph.bitmap.pixels),) + tuple(glyph[1:])
+        glyphs[code_point] = glyph
+    return glyphs
+
+
+def bitmap_readinto(bitmap, file, bits_per_pixel, element_size=1, reverse_pixels_in_element=False):
+    """``bitmaptools.readinto`` for byte-padded 1-bpp rows, most significant bit first."""
+    assert bits_per_pixel == 1 and element_size == 1 and reverse_pixels_in_element
+    row_bytes = (bitmap.width + 7) // 8
+    for y in range(bitmap.height):
+        row = file.read(row_bytes)
+        for x in range(bitmap.width):
+            bitmap[y * bitmap.width + x] = (row[x // 8] >> (7 - x % 8)) & 1
@@ -0,0 +1,17 @@
+"""Host stand-in for the parts of the CircuitPython ``displayio`` module the
+font loaders use."""
+
+
+class Bitmap:
+    """One byte per pixel, indexed like ``displayio.Bitmap``."""
+
+    def __init__(self, width, height, value_count):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(width * height)
+
+    def __getitem__(self, index):
+        return self.pixels[index]
+
+    def __setitem__(self, index, value):
+        self.pixels[index] = value
@@ -0,0 +1,7 @@
+"""Host stand-in for the CircuitPython ``fontio`` module."""
+
+from collections import namedtuple
+
+Glyph = namedtuple(
+    "Glyph", ("bitmap", "tile_index", "width", "height", "dx", "dy", "shift_x", "shift_y")
+)
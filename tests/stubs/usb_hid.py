@@ -0,0 +1,11 @@
+"""Host stand-in for the CircuitPython ``usb_hid`` module.
+
+No devices are enabled; tests pass their own fakes to the HID classes.
+"""
+
+
+class Device:
+    pass
+
+
+devices = []
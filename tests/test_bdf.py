@@ -0,0 +1,129 @@
+import os
+
+import pytest
+
+from adafruit_bitmap_font import bdf
+from adafruit_bitmap_font.bdf import BDF
+from baseline.bdf import BDF as BaselineBDF
+from displayio import Bitmap
+from fakes import bitmap_readinto, glyphs_of
+
+FONT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fonts", "terminal.bdf")
+
+
+def code_points():
+    with open(FONT, "rb") as f:
+        encodings = [int(line.split()[1]) for line in f if line.startswith(b"ENCODING")]
+    # Plus code points the font does not have.
+    return encodings + [5, 12345, 0x10FFFF]
+
+
+@pytest.fixture(scope="module")
+def baseline_glyphs():
+    with open(FONT, "rb") as f:
+        return glyphs_of(BaselineBDF(f, Bitmap), code_points())
+
+
+def test_glyphs_match_the_full_scan_loader(baseline_glyphs):
+    with open(FONT, "rb") as f:
+        assert glyphs_of(BDF(f, Bitmap), code_points()) == baseline_glyphs
+
+
+def test_glyphs_match_with_bitmaptools(baseline_glyphs, monkeypatch):
+    monkeypatch.setattr(bdf, "_bitmap_readinto", bitmap_readinto)
+    with open(FONT, "rb") as f:
+        assert glyphs_of(BDF(f, Bitmap), code_points()) == baseline_glyphs
+
+
+def test_saved_index_is_reused(tmp_path, baseline_glyphs):
+    index = str(tmp_path / "terminal.idx")
+    with open(FONT, "rb") as f:
+        BDF(f, Bitmap, index_path=index).load_glyphs("A")
+    assert os.path.getsize(index) > 0
+    with open(FONT, "rb") as f:
+        font = BDF(f, Bitmap, index_path=index)
+        font.load_glyphs("B")
+        assert glyphs_of(font, code_points()) == baseline_glyphs
+
+
+def test_stale_index_is_rebuilt(tmp_path):
+    index = tmp_path / "terminal.idx"
+    with open(FONT, "rb") as f:
+        BDF(f, Bitmap, index_path=str(index)).load_glyphs("A")
+    data = bytearray(index.read_bytes())
+    # The font size the index was built for.
+    data[8:12] = bytes(4)
+    index.write_bytes(bytes(data))
+    with open(FONT, "rb") as f:
+        font = BDF(f, Bitmap, index_path=str(index))
+        font.load_glyphs("A")
+        assert font.get_glyph(ord("A")) is not None
+    assert index.read_bytes()[8:12] != bytes(4)
+
+
+def edited_font(tmp_path, *edits):
+    """Copy of the font with each ``(old, new)`` edit made once, at the same size."""
+    with open(FONT, "rb") as f:
+        data = f.read()
+    for old, new in edits:
+        data = data.replace(old, new, 1)
+    with open(FONT, "rb") as f:
+        assert len(data) == len(f.read())
+    path = tmp_path / "edited.bdf"
+    path.write_bytes(data)
+    return str(path)
+
+
+def index_for(tmp_path, text):
+    index = str(tmp_path / "terminal.idx")
+    with open(FONT, "rb") as f:
+        BDF(f, Bitmap, index_path=index).load_glyphs(text)
+    return index
+
+
+@pytest.mark.parametrize(
+    "edits",
+    [
+        # Every glyph moves back by a line.
+        ((b"COMMENT ter-u12n\n", b""), (b"ENDFONT", b"ENDFONT" + b"\n" * 17)),
+        # Only the glyphs from B to Z move, forward by a line.
+        (
+            (b"ENCODING 65\nSWIDTH 500 0\n", b"ENCODING 65\nSWIDTH 500 0\nCOMMENT 1234\n"),
+            (b"ENCODING 90\nSWIDTH 500 0\n", b"ENCODING 90\n"),
+        ),
+    ],
+)
+def test_index_of_a_same_size_edited_font_is_rebuilt(tmp_path, edits):
+    index = index_for(tmp_path, "A")
+    path = edited_font(tmp_path, *edits)
+    with open(path, "rb") as f:
+        expected = glyphs_of(BaselineBDF(f, Bitmap), code_points())
+    with open(path, "rb") as f:
+        font = BDF(f, Bitmap, index_path=index)
+        font.load_glyphs("BMZ")
+        assert glyphs_of(font, code_points()) == expected
+    # The rebuilt index was saved and is now used as is.
+    with open(path, "rb") as f:
+        font = BDF(f, Bitmap, index_path=index)
+        assert font._read_index()
+        assert glyphs_of(font, code_points()) == expected
+
+
+def test_unwritable_index_is_ignored(tmp_path):
+    index = str(tmp_path / "missing" / "terminal.idx")
+    with open(FONT, "rb") as f:
+        font = BDF(f, Bitmap, index_path=index)
+        font.load_glyphs("A")
+        assert font.get_glyph(ord("A")) is not None
+
+
+def test_label_style_loads_count_misses():
+    with open(FONT, "rb") as f:
+        font = BDF(f, Bitmap)
+        text = "MACRO KEYBOARD"
+        font.load_glyphs(text)
+        assert font.cache_misses == len(set(text))
+        for char in text:
+            font.get_glyph(ord(char))
+        assert font.cache_misses == len(set(text))
+        assert font.cache_hits == len(text)
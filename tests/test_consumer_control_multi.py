@@ -0,0 +1,111 @@
+import struct
+
+import pytest
+
+from adafruit_hid.consumer_control import ConsumerControl
+from adafruit_hid.consumer_control_code import ConsumerControlCode
+from adafruit_hid.consumer_control_multi import MultiConsumerControl, consumer_report_descriptor
+from fakes import consumer_device
+
+VOLUME_UP = ConsumerControlCode.VOLUME_INCREMENT
+PLAY = ConsumerControlCode.PLAY_PAUSE
+NEXT = ConsumerControlCode.SCAN_NEXT_TRACK
+MUTE = ConsumerControlCode.MUTE
+
+
+def report(*codes):
+    return struct.pack("<%dH" % len(codes), *codes)
+
+
+def make(slots=4):
+    device = consumer_device()
+    return device, MultiConsumerControl(device, slots=slots)
+
+
+def test_press_and_release_across_slots():
+    device, cc = make()
+    cc.press(VOLUME_UP)
+    cc.press(NEXT)
+    cc.release(NEXT)
+    cc.press(PLAY)
+    cc.release(VOLUME_UP)
+    cc.release(PLAY)
+    assert device.reports == [
+        report(VOLUME_UP, 0, 0, 0),
+        report(VOLUME_UP, NEXT, 0, 0),
+        report(VOLUME_UP, 0, 0, 0),
+        report(VOLUME_UP, PLAY, 0, 0),
+        report(0, PLAY, 0, 0),
+        report(0, 0, 0, 0),
+    ]
+
+
+def test_pressing_a_held_code_keeps_its_slot():
+    device, cc = make()
+    cc.press(PLAY)
+    cc.press(PLAY)
+    assert device.reports == [report(PLAY, 0, 0, 0)] * 2
+
+
+def test_freed_slot_is_reused_first():
+    device, cc = make()
+    for code in (VOLUME_UP, PLAY, NEXT):
+        cc.press(code)
+    cc.release(VOLUME_UP)
+    cc.press(MUTE)
+    assert device.reports[-1] == report(MUTE, PLAY, NEXT, 0)
+
+
+def test_pressing_more_codes_than_slots_raises():
+    device, cc = make(slots=2)
+    cc.press(VOLUME_UP)
+    cc.press(PLAY)
+    with pytest.raises(ValueError):
+        cc.press(NEXT)
+    assert device.reports[-1] == report(VOLUME_UP, PLAY)
+    cc.release(PLAY)
+    cc.press(NEXT)
+    assert device.reports[-1] == report(VOLUME_UP, NEXT)
+
+
+def test_release_none_releases_everything_and_frees_all_slots():
+    device, cc = make(slots=3)
+    for code in (VOLUME_UP, PLAY, NEXT):
+        cc.press(code)
+    cc.release(None)
+    assert device.reports[-1] == report(0, 0, 0)
+    for code in (MUTE, PLAY, NEXT):
+        cc.press(code)
+    assert device.reports[-1] == report(MUTE, PLAY, NEXT)
+
+
+def test_releasing_a_code_that_is_not_held_sends_the_same_report():
+    device, cc = make()
+    cc.press(PLAY)
+    cc.release(NEXT)
+    assert device.reports[-1] == report(PLAY, 0, 0, 0)
+
+
+def test_send_taps_one_code_and_leaves_the_others_held():
+    device, cc = make()
+    cc.press(VOLUME_UP)
+    cc.send(NEXT)
+    assert device.reports[-2:] == [report(VOLUME_UP, NEXT, 0, 0), report(VOLUME_UP, 0, 0, 0)]
+
+
+def test_descriptor_matches_the_report_size():
+    descriptor = consumer_report_descriptor(slots=5, report_id=7)
+    assert descriptor[descriptor.index(0x85) + 1] == 7
+    assert descriptor[descriptor.index(0x95) + 1] == 5
+    assert descriptor[descriptor.index(0x75) + 1] == 16
+
+
+def test_single_code_release_only_releases_the_code_it_holds():
+    device = consumer_device()
+    cc = ConsumerControl(device)
+    cc.press(VOLUME_UP)
+    cc.press(NEXT)
+    cc.release(VOLUME_UP)
+    assert device.reports[-1] == report(NEXT)
+    cc.release(NEXT)
+    assert device.reports[-1] == report(0)
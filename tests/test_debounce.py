@@ -0,0 +1,35 @@
+from debounce import Deferred, Eager, Integrator, replay, score
+
+MS = 1_000_000
+# Press at 2 ms bouncing for 3 ms, release at 100 ms, one glitch at 60 ms.
+TRACE = [0, 0, 1, 0, 1, 1] + [1] * 54 + [0] + [1] * 39 + [0, 1, 0] + [0] * 60
+EXPECTED = [(2 * MS, 1), (100 * MS, 0)]
+
+
+def test_eager_reports_the_first_sample_and_ignores_bounce():
+    edges = replay(Eager(), TRACE[:60] + [1] * 40 + TRACE[100:], MS)
+    assert edges == [(2 * MS, 1), (100 * MS, 0)]
+    assert score(edges, EXPECTED) == (0, 0, 0)
+
+
+def test_eager_passes_glitches():
+    edges = replay(Eager(), TRACE, MS)
+    _, false_triggers, _ = score(edges, EXPECTED)
+    assert false_triggers > 0
+
+
+def test_deferred_waits_for_a_stable_level():
+    edges = replay(Deferred(3 * MS), TRACE, MS)
+    assert edges == [(7 * MS, 1), (105 * MS, 0)]
+    assert score(edges, EXPECTED) == (5 * MS, 0, 0)
+
+
+def test_integrator_rejects_glitches():
+    edges = replay(Integrator(3), TRACE, MS)
+    worst, false_triggers, missed = score(edges, EXPECTED)
+    assert (false_triggers, missed) == (0, 0)
+    assert worst <= 6 * MS
+
+
+def test_score_counts_missed_edges():
+    assert score([(2 * MS, 1)], EXPECTED) == (0, 0, 1)
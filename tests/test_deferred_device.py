@@ -0,0 +1,93 @@
+import adafruit_hid
+import usb_hid
+from adafruit_hid import DeferredDevice, find_device
+from adafruit_hid.consumer_control import ConsumerControl
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+from adafruit_hid.keycode import Keycode
+from fakes import FakeDevice, consumer_device, keyboard_device, typed_text
+
+
+class Runtime:
+    usb_connected = False
+
+
+class Supervisor:
+    runtime = Runtime()
+
+
+class UsbDevice(usb_hid.Device, FakeDevice):
+    pass
+
+
+def connected(monkeypatch, value=False):
+    supervisor = Supervisor()
+    supervisor.runtime.usb_connected = value
+    monkeypatch.setattr(adafruit_hid, "supervisor", supervisor)
+    return supervisor
+
+
+def test_reports_queue_until_ready_then_flush_in_order(monkeypatch):
+    supervisor = connected(monkeypatch)
+    device = consumer_device()
+    deferred = DeferredDevice(device)
+    cc = ConsumerControl(deferred)
+    cc.send(0xCD)
+    assert device.reports == []
+    assert not deferred.poll()
+    supervisor.runtime.usb_connected = True
+    assert deferred.poll()
+    assert device.reports == [b"\xcd\x00", b"\x00\x00"]
+    cc.send(0xB5)
+    assert device.reports[2:] == [b"\xb5\x00", b"\x00\x00"]
+
+
+def test_on_ready_is_called_once_after_the_flush(monkeypatch):
+    supervisor = connected(monkeypatch)
+    device = consumer_device()
+    seen = []
+    deferred = DeferredDevice(device, on_ready=lambda: seen.append(list(device.reports)))
+    ConsumerControl(deferred).press(0xCD)
+    deferred.poll()
+    assert seen == []
+    supervisor.runtime.usb_connected = True
+    deferred.poll()
+    deferred.poll()
+    assert seen == [[b"\xcd\x00"]]
+
+
+def test_a_full_queue_keeps_the_latest_state(monkeypatch):
+    supervisor = connected(monkeypatch)
+    device = keyboard_device()
+    deferred = DeferredDevice(device, queue_size=4)
+    layout = KeyboardLayoutUS(Keyboard(deferred))
+    layout.write("hello")
+    keyboard = layout.keyboard
+    keyboard.press(Keycode.SHIFT)
+    supervisor.runtime.usb_connected = True
+    deferred.poll()
+    # No key is left down, and the shift still held is.
+    assert device.reports[-1] == bytes((0x02, 0, 0, 0, 0, 0, 0, 0))
+    assert deferred.replaced > 0
+    keyboard.release_all()
+    assert device.reports[-1] == bytes(8)
+
+
+def test_below_queue_size_every_report_is_kept(monkeypatch):
+    supervisor = connected(monkeypatch)
+    device = keyboard_device()
+    deferred = DeferredDevice(device, queue_size=64)
+    layout = KeyboardLayoutUS(Keyboard(deferred))
+    layout.write("hello")
+    supervisor.runtime.usb_connected = True
+    deferred.poll()
+    assert typed_text(device.reports, layout, "helo") == "hello"
+    assert deferred.replaced == 0
+
+
+def test_find_device_without_waiting(monkeypatch):
+    connected(monkeypatch)
+    device = UsbDevice(0x0C, 0x01)
+    deferred = find_device([keyboard_device(), device], usage_page=0x0C, usage=0x01, wait=False)
+    assert isinstance(deferred, DeferredDevice)
+    assert (deferred.usage_page, deferred.usage) == (0x0C, 0x01)
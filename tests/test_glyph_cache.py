@@ -0,0 +1,111 @@
+from adafruit_bitmap_font.glyph_cache import GlyphCache
+from displayio import Bitmap
+from fontio import Glyph
+
+# 64 bytes of overhead plus eight 32-bit rows.
+GLYPH = 96
+
+
+class FakeFont(GlyphCache):
+    """Every code point is an 8x8 glyph; ``loads`` records each load."""
+
+    def __init__(self, budget=None):
+        super().__init__()
+        self.cache_budget = budget
+        self.loads = []
+
+    def load_glyphs(self, code_points):
+        for code_point in sorted(self._to_load(code_points)):
+            self.loads.append(code_point)
+            self._glyphs[code_point] = Glyph(Bitmap(8, 8, 2), 0, 8, 8, 0, 0, 8, 0)
+
+
+def cached(font):
+    return sorted(code_point for code_point in range(128) if code_point in font._glyphs)
+
+
+def test_unused_glyphs_go_in_the_order_they_came():
+    font = FakeFont(budget=3 * GLYPH)
+    for code_point in range(5):
+        font.get_glyph(code_point)
+    assert cached(font) == [2, 3, 4]
+    assert font.cache_evictions == 2
+    assert font.cache_size == 3 * GLYPH
+
+
+def test_a_used_glyph_gets_a_second_chance():
+    font = FakeFont(budget=3 * GLYPH)
+    for code_point in range(3):
+        font.get_glyph(code_point)
+    font.get_glyph(0)
+    font.get_glyph(3)
+    assert cached(font) == [0, 2, 3]
+    font.get_glyph(4)
+    font.get_glyph(5)
+    assert cached(font) == [0, 4, 5]
+    # The hand has come round again and 0 has not been used since.
+    font.get_glyph(6)
+    assert cached(font) == [4, 5, 6]
+
+
+def test_pinned_glyphs_stay_until_unpinned():
+    font = FakeFont(budget=2 * GLYPH)
+    font.pin("AB")
+    for char in "ABCDE":
+        font.get_glyph(ord(char))
+    assert cached(font) == [ord("A"), ord("B"), ord("E")]
+    font.unpin("AB")
+    assert font.cache_size <= 2 * GLYPH
+    assert ord("E") in font._glyphs
+
+
+def test_all_pinned_stops_after_two_turns():
+    font = FakeFont(budget=GLYPH)
+    font.pin(range(4))
+    for code_point in range(4):
+        font.get_glyph(code_point)
+    assert cached(font) == [0, 1, 2, 3]
+    assert font.cache_size == 4 * GLYPH
+    assert font.cache_evictions == 0
+
+
+def test_the_glyph_being_added_is_kept():
+    font = FakeFont(budget=GLYPH // 2)
+    assert font.get_glyph(1) is not None
+    assert font.get_glyph(2) is not None
+    assert cached(font) == [2]
+
+
+def test_counters():
+    font = FakeFont(budget=2 * GLYPH)
+    for code_point in (0, 1, 0, 2, 0, 1):
+        font.get_glyph(code_point)
+    assert font.cache_hits == 2
+    assert font.cache_misses == 4
+    assert font.loads == [0, 1, 2, 1]
+    assert font.cache_evictions == 2
+
+
+def test_batch_loads_count_misses_once_per_glyph():
+    font = FakeFont()
+    font.load_glyphs("HELLO")
+    assert font.cache_misses == 4
+    for char in "HELLO":
+        font.get_glyph(ord(char))
+    assert font.cache_misses == 4
+    assert font.cache_hits == 5
+    font.load_glyphs("HELP")
+    assert font.cache_misses == 5
+    assert font.loads == [ord(c) for c in "EHLOP"]
+
+
+def test_lowering_the_budget_evicts():
+    font = FakeFont()
+    for code_point in range(6):
+        font.get_glyph(code_point)
+    font.get_glyph(0)
+    # Nothing is marked used without a budget.
+    assert not font._glyphs._referenced
+    font.cache_budget = 2 * GLYPH
+    assert cached(font) == [4, 5]
+    assert font.cache_evictions == 4
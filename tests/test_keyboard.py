@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keycode import Keycode
+from baseline.keyboard import Keyboard as BaselineKeyboard
+from fakes import keyboard_device
+
+# A small pool, so sequences hit repeated presses and the six-key overflow often.
+KEYCODES = tuple(range(Keycode.A, Keycode.A + 10)) + (Keycode.SHIFT, Keycode.RIGHT_ALT)
+
+
+def random_operations(rng, count):
+    operations = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            operations.append(("release_all", ()))
+        else:
+            keycodes = tuple(rng.choice(KEYCODES) for _ in range(rng.randrange(1, 4)))
+            operations.append(("press" if roll < 0.55 else "release", keycodes))
+    return operations
+
+
+def reports_of(keyboard_class, operations):
+    device = keyboard_device()
+    keyboard = keyboard_class(device)
+    for name, keycodes in operations:
+        getattr(keyboard, name)(*keycodes)
+    return device.reports
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_reports_match_the_baseline_keyboard(seed):
+    operations = random_operations(random.Random(seed), 400)
+    assert reports_of(Keyboard, operations) == reports_of(BaselineKeyboard, operations)
+
+
+def test_seventh_key_shuffles_out_the_oldest():
+    device = keyboard_device()
+    keyboard = Keyboard(device)
+    keyboard.press(*range(Keycode.A, Keycode.A + 7))
+    assert device.reports[-1][2:] == bytes(range(Keycode.A + 1, Keycode.A + 7))
+    keyboard.release(Keycode.A + 3)
+    assert device.reports[-1][2:] == bytes((5, 6, 8, 9, 10, 0))
+    keyboard.press(Keycode.A + 3)
+    assert device.reports[-1][2:] == bytes((5, 6, 8, 9, 10, 7))
@@ -0,0 +1,123 @@
+import pytest
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_layout_base import KeyboardLayoutBase
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+from adafruit_hid.keyboard_nkro import KeyboardNKRO
+from baseline.keyboard_layout_base import KeyboardLayoutBase as BaselineLayoutBase
+from fakes import keyboard_device, typed_text
+
+SHIFT = 0x80
+# Keycodes of the US keys used below.
+A, E, N, U, GRAVE, QUOTE, SIX = 0x04, 0x08, 0x11, 0x18, 0x35, 0x34, 0x23
+
+
+class Tables:
+    """A layout exercising every table: HIGHER_ASCII by ord and by character,
+    NEED_ALTGR and dead-key COMBINED_KEYS, with overlaps between them."""
+
+    ASCII_TO_KEYCODE = KeyboardLayoutUS.ASCII_TO_KEYCODE
+    HIGHER_ASCII = {
+        # chr(len(ASCII_TO_KEYCODE)), the first code point past the ASCII table.
+        0x80: E | SHIFT,
+        0xE9: E,
+        "é": A,  # shadowed by the ord() entry
+        "€": E,
+        0xE8: 0,  # falls through to COMBINED_KEYS
+        0xFC: U | SHIFT,  # also in COMBINED_KEYS, which it shadows
+    }
+    NEED_ALTGR = "€@"
+    COMBINED_KEYS = {
+        0xF1: (GRAVE | SHIFT) << 8 | ord("n"),  # ñ: shifted dead key
+        0xE8: GRAVE << 8 | ord("e"),  # è
+        0xEA: (SIX | SHIFT) << 8 | 0x80 | ord("e"),  # ê: dead key with AltGr
+        0xFC: QUOTE << 8 | ord("u"),
+        0xC9: QUOTE << 8 | ord("E"),  # É: shifted second stroke
+    }
+
+
+class Layout(Tables, KeyboardLayoutBase):
+    pass
+
+
+class BaselineLayout(Tables, BaselineLayoutBase):
+    pass
+
+
+class BaselineLayoutUS(BaselineLayoutBase):
+    ASCII_TO_KEYCODE = KeyboardLayoutUS.ASCII_TO_KEYCODE
+
+
+# The whole ASCII table, the table edge and everything the layout maps.
+CHARS = [chr(c) for c in range(0x200)] + ["€", "\U0001f600"]
+
+
+def outcome(function):
+    try:
+        return function()
+    except (ValueError, IndexError) as error:
+        return type(error)
+
+
+def write_reports(layout_class, char):
+    device = keyboard_device()
+    layout = layout_class(Keyboard(device))
+    result = outcome(lambda: layout.write(char))
+    return result, device.reports
+
+
+@pytest.mark.parametrize(
+    "layout_class, baseline_class",
+    [(Layout, BaselineLayout), (KeyboardLayoutUS, BaselineLayoutUS)],
+)
+def test_write_and_keycodes_match_the_baseline(layout_class, baseline_class):
+    layout = layout_class(Keyboard(keyboard_device()))
+    baseline = baseline_class(Keyboard(keyboard_device()))
+    edge = chr(len(layout.ASCII_TO_KEYCODE))
+    for char in CHARS:
+        if char == edge:
+            continue
+        assert write_reports(layout_class, char) == write_reports(baseline_class, char), char
+        assert outcome(lambda: list(layout.keycodes(char))) == outcome(
+            lambda: list(baseline.keycodes(char))
+        ), char
+
+
+def test_first_code_point_past_the_ascii_table():
+    edge = chr(len(Layout.ASCII_TO_KEYCODE))
+    # The baseline indexed past the end of ASCII_TO_KEYCODE.
+    assert write_reports(BaselineLayout, edge)[0] is IndexError
+    layout = Layout(Keyboard(keyboard_device()))
+    assert list(layout.keycodes(edge)) == [0xE1, E]
+    us = KeyboardLayoutUS(Keyboard(keyboard_device()))
+    with pytest.raises(ValueError):
+        us.keycodes(edge)
+
+
+def test_strokes_of_dead_key_characters():
+    layout = Layout(Keyboard(keyboard_device()))
+    assert layout.strokes("ñ") == ((0x02, GRAVE), (0, N))
+    assert layout.strokes("ê") == ((0x42, SIX), (0, E))
+    assert layout.strokes("É") == ((0, QUOTE), (0x02, E))
+    with pytest.raises(ValueError):
+        layout.keycodes("ñ")
+
+
+@pytest.mark.parametrize("keyboard_class", [Keyboard, KeyboardNKRO])
+def test_write_fast_types_the_same_text(keyboard_class):
+    text = "Hello,  World! AAaa 1234\n"
+    device = keyboard_device()
+    layout = KeyboardLayoutUS(keyboard_class(device))
+    layout.write_fast(text)
+    assert typed_text(device.reports, layout, text) == text
+    assert len(device.reports) < 2 * len(text)
+    assert not any(device.reports[-1])
+
+
+def test_write_fast_releases_keys_when_a_character_fails():
+    device = keyboard_device()
+    layout = KeyboardLayoutUS(Keyboard(device))
+    with pytest.raises(ValueError):
+        layout.write_fast("abé")
+    assert typed_text(device.reports, layout, "ab") == "ab"
+    assert not any(device.reports[-1])
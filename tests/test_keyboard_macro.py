@@ -0,0 +1,95 @@
+import pytest
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+from adafruit_hid.keyboard_macro import MacroPlayer, compile_keys, compile_string
+from adafruit_hid.keyboard_nkro import NKRO_REPORT_LENGTH, KeyboardNKRO
+from adafruit_hid.keycode import Keycode
+from fakes import keyboard_device, typed_text
+
+TEXT = "Hello, World! 42\n"
+
+
+def make_layout():
+    device = keyboard_device()
+    return device, KeyboardLayoutUS(Keyboard(device))
+
+
+def test_compiled_string_types_the_string():
+    device, layout = make_layout()
+    macro = compile_string(layout, TEXT)
+    assert len(macro) == 2 * len(TEXT)
+    MacroPlayer(layout.keyboard).play(macro)
+    assert typed_text(device.reports, layout, TEXT) == TEXT
+    assert device.reports[-1] == bytes(8)
+
+
+def test_compile_keys_presses_chords_at_once():
+    macro = compile_keys([(Keycode.CONTROL, Keycode.C), Keycode.ENTER])
+    assert bytes(macro.reports) == (
+        bytes((0x01, 0, Keycode.C, 0, 0, 0, 0, 0))
+        + bytes(8)
+        + bytes((0, 0, Keycode.ENTER, 0, 0, 0, 0, 0))
+        + bytes(8)
+    )
+
+
+def test_compile_keys_refuses_more_than_six_keys():
+    with pytest.raises(ValueError):
+        compile_keys([tuple(range(Keycode.A, Keycode.A + 7))])
+
+
+def test_tick_sends_one_report_and_restores_held_keys():
+    device, layout = make_layout()
+    keyboard = layout.keyboard
+    keyboard.press(Keycode.SHIFT)
+    player = MacroPlayer(keyboard)
+    player.start(compile_keys([Keycode.A]))
+    device.reports.clear()
+    assert player.tick()
+    assert len(device.reports) == 1
+    assert not player.tick()
+    assert not player.playing
+    assert device.reports[-1] == bytes(keyboard.report)
+
+
+def test_cancel_restores_held_keys():
+    device, layout = make_layout()
+    player = MacroPlayer(layout.keyboard)
+    player.start(compile_string(layout, "abc"))
+    player.tick()
+    player.cancel()
+    assert not player.playing
+    assert device.reports[-1] == bytes(8)
+
+
+def test_nkro_macro_uses_the_bitmap_report():
+    device = keyboard_device()
+    layout = KeyboardLayoutUS(KeyboardNKRO(device))
+    macro = compile_string(layout, TEXT)
+    assert macro.report_size == NKRO_REPORT_LENGTH
+    MacroPlayer(layout.keyboard).play(macro)
+    assert {len(report) for report in device.reports} == {NKRO_REPORT_LENGTH}
+    assert typed_text(device.reports, layout, TEXT) == TEXT
+
+
+def test_nkro_chord_is_not_limited_to_six_keys():
+    keyboard = KeyboardNKRO(keyboard_device())
+    keycodes = tuple(range(Keycode.A, Keycode.A + 8))
+    macro = compile_keys([(Keycode.SHIFT,) + keycodes], keyboard)
+    player = MacroPlayer(keyboard)
+    player.start(macro)
+    player.tick()
+    report = keyboard._keyboard_device.reports[0]
+    assert report[0] == 0x02
+    assert report[1:] == bytes((0xF0, 0x0F)) + bytes(14)
+
+
+def test_player_refuses_a_macro_for_another_report_layout():
+    _, layout = make_layout()
+    macro = compile_keys([Keycode.A])
+    player = MacroPlayer(KeyboardNKRO(keyboard_device()))
+    with pytest.raises(ValueError):
+        player.play(macro)
+    with pytest.raises(ValueError):
+        player.start(compile_string(layout, "a"))
@@ -0,0 +1,185 @@
+from adafruit_hid.consumer_control import ConsumerControl
+from adafruit_hid.consumer_control_multi import MultiConsumerControl
+from fakes import consumer_device
+from keymap import Action, Keymap, LayerTap, Media, Momentary, Repeat, TapHold, Toggle
+from repeat import Repeater
+
+PLAY = b"\xcd\x00"
+NEXT = b"\xb5\x00"
+UP = b"\x00\x00"
+MS = 1_000_000
+
+
+def test_media_sends_its_packed_report():
+    device = consumer_device()
+    cc = ConsumerControl(device)
+    keymap = Keymap([[Media(0xCD), Repeat(Media(0xB5))]], consumer_control=cc, repeater=Repeater())
+    keymap.press(0, 0)
+    keymap.release(0, 1)
+    assert device.reports == [PLAY, UP]
+    # The control still knows what is held.
+    keymap.press(1, 2)
+    cc.release(0xCD)
+    assert device.reports == [PLAY, UP, NEXT]
+
+
+def test_media_release_keeps_a_code_pressed_since():
+    device = consumer_device()
+    keymap = Keymap([[Media(0xCD), Media(0xB5)]], consumer_control=ConsumerControl(device))
+    keymap.press(0, 0)
+    keymap.press(1, 1)
+    keymap.release(0, 2)
+    assert device.reports == [PLAY, NEXT]
+    keymap.release(1, 3)
+    assert device.reports == [PLAY, NEXT, UP]
+
+
+def test_media_on_a_multi_code_control():
+    device = consumer_device()
+    keymap = Keymap(
+        [[Media(0xCD), Media(0xB5)]], consumer_control=MultiConsumerControl(device, slots=2)
+    )
+    keymap.press(0, 0)
+    keymap.press(1, 1)
+    keymap.release(0, 2)
+    assert device.reports == [b"\xcd\x00\x00\x00", b"\xcd\x00\xb5\x00", b"\x00\x00\xb5\x00"]
+
+
+class Log(Action):
+    """Records its presses and releases in ``log`` as ``(name, "down"/"up", time)``."""
+
+    def __init__(self, name, log):
+        self.name = name
+        self.label = name
+        self.log = log
+
+    def press(self, keymap, key, now):
+        self.log.append((self.name, "down", now))
+
+    def release(self, keymap, key, now):
+        self.log.append((self.name, "up", now))
+
+
+def layered(log):
+    a, b, x, shift = (Log(name, log) for name in ("a", "b", "x", "shift"))
+    return Keymap(
+        [
+            [Momentary(1), Toggle(2), a, TapHold(x, shift), LayerTap(1, x)],
+            [None, None, b, None, None],
+            [None, None, Log("c", log), None, None],
+        ]
+    )
+
+
+def test_momentary_layer_is_active_while_held():
+    log = []
+    keymap = layered(log)
+    keymap.press(0, 0)
+    keymap.press(2, 1)
+    keymap.release(2, 2)
+    keymap.release(0, 3)
+    keymap.press(2, 4)
+    assert [name for name, _, _ in log] == ["b", "b", "a"]
+    assert keymap.active == 1
+
+
+def test_toggle_layer_stays_until_pressed_again():
+    log = []
+    keymap = layered(log)
+    keymap.press(1, 0)
+    keymap.release(1, 1)
+    keymap.press(2, 2)
+    keymap.release(2, 3)
+    keymap.press(1, 4)
+    keymap.press(2, 5)
+    assert [name for name, _, _ in log] == ["c", "c", "a"]
+
+
+def test_higher_layer_wins_when_both_are_active():
+    log = []
+    keymap = layered(log)
+    keymap.press(1, 0)
+    keymap.press(0, 1)
+    keymap.press(2, 2)
+    assert log == [("c", "down", 2)]
+
+
+def test_release_goes_to_the_action_it_was_pressed_with():
+    log = []
+    keymap = layered(log)
+    keymap.press(0, 0)
+    keymap.press(2, 1)
+    # The layer goes away while the key is still down.
+    keymap.release(0, 2)
+    assert keymap.release(2, 3) == "b"
+    assert log == [("b", "down", 1), ("b", "up", 3)]
+
+
+def test_tap_hold_tapped_within_the_term():
+    log = []
+    keymap = layered(log)
+    keymap.press(3, 0)
+    assert keymap.busy
+    keymap.tick(100 * MS)
+    assert log == []
+    assert keymap.release(3, 150 * MS) == "x"
+    assert log == [("x", "down", 150 * MS), ("x", "up", 150 * MS)]
+    assert not keymap.busy
+
+
+def test_tap_hold_held_past_the_term():
+    log = []
+    keymap = layered(log)
+    keymap.press(3, 0)
+    for now in range(0, 260 * MS, 10 * MS):
+        keymap.tick(now)
+    assert log == [("shift", "down", 200 * MS)]
+    assert not keymap.busy
+    assert keymap.release(3, 300 * MS) is None
+    assert log[-1] == ("shift", "up", 300 * MS)
+
+
+def test_another_key_interrupts_an_undecided_hold():
+    log = []
+    keymap = layered(log)
+    keymap.press(3, 0)
+    keymap.press(2, 50 * MS)
+    keymap.release(2, 60 * MS)
+    keymap.release(3, 70 * MS)
+    assert log == [
+        ("shift", "down", 50 * MS),
+        ("a", "down", 50 * MS),
+        ("a", "up", 60 * MS),
+        ("shift", "up", 70 * MS),
+    ]
+
+
+def test_layer_tap_interrupted_selects_the_layer():
+    log = []
+    keymap = layered(log)
+    keymap.press(4, 0)
+    keymap.press(2, 10 * MS)
+    keymap.release(4, 20 * MS)
+    # Released after the layer went away, but still goes to b.
+    keymap.release(2, 30 * MS)
+    assert log == [("b", "down", 10 * MS), ("b", "up", 30 * MS)]
+    assert keymap.active == 1
+
+
+def test_layer_tap_tapped_sends_the_tap():
+    log = []
+    keymap = layered(log)
+    keymap.press(4, 0)
+    keymap.release(4, 10 * MS)
+    assert log == [("x", "down", 10 * MS), ("x", "up", 10 * MS)]
+    assert keymap.active == 1
+
+
+def test_layer_tables_are_cached_per_mask():
+    keymap = layered([])
+    keymap.press(0, 0)
+    table = keymap.table
+    keymap.release(0, 1)
+    keymap.press(0, 2)
+    assert keymap.table is table
+    assert set(keymap.tables) == {1, 3}
@@ -0,0 +1,13 @@
+import bisect
+import random
+from array import array
+
+from lower_bound import lower_bound
+
+
+def test_matches_bisect_left():
+    rng = random.Random(22)
+    for size in (0, 1, 2, 7, 100):
+        values = array("I", sorted(rng.randrange(50) for _ in range(size)))
+        for value in range(-1, 52):
+            assert lower_bound(values, value) == bisect.bisect_left(values, value)
@@ -0,0 +1,58 @@
+from matrix import KeyMatrix, SimulatedMatrix
+
+
+def make_matrix(columns_to_anodes=True, diodes=True, reject_ghosts=None):
+    wiring = SimulatedMatrix(3, 4, columns_to_anodes=columns_to_anodes, diodes=diodes)
+    matrix = KeyMatrix(
+        wiring.rows,
+        wiring.columns,
+        columns_to_anodes=columns_to_anodes,
+        diodes=diodes,
+        reject_ghosts=reject_ghosts,
+    )
+    return wiring, matrix
+
+
+def test_key_bit_is_row_times_columns_plus_column():
+    for columns_to_anodes in (True, False):
+        wiring, matrix = make_matrix(columns_to_anodes)
+        wiring.pressed.update({(0, 1), (2, 3)})
+        assert matrix.sample() == (1 << 1) | (1 << 11)
+
+
+def test_diodes_prevent_ghosts():
+    wiring, matrix = make_matrix()
+    wiring.pressed.update({(0, 0), (0, 1), (1, 0)})
+    assert matrix.sample() == 0b10011
+    assert matrix.ghosts == 0
+
+
+def test_ghosts_are_rejected_only_without_diodes():
+    assert not make_matrix()[1].reject_ghosts
+    assert make_matrix(diodes=False)[1].reject_ghosts
+    assert make_matrix(reject_ghosts=True)[1].reject_ghosts
+
+
+def test_a_diode_matrix_reads_every_key_of_a_rectangle():
+    wiring, matrix = make_matrix()
+    wiring.pressed.update({(0, 0), (0, 1), (1, 0), (1, 1)})
+    assert matrix.sample() == 0b110011
+    assert matrix.ghosts == 0
+
+
+def test_ghost_rectangle_keeps_previous_state():
+    wiring, matrix = make_matrix(diodes=False)
+    wiring.pressed.update({(0, 0), (0, 1)})
+    assert matrix.sample() == 0b11
+    wiring.pressed.add((1, 0))
+    # (1, 1) reads as pressed too; the whole rectangle holds its old state.
+    assert matrix.sample() == 0b11
+    assert matrix.ghosts == 0b110011
+    wiring.pressed.discard((0, 1))
+    assert matrix.sample() == 0b10001
+
+
+def test_ghosts_pass_through_when_not_rejected():
+    wiring, matrix = make_matrix(diodes=False, reject_ghosts=False)
+    wiring.pressed.update({(0, 0), (0, 1), (1, 0)})
+    assert matrix.sample() == 0b110011
@@ -0,0 +1,64 @@
+import importlib.util
+import os
+
+import pytest
+
+from adafruit_bitmap_font import bitmap_font, mkf
+from adafruit_bitmap_font.bdf import BDF
+from displayio import Bitmap
+from fakes import bitmap_readinto, glyphs_of
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BDF_FONT = os.path.join(ROOT, "fonts", "terminal.bdf")
+MKF_FONT = os.path.join(ROOT, "fonts", "terminal.mkf")
+
+
+def code_points():
+    with open(BDF_FONT, "rb") as f:
+        encodings = [int(line.split()[1]) for line in f if line.startswith(b"ENCODING")]
+    # Plus code points the font does not have.
+    return encodings + [5, 12345, 0x10FFFF]
+
+
+@pytest.fixture(scope="module")
+def bdf_glyphs():
+    with open(BDF_FONT, "rb") as f:
+        return glyphs_of(BDF(f, Bitmap), code_points())
+
+
+def test_glyphs_match_bdf_without_bitmaptools(bdf_glyphs):
+    with open(MKF_FONT, "rb") as f:
+        assert glyphs_of(mkf.MKF(f, Bitmap), code_points()) == bdf_glyphs
+
+
+def test_glyphs_match_bdf_with_bitmaptools(bdf_glyphs, monkeypatch):
+    monkeypatch.setattr(mkf, "_bitmap_readinto", bitmap_readinto)
+    with open(MKF_FONT, "rb") as f:
+        assert glyphs_of(mkf.MKF(f, Bitmap), code_points()) == bdf_glyphs
+
+
+def test_load_font_reads_the_header():
+    font = bitmap_font.load_font(MKF_FONT, Bitmap)
+    with open(BDF_FONT, "rb") as f:
+        source = BDF(f, Bitmap)
+        assert isinstance(font, mkf.MKF)
+        assert (font.ascent, font.descent) == (source.ascent, source.descent)
+        assert font.get_bounding_box() == source.get_bounding_box()
+
+
+def test_bad_magic_is_rejected(tmp_path):
+    path = tmp_path / "bad.mkf"
+    path.write_bytes(b"MKF0" + bytes(64))
+    with open(path, "rb") as f:
+        with pytest.raises(ValueError):
+            mkf.MKF(f, Bitmap)
+
+
+def test_converter_reproduces_the_shipped_font(tmp_path):
+    spec = importlib.util.spec_from_file_location("mkfont", os.path.join(ROOT, "tools", "mkfont.py"))
+    mkfont = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mkfont)
+    path = str(tmp_path / "terminal.mkf")
+    mkfont.convert(BDF_FONT, path)
+    with open(path, "rb") as new, open(MKF_FONT, "rb") as shipped:
+        assert new.read() == shipped.read()
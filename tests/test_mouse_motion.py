@@ -0,0 +1,101 @@
+import random
+
+from adafruit_hid.mouse import Mouse
+from adafruit_hid.mouse_motion import Acceleration, MouseMotion
+from fakes import mouse_device
+
+MS = 1_000_000
+
+
+class FakeMouse:
+    def __init__(self):
+        self.moves = []
+
+    def move(self, x=0, y=0, wheel=0):
+        self.moves.append((x, y, wheel))
+
+
+def curve_distance(curve, seconds):
+    """Exact integral of ``curve`` over the first ``seconds`` of motion."""
+    ramp = curve.ramp_ns / 1e9
+    if seconds <= ramp:
+        return seconds * (
+            curve.initial
+            + (curve.maximum - curve.initial) * (seconds / ramp) ** curve.exponent / (curve.exponent + 1)
+        )
+    return curve_distance(curve, ramp) + curve.maximum * (seconds - ramp)
+
+
+def test_jittered_ticks_move_smoothly_and_stop_on_release():
+    rng = random.Random(16)
+    mouse = FakeMouse()
+    motion = MouseMotion(mouse)
+    motion.press(x=1, now=0)
+    now = 0
+    ticks = 0
+    while now < 2000 * MS:
+        # A 1 ms scan with +/-0.3 ms of jitter.
+        now += MS + rng.randrange(-300_000, 300_001)
+        motion.tick(now)
+        ticks += 1
+    motion.release(x=1)
+    assert not motion.moving
+
+    assert len(mouse.moves) <= ticks
+    assert all(y == 0 and wheel == 0 for _, y, wheel in mouse.moves)
+    assert max(x for x, _, _ in mouse.moves) <= 2
+    assert abs(sum(x for x, _, _ in mouse.moves) - curve_distance(motion.curve, now / 1e9)) < 2
+
+    moves = len(mouse.moves)
+    motion.tick(now + 10 * MS)
+    assert len(mouse.moves) == moves
+
+
+def test_slow_motion_carries_fractions():
+    mouse = FakeMouse()
+    motion = MouseMotion(mouse, Acceleration(100, 100, 0.1, 1))
+    motion.press(y=-1, now=0)
+    for i in range(1, 101):
+        motion.tick(i * MS)
+    # 100 units/s for 0.1 s: about one unit every 10 ms, none lost.
+    assert set(mouse.moves) == {(0, -1, 0)}
+    assert 9 <= len(mouse.moves) <= 10
+
+
+def test_a_late_tick_carries_distance_past_the_report_limit():
+    mouse = FakeMouse()
+    motion = MouseMotion(mouse, Acceleration(1000, 1000, 0.1, 1))
+    motion.press(x=1, now=0)
+    motion.tick(300 * MS)
+    assert mouse.moves == [(127, 0, 0)]
+    assert motion.moving
+    motion.tick(300 * MS)
+    motion.tick(300 * MS)
+    assert [x for x, _, _ in mouse.moves] == [127, 127, 46]
+
+
+def test_drives_a_real_mouse():
+    device = mouse_device()
+    motion = MouseMotion(Mouse(device))
+    motion.press(x=-1, wheel=1, now=0)
+    motion.tick(100 * MS)
+    assert len(device.reports) == 1
+    report = device.reports[0]
+    # Buttons, x (negative), y, wheel.
+    assert report[0] == 0 and report[1] > 127 and report[2] == 0 and report[3] == 1
+
+
+def test_releasing_a_cancelling_key_starts_motion_afresh():
+    mouse = FakeMouse()
+    motion = MouseMotion(mouse)
+    motion.press(x=1, now=0)
+    motion.tick(10 * MS)
+    motion.press(x=-1, now=10 * MS)
+    assert not motion.moving
+    # Both held for three seconds, then the right key goes up.
+    motion.release(x=1, now=3010 * MS)
+    moves = len(mouse.moves)
+    for i in range(1, 11):
+        motion.tick((3010 + i) * MS)
+    assert all(-1 <= x <= 0 for x, _, _ in mouse.moves[moves:])
+    assert sum(x for x, _, _ in mouse.moves[moves:]) == int(-curve_distance(motion.curve, 0.01))
@@ -0,0 +1,86 @@
+from adafruit_hid.consumer_control import ConsumerControl
+from fakes import consumer_device
+from keymap import Keymap, Media, Repeat
+from repeat import Repeater
+
+MS = 1_000_000
+
+
+def run(repeater, start, end, step=MS):
+    """Tick ``repeater`` on a simulated clock and return ``(key, time)`` of every repeat."""
+    fired = []
+    for now in range(start, end + 1, step):
+        repeater.tick(now, lambda key, now: fired.append((key, now)))
+    return fired
+
+
+def test_first_repeat_at_the_delay_then_every_interval():
+    repeater = Repeater()
+    repeater.start(3, 0)
+    fired = run(repeater, 0, 1000 * MS)
+    assert [now for _, now in fired] == [(400 + 80 * i) * MS for i in range(8)]
+    assert {key for key, _ in fired} == {3}
+
+
+def test_keys_keep_their_own_timing():
+    repeater = Repeater()
+    repeater.start(0, 0)
+    repeater.start(1, 30 * MS, delay_ns=100 * MS, interval_ns=50 * MS)
+    fired = run(repeater, 0, 500 * MS)
+    assert [now for key, now in fired if key == 1] == [(130 + 50 * i) * MS for i in range(8)]
+    assert [now for key, now in fired if key == 0] == [400 * MS, 480 * MS]
+
+
+def test_late_tick_fires_once_and_keeps_the_rate():
+    repeater = Repeater()
+    repeater.start(0, 0)
+    fired = run(repeater, 0, 399 * MS)
+    assert fired == []
+    # The scan stalled from 399 ms to 700 ms: four repeats were due.
+    fired = run(repeater, 700 * MS, 800 * MS)
+    assert [now for _, now in fired] == [700 * MS, 720 * MS, 800 * MS]
+
+
+def test_tick_after_more_than_a_wheel_turn():
+    repeater = Repeater(slots=8)
+    repeater.start(0, 0)
+    fired = run(repeater, 0, 1000 * MS, step=250 * MS)
+    assert [now for _, now in fired] == [500 * MS, 750 * MS, 1000 * MS]
+
+
+def test_stop_empties_the_wheel():
+    repeater = Repeater()
+    repeater.start(0, 0)
+    repeater.start(1, 0)
+    run(repeater, 0, 450 * MS)
+    repeater.stop(0)
+    repeater.stop(1)
+    repeater.stop(2)
+    assert not repeater.active
+    assert repeater.deadlines == {}
+    assert all(bucket == [] for bucket in repeater.wheel)
+    assert run(repeater, 451 * MS, 1000 * MS) == []
+
+
+def test_restarting_a_key_replaces_its_deadline():
+    repeater = Repeater()
+    repeater.start(0, 0)
+    repeater.start(0, 100 * MS)
+    assert sum(len(bucket) for bucket in repeater.wheel) == 1
+    assert [now for _, now in run(repeater, 0, 500 * MS)] == [500 * MS]
+
+
+def test_repeat_action_pulses_release_and_press():
+    device = consumer_device()
+    keymap = Keymap(
+        [[Repeat(Media(0xE9), delay_ns=100 * MS, interval_ns=50 * MS)]],
+        consumer_control=ConsumerControl(device),
+        repeater=Repeater(),
+    )
+    keymap.press(0, 0)
+    for now in range(MS, 200 * MS, MS):
+        keymap.tick(now)
+    keymap.release(0, 200 * MS)
+    assert not keymap.busy
+    held, up = b"\xe9\x00", b"\x00\x00"
+    assert device.reports == [held, up, held, up, held, up]
@@ -0,0 +1,108 @@
+from adafruit_hid.consumer_control import ConsumerControl
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_nkro import KeyboardNKRO
+from adafruit_hid.keycode import Keycode
+from adafruit_hid.mouse import Mouse
+from adafruit_hid.report_cache import ReportCache
+from fakes import consumer_device, keyboard_device, mouse_device
+
+
+def keys(*keycodes):
+    return bytes((0, 0) + keycodes + (0,) * (6 - len(keycodes)))
+
+
+def make_keyboard():
+    device = keyboard_device()
+    cache = ReportCache(device)
+    keyboard = Keyboard(cache)
+    device.reports.clear()
+    return device, cache, keyboard
+
+
+def test_tap_inside_one_batch_sends_press_and_release():
+    device, cache, keyboard = make_keyboard()
+    cache.hold()
+    keyboard.press(Keycode.A)
+    keyboard.release(Keycode.A)
+    cache.flush()
+    assert device.reports == [keys(Keycode.A), keys()]
+
+
+def test_nkro_tap_inside_one_batch_sends_press_and_release():
+    device = keyboard_device()
+    cache = ReportCache(device)
+    keyboard = KeyboardNKRO(cache)
+    device.reports.clear()
+    cache.hold()
+    keyboard.press(Keycode.A)
+    keyboard.release(Keycode.A)
+    cache.flush()
+    assert len(device.reports) == 2
+    assert any(device.reports[0]) and not any(device.reports[1])
+
+
+def test_release_and_press_in_one_batch_become_one_report():
+    device, cache, keyboard = make_keyboard()
+    keyboard.press(Keycode.A)
+    cache.hold()
+    keyboard.release(Keycode.A)
+    keyboard.press(Keycode.B)
+    cache.flush()
+    assert device.reports == [keys(Keycode.A), keys(Keycode.B)]
+
+
+def test_identical_reports_are_suppressed():
+    device, cache, keyboard = make_keyboard()
+    keyboard.press(Keycode.A)
+    keyboard.press(Keycode.A)
+    cache.hold()
+    keyboard.release(Keycode.B)
+    cache.flush()
+    assert device.reports == [keys(Keycode.A)]
+    assert cache.suppressed == 2
+
+
+def test_consumer_tap_inside_one_batch():
+    device = consumer_device()
+    cache = ReportCache(device)
+    cc = ConsumerControl(cache)
+    cache.hold()
+    cc.send(0xCD)
+    cache.flush()
+    assert device.reports == [b"\xcd\x00", b"\x00\x00"]
+
+
+def test_mouse_movement_is_never_suppressed():
+    device = mouse_device()
+    cache = ReportCache(device)
+    mouse = Mouse(cache)
+    device.reports.clear()
+    mouse.move(1, 0)
+    mouse.move(1, 0)
+    cache.hold()
+    mouse.move(0, 2)
+    cache.flush()
+    assert device.reports == [bytes((0, 1, 0, 0))] * 2 + [bytes((0, 0, 2, 0))]
+    assert cache.suppressed == 0
+
+
+def test_mouse_buttons_are_deduplicated():
+    device = mouse_device()
+    cache = ReportCache(device)
+    mouse = Mouse(cache)
+    device.reports.clear()
+    mouse.press(Mouse.LEFT_BUTTON)
+    mouse.move(3, 0)
+    mouse.press(Mouse.LEFT_BUTTON)
+    assert device.reports == [bytes((1, 0, 0, 0)), bytes((1, 3, 0, 0))]
+    assert cache.suppressed == 1
+
+
+def test_counters():
+    device, cache, keyboard = make_keyboard()
+    for _ in range(3):
+        keyboard.press(Keycode.A)
+        keyboard.release(Keycode.A)
+    keyboard.release_all()
+    assert cache.sent == len(device.reports) == 6
+    assert cache.suppressed == 1
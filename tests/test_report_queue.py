@@ -0,0 +1,177 @@
+import asyncio
+
+import pytest
+
+from adafruit_hid.consumer_control import ConsumerControl
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+from adafruit_hid.mouse import Mouse
+from adafruit_hid.report_queue import ReportQueue
+from fakes import FakeDevice, consumer_device, keyboard_device, mouse_device, typed_text
+from runtime import Runtime
+
+PLAY = b"\xcd\x00"
+UP = b"\x00\x00"
+
+
+class BusyDevice(FakeDevice):
+    """Consumer device that refuses the next ``busy`` reports, as USB does
+    while the host is not polling."""
+
+    def __init__(self, busy):
+        super().__init__(0x0C, 0x01)
+        self.busy = busy
+
+    def send_report(self, report, report_id=None):
+        if self.busy:
+            self.busy -= 1
+            raise OSError("USB busy")
+        super().send_report(report, report_id)
+
+
+def drain(queue):
+    while queue.send_next():
+        pass
+
+
+def tap(cc, times):
+    for _ in range(times):
+        cc.press(0xCD)
+        cc.release(0xCD)
+
+
+def test_double_tap_is_kept_while_the_queue_has_room():
+    device = consumer_device()
+    queue = ReportQueue(device)
+    tap(ConsumerControl(queue), 2)
+    drain(queue)
+    assert device.reports == [PLAY, UP, PLAY, UP]
+    assert queue.dropped == 0
+
+
+def test_repeated_presses_are_dropped_once_the_queue_is_full():
+    device = consumer_device()
+    queue = ReportQueue(device, size=4)
+    tap(ConsumerControl(queue), 10)
+    assert len(queue) == 4
+    drain(queue)
+    assert device.reports == [PLAY, UP, PLAY, UP]
+    assert queue.dropped == 16
+    assert queue.overflowed == 0
+
+
+def test_mouse_movement_coalesces():
+    device = mouse_device()
+    queue = ReportQueue(device)
+    mouse = Mouse(queue)
+    for _ in range(5):
+        mouse.move(3, -2)
+    drain(queue)
+    assert device.reports == [bytes((0, 15, 0xF6, 0))]
+    assert queue.coalesced == 4
+
+
+def test_a_stalled_host_loses_no_keystrokes():
+    device = keyboard_device()
+    queue = ReportQueue(device)
+    layout = KeyboardLayoutUS(Keyboard(queue))
+    device.reports.clear()
+    text = "hello world, this is a macro"
+    layout.write(text)
+    assert queue.full
+    drain(queue)
+    assert typed_text(device.reports, layout, text) == text
+    assert device.reports[-1] == bytes(8)
+    assert queue.dropped == 0
+    assert queue.overflowed == len(device.reports) - queue.size
+
+
+def test_a_full_queue_keeps_every_consumer_tap():
+    device = consumer_device()
+    queue = ReportQueue(device, size=4)
+    cc = ConsumerControl(queue)
+    codes = (0xB5, 0xB6, 0xCD, 0xE9, 0xEA)
+    for code in codes:
+        cc.press(code)
+        cc.release(code)
+    drain(queue)
+    assert device.reports == [report for code in codes for report in (bytes((code, 0)), UP)]
+    assert queue.dropped == 0
+
+
+def test_send_report_says_when_the_queue_is_full():
+    queue = ReportQueue(consumer_device(), size=2)
+    assert queue.send_report(PLAY)
+    assert not queue.send_report(UP)
+    assert queue.full
+    queue.send_next()
+    assert not queue.full
+
+
+def test_failed_send_keeps_the_report_queued():
+    device = BusyDevice(busy=2)
+    queue = ReportQueue(device)
+    tap(ConsumerControl(queue), 1)
+    for _ in range(2):
+        with pytest.raises(OSError):
+            queue.send_next()
+    assert queue.failed == 2
+    assert len(queue) == 2
+    drain(queue)
+    assert device.reports == [PLAY, UP]
+    assert queue.sent == 2
+
+
+def test_report_task_reports_errors_and_retries():
+    device = BusyDevice(busy=3)
+    queue = ReportQueue(device)
+    cc = ConsumerControl(queue)
+    runtime = Runtime(None, None, lambda text: None, report_queues=(queue,))
+
+    async def run():
+        task = asyncio.create_task(runtime.report_task())
+        tap(cc, 1)
+        runtime._reports_queued.set()
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+    asyncio.run(run())
+    assert runtime.ui.get_nowait() == "ERROR"
+    assert queue.failed == 3
+    assert device.reports == [PLAY, UP]
+    assert len(queue) == 0
+
+
+class RecordingKeymap:
+    busy = False
+
+    def __init__(self):
+        self.pressed = []
+
+    def press(self, key, now):
+        self.pressed.append(key)
+
+    def release(self, key, now):
+        return None
+
+
+def test_keymap_waits_while_a_report_queue_is_full():
+    device = BusyDevice(busy=1000)
+    queue = ReportQueue(device, size=2)
+    tap(ConsumerControl(queue), 1)
+    keymap = RecordingKeymap()
+    runtime = Runtime(None, keymap, lambda text: None, report_queues=(queue,))
+
+    async def run():
+        tasks = [asyncio.create_task(runtime.hid_task()), asyncio.create_task(runtime.report_task())]
+        runtime.hid.put_nowait((3, True, 0))
+        await asyncio.sleep(0.05)
+        assert keymap.pressed == []
+        device.busy = 0
+        await asyncio.sleep(0.05)
+        for task in tasks:
+            task.cancel()
+
+    asyncio.run(run())
+    assert keymap.pressed == [3]
+    assert device.reports == [PLAY, UP]
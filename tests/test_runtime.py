@@ -0,0 +1,56 @@
+import asyncio
+
+from runtime import BoundedQueue, Runtime
+
+
+def test_bounded_queue_is_fifo_and_refuses_when_full():
+    queue = BoundedQueue(2)
+    assert queue.put_nowait(1)
+    assert queue.put_nowait(2)
+    assert not queue.put_nowait(3)
+    assert len(queue) == 2
+    assert queue.get_nowait() == 1
+    assert queue.get_nowait() == 2
+    assert queue.get_nowait() is None
+
+
+def test_drop_oldest_queue_keeps_the_latest():
+    queue = BoundedQueue(1, drop_oldest=True)
+    assert queue.put_nowait("PLAY")
+    assert queue.put_nowait("NEXT")
+    assert queue.dropped == 1
+    assert queue.get_nowait() == "NEXT"
+
+
+class FailingTick:
+    """Keymap whose tick raises, as a broken macro or mouse curve would."""
+
+    busy = True
+
+    def __init__(self):
+        self.pressed = []
+
+    def tick(self, now):
+        raise RuntimeError("tick failed")
+
+    def press(self, key, now):
+        self.pressed.append(key)
+
+    def release(self, key, now):
+        return None
+
+
+def test_tick_error_is_reported_and_the_hid_task_keeps_running():
+    keymap = FailingTick()
+    runtime = Runtime(None, keymap, lambda text: None)
+
+    async def run():
+        task = asyncio.create_task(runtime.hid_task())
+        await asyncio.sleep(0.01)
+        runtime.hid.put_nowait((3, True, 0))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+    asyncio.run(run())
+    assert runtime.ui.get_nowait() == "ERROR"
+    assert keymap.pressed == [3]
@@ -0,0 +1,37 @@
+from scanner import ButtonBank, FakePin, Scanner, bits
+
+
+def make_scanner(count=5):
+    pins = [FakePin() for _ in range(count)]
+    return pins, Scanner(ButtonBank(pins))
+
+
+def test_bits():
+    assert list(bits(0)) == []
+    assert list(bits(0b100101)) == [0, 2, 5]
+
+
+def test_sample_is_one_bit_per_pin():
+    pins, scanner = make_scanner()
+    pins[0].value = pins[3].value = True
+    assert scanner.source.sample() == 0b01001
+
+
+def test_edge_reported_on_first_scan():
+    pins, scanner = make_scanner()
+    assert scanner.scan(0) == (0, 0)
+    pins[2].value = True
+    assert scanner.scan(1_000_000) == (0b100, 0)
+    assert scanner.scan(2_000_000) == (0, 0)
+
+
+def test_bounce_inside_lockout_is_ignored():
+    pins, scanner = make_scanner()
+    pins[1].value = True
+    assert scanner.scan(0) == (0b10, 0)
+    pins[1].value = False
+    assert scanner.scan(10_000_000) == (0, 0)
+    pins[1].value = True
+    assert scanner.scan(20_000_000) == (0, 0)
+    pins[1].value = False
+    assert scanner.scan(60_000_000) == (0, 0b10)
@@ -0,0 +1,147 @@
+"""Convert a BDF or PCF font to the MKF format read by adafruit_bitmap_font.mkf.
+
+Runs on the host with CPython, using the library's own BDF and PCF loaders so
+the glyphs come out exactly as the board would load them:
+
+    python3 tools/mkfont.py fonts/terminal.bdf fonts/terminal.mkf
+"""
+
+import argparse
+import os
+import struct
+import sys
+import types
+from collections import namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lib"))
+
+
+class Bitmap:
+    """Just enough of displayio.Bitmap for the loaders to draw into."""
+
+    def __init__(self, width, height, value_count):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(width * height)
+
+    def __getitem__(self, index):
+        return self.pixels[index]
+
+    def __setitem__(self, index, value):
+        self.pixels[index] = value
+
+
+def install_host_modules():
+    """Provide the CircuitPython built-ins the font loaders import, if missing."""
+    try:
+        import fontio  # noqa: F401
+    except ImportError:
+        fontio = types.ModuleType("fontio")
+        fontio.Glyph = namedtuple(
+            "Glyph", ("bitmap", "tile_index", "width", "height", "dx", "dy", "shift_x", "shift_y")
+        )
+        sys.modules["fontio"] = fontio
+    try:
+        import displayio  # noqa: F401
+    except ImportError:
+        displayio = types.ModuleType("displayio")
+        displayio.Bitmap = Bitmap
+        sys.modules["displayio"] = displayio
+    try:
+        import micropython  # noqa: F401
+    except ImportError:
+        micropython = types.ModuleType("micropython")
+        micropython.const = lambda value: value
+        sys.modules["micropython"] = micropython
+
+
+def load(path):
+    """Return the font at ``path`` and every glyph in it, by code point."""
+    from adafruit_bitmap_font import bdf, pcf
+
+    f = open(path, "rb")
+    if path.endswith("bdf"):
+        font = bdf.BDF(f, Bitmap)
+        f.seek(0)
+        code_points = [int(line.split()[1]) for line in f if line.startswith(b"ENCODING")]
+        code_points = [c for c in code_points if c >= 0]
+    elif path.endswith("pcf"):
+        font = pcf.PCF(f, Bitmap)
+        # PCF encodings are two bytes.
+        code_points = range(0x10000)
+    else:
+        raise ValueError("Expected a .bdf or .pcf font: %s" % path)
+    font.load_glyphs(code_points)
+    glyphs = {}
+    for code_point in code_points:
+        glyph = font._glyphs.get(code_point)
+        if glyph is not None:
+            glyphs[code_point] = glyph
+    return font, glyphs
+
+
+def pack_rows(glyph):
+    """Return the glyph's pixels as rows of bits, most significant bit first."""
+    bitmap = glyph.bitmap
+    row_bytes = (glyph.width + 7) // 8
+    data = bytearray(row_bytes * glyph.height)
+    for y in range(glyph.height):
+        for x in range(glyph.width):
+            if bitmap[y * glyph.width + x]:
+                data[y * row_bytes + x // 8] |= 128 >> (x % 8)
+    return data
+
+
+def convert(source, destination):
+    from adafruit_bitmap_font.mkf import HEADER_FORMAT, MAGIC, METRICS_FORMAT
+
+    font, glyphs = load(source)
+    code_points = sorted(glyphs)
+    width, height, x_offset, y_offset = font.get_bounding_box()
+    metrics = bytearray()
+    bitmaps = bytearray()
+    for code_point in code_points:
+        glyph = glyphs[code_point]
+        metrics += struct.pack(
+            METRICS_FORMAT,
+            glyph.width,
+            glyph.height,
+            glyph.dx,
+            glyph.dy,
+            glyph.shift_x,
+            glyph.shift_y,
+            len(bitmaps),
+        )
+        bitmaps += pack_rows(glyph)
+    with open(destination, "wb") as out:
+        out.write(
+            struct.pack(
+                HEADER_FORMAT,
+                MAGIC,
+                len(code_points),
+                width,
+                height,
+                x_offset,
+                y_offset,
+                font.ascent or 0,
+                font.descent or 0,
+            )
+        )
+        out.write(struct.pack("<%dI" % len(code_points), *code_points))
+        out.write(metrics)
+        out.write(bitmaps)
+    return len(code_points)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", help="BDF or PCF font")
+    parser.add_argument("destination", help="MKF file to write")
+    args = parser.parse_args()
+    install_host_modules()
+    count = convert(args.source, args.destination)
+    print("%s: %d glyphs, %d bytes" % (args.destination, count, os.path.getsize(args.destination)))
+
+
+if __name__ == "__main__":
+    main()